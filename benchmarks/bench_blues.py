@@ -0,0 +1,21 @@
+"""Benchmarks for TwelveBarBlues."""
+
+from guitarra.blues import TwelveBarBlues
+from guitarra.progressions import FORMS, format_chart, get_form
+
+BLUES = TwelveBarBlues("A")
+MAJOR = BLUES.get_major_progression()
+MINOR = BLUES.get_minor_progression()
+MINOR_DEGREES = get_form("minor").degrees
+
+CASES = {
+    "TwelveBarBlues construction": lambda: TwelveBarBlues("Bb"),
+    "get_major_progression": BLUES.get_major_progression,
+    "get_minor_progression": BLUES.get_minor_progression,
+    "format_progression (uncached)": lambda: format_chart(MAJOR, None, "plain"),
+    "format_progression degrees (uncached)": lambda: format_chart(
+        MINOR, MINOR_DEGREES, "plain"
+    ),
+    "format_progression (cached)": lambda: BLUES.format_progression(MAJOR),
+    "every form in every key": lambda: [get_form(name).in_all_keys() for name in FORMS],
+}
@@ -0,0 +1,34 @@
+"""Benchmarks for user catalogs: compiling TOML against the compiled cache.
+
+The catalog holds 600 scales, 100 tunings and 100 forms, the size of a shop
+catalog of exotic scales and alternate tunings.
+"""
+
+import tempfile
+from pathlib import Path
+
+from guitarra.catalog import CACHE_FILE, compile_catalog, load_catalog
+
+DIRECTORY = Path(tempfile.mkdtemp())
+CACHE = DIRECTORY / "cache" / CACHE_FILE
+
+SOURCE = DIRECTORY / "shop.toml"
+SOURCE.write_text(
+    "[scales]\n"
+    + "".join(
+        f"scale_{i} = [0, {1 + i % 2}, {3 + i % 2}, 5, 7, {8 + i % 3}]\n"
+        for i in range(600)
+    )
+    + "[tunings]\n"
+    + "".join(f'tuning_{i} = ["D", "A", "D", "G", "B", "E"]\n' for i in range(100))
+    + "[forms]\n"
+    + "".join(f'form_{i} = "I7 | IV7 | I7 | V7 IV7"\n' for i in range(100))
+)
+load_catalog(DIRECTORY, CACHE)
+
+CASES = {
+    "load 800 entries (compiled cache)": lambda: load_catalog(DIRECTORY, CACHE),
+    "compile 800 entries (TOML)": lambda: compile_catalog(
+        [(SOURCE.name, SOURCE.read_bytes())]
+    ),
+}
@@ -0,0 +1,14 @@
+"""Benchmarks for tab completion and in-process CLI invocation."""
+
+from typer.testing import CliRunner
+
+from guitarra.cli import app, complete_root_note, complete_scale_name
+
+RUNNER = CliRunner()
+
+CASES = {
+    "complete_root_note": lambda: complete_root_note("A"),
+    "complete_scale_name": lambda: complete_scale_name("m"),
+    "CliRunner scale C major": lambda: RUNNER.invoke(app, ["scale", "C", "major"]),
+    "CliRunner blues A --minor": lambda: RUNNER.invoke(app, ["blues", "A", "-m"]),
+}
@@ -0,0 +1,25 @@
+"""Benchmarks for the scale fingering generator."""
+
+from guitarra.fingerings import SYSTEMS, find_fingerings, scale_fingerings
+from guitarra.scales import GuitarFretboard, Scale
+
+STANDARD = tuple(GuitarFretboard.STANDARD_TUNING)
+MAJOR = Scale.SCALE_MASKS["major"]
+ALL_KEYS = [Scale(root, "major") for root in Scale.CHROMATIC]
+
+CASES = {
+    **{
+        f"find_fingerings major {system} (uncached)": (
+            lambda system=system: find_fingerings(MAJOR, STANDARD, system)
+        )
+        for system in SYSTEMS
+    },
+    "every scale, every system (uncached)": lambda: [
+        find_fingerings(mask, STANDARD, system)
+        for mask in Scale.SCALE_MASKS.values()
+        for system in SYSTEMS
+    ],
+    "scale_fingerings 3nps in 12 keys (cached)": lambda: [
+        scale_fingerings(scale, "3nps") for scale in ALL_KEYS
+    ],
+}
@@ -0,0 +1,11 @@
+"""Benchmarks for the reverse scale-identification index."""
+
+from guitarra.identify import identify_mask, identify_scales, notes_to_mask
+
+DOMINANT_SEVENTH = notes_to_mask(["C", "E", "G", "Bb"])
+
+CASES = {
+    "identify_mask (cached)": lambda: identify_mask(DOMINANT_SEVENTH, 0),
+    "identify_mask (uncached)": lambda: identify_mask.__wrapped__(DOMINANT_SEVENTH, 0),
+    "identify_scales (note names)": lambda: identify_scales(["C", "E", "G", "Bb"]),
+}
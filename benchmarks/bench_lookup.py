@@ -0,0 +1,24 @@
+"""Benchmarks for name lookup: completion, typo-tolerant and note resolution."""
+
+from guitarra.lookup import NameIndex
+from guitarra.pitch import NOTE_NAMES, find_note
+from guitarra.scales import Scale
+
+SCALES = Scale.name_index()
+
+# A catalog of 1300 names, as with hundreds of user-defined scales
+LARGE = NameIndex(
+    f"{name}_{variant}" for name in Scale.SCALE_PATTERNS for variant in range(100)
+)
+
+CASES = {
+    "resolve exact": lambda: SCALES.resolve("mixolydian"),
+    "resolve alias": lambda: SCALES.resolve("Natural Minor"),
+    "resolve typo": lambda: SCALES.resolve("mixolidian"),
+    "complete 'm'": lambda: SCALES.complete("m"),
+    "resolve typo (1300 names)": lambda: LARGE.resolve("mixolidian_42"),
+    "complete (1300 names)": lambda: LARGE.complete("harmonic_minor_4"),
+    "build index (1300 names)": lambda: NameIndex(LARGE.names),
+    "resolve 17 note spellings": lambda: [find_note(name) for name in NOTE_NAMES],
+    "resolve note in words": lambda: find_note("B flat"),
+}
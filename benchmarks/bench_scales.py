@@ -0,0 +1,38 @@
+"""Benchmarks for Scale and GuitarFretboard, in every output format."""
+
+from guitarra.scales import GuitarFretboard, Scale
+
+FRETBOARD = GuitarFretboard()
+EIGHT_STRING = GuitarFretboard("eight_string")
+C_MAJOR = Scale("C", "major")
+A_BLUES = Scale("A", "blues")
+
+CASES = {
+    "Scale construction": lambda: Scale("Bb", "mixolydian"),
+    "Scale.get_scale_notes": C_MAJOR.get_scale_notes,
+    "display_scale 0-12 (uncached)": lambda: FRETBOARD._render_scale(
+        C_MAJOR, 0, 12, False, True
+    ),
+    "display_scale 0-24 (uncached)": lambda: FRETBOARD._render_scale(
+        C_MAJOR, 0, 24, False, True
+    ),
+    "display_scale 5-9 degrees (uncached)": lambda: FRETBOARD._render_scale(
+        A_BLUES, 5, 9, True, True
+    ),
+    "display_scale 0-12 no color (uncached)": lambda: FRETBOARD._render_scale(
+        A_BLUES, 0, 12, False, False
+    ),
+    "display_scale 0-12 (cached)": lambda: FRETBOARD.display_scale(C_MAJOR, 0, 12),
+    "display_scale 0-36 8 strings (uncached)": lambda: EIGHT_STRING._render_scale(
+        C_MAJOR, 0, 36, False, True
+    ),
+    "GuitarFretboard 7 strings, capo": lambda: GuitarFretboard("seven_string", capo=2),
+    **{
+        f"display_scale 0-12 {output_format} (uncached)": (
+            lambda output_format=output_format: FRETBOARD._render_scale(
+                C_MAJOR, 0, 12, False, True, output_format
+            )
+        )
+        for output_format in ("json", "svg", "html")
+    },
+}
@@ -0,0 +1,63 @@
+"""Cold-start benchmarks for the CLI and the library imports.
+
+Each case runs in a fresh interpreter, so the timings include Python startup
+and module imports. The completion cases compare one Tab press through
+Typer's completion (which starts the CLI) with the generated bash script.
+"""
+
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from typer.main import get_command
+
+from guitarra.cli import app
+from guitarra.completion import generate_script
+
+BASH_SCRIPT = Path(tempfile.mkdtemp()) / "guitar.bash"
+BASH_SCRIPT.write_text(generate_script(get_command(app), "bash"))
+
+COMMANDS = {
+    "python startup (baseline)": [sys.executable, "-c", "pass"],
+    "import guitarra.scales/blues": [
+        sys.executable,
+        "-c",
+        "import guitarra.scales, guitarra.blues",
+    ],
+    "guitar --help": [sys.executable, "-m", "guitarra.cli", "--help"],
+    "guitar scale C major": [
+        sys.executable,
+        "-m",
+        "guitarra.cli",
+        "scale",
+        "C",
+        "major",
+    ],
+    "complete scale name (typer)": [
+        "env",
+        "_GUITAR_COMPLETE=complete_bash",
+        "COMP_WORDS=guitar scale C m",
+        "COMP_CWORD=3",
+        sys.executable,
+        "-c",
+        "from guitarra.cli import app; app(prog_name='guitar')",
+    ],
+    "complete scale name (static bash)": [
+        "bash",
+        "--norc",
+        "-c",
+        f"source {BASH_SCRIPT}; COMP_WORDS=(guitar scale C m); COMP_CWORD=3; _guitar",
+    ],
+}
+
+
+def run_command(command: list[str]) -> None:
+    """Run a command to completion, discarding its output."""
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+
+CASES = {
+    name: (lambda command=command: run_command(command))
+    for name, command in COMMANDS.items()
+}
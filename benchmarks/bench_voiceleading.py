@@ -0,0 +1,25 @@
+"""Benchmarks for the voice-leading optimizer, by bar and candidate count."""
+
+from guitarra.progressions import get_form
+from guitarra.voiceleading import lead_voices
+from guitarra.voicings import find_voicings, parse_chord
+
+# Chords of the jazz blues in A, one entry per chord (15 per chorus)
+CHORUS = [chord for bar in get_form("jazz").in_key(9) for chord in bar.split()]
+
+# Ranked voicings of every chord, searched once outside the timed cases
+VOICINGS = {chord: find_voicings(*parse_chord(chord)) for chord in set(CHORUS)}
+
+
+def _case(choruses: int, candidates: int):
+    """Voice ``choruses`` jazz blues choruses with ``candidates`` per chord."""
+    chords = CHORUS * choruses
+    options = {chord: VOICINGS[chord][:candidates] for chord in VOICINGS}
+    return lambda: lead_voices(chords, options)
+
+
+CASES = {
+    f"{choruses * 12} bars x {candidates} candidates": _case(choruses, candidates)
+    for choruses in (1, 10, 40)
+    for candidates in (10, 20, 40)
+}
@@ -0,0 +1,18 @@
+"""Benchmarks for the chord-voicing enumerator."""
+
+from guitarra.progressions import get_form
+from guitarra.voicings import chord_voicings, find_voicings, parse_chord
+
+# Distinct chords of the jazz blues in F
+JAZZ_CHORDS = sorted(
+    {chord for bar in get_form("jazz").in_key(5) for chord in bar.split()}
+)
+
+CASES = {
+    "find_voicings A7 (uncached)": lambda: find_voicings(*parse_chord("A7")),
+    "find_voicings C13 (uncached)": lambda: find_voicings(*parse_chord("C13")),
+    "jazz blues chords (uncached)": lambda: [
+        find_voicings(*parse_chord(chord)) for chord in JAZZ_CHORDS
+    ],
+    "chord_voicings A7 (cached)": lambda: chord_voicings("A7"),
+}
@@ -0,0 +1,128 @@
+"""Run the benchmark suite and compare it against a stored baseline.
+
+Each ``bench_*.py`` module in this directory defines ``CASES``, a mapping of
+case name to a zero-argument callable. Every case is timed and the best time
+per call is written to a JSON results file. When a baseline file exists, any
+case slower than the baseline by more than the threshold is reported as a
+regression and the run exits with status 1.
+
+Usage::
+
+    python benchmarks/run.py                      # run and compare
+    python benchmarks/run.py --save-baseline      # store the new baseline
+    python benchmarks/run.py --filter identify --threshold 0.1
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_RESULTS = BENCH_DIR / "results.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+# Allowed slowdown relative to the baseline before a case counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+
+def load_cases(name_filter: str | None = None) -> dict:
+    """Collect benchmark cases from every bench_*.py module."""
+    if str(BENCH_DIR) not in sys.path:
+        sys.path.insert(0, str(BENCH_DIR))
+
+    cases = {}
+    for path in sorted(BENCH_DIR.glob("bench_*.py")):
+        module = importlib.import_module(path.stem)
+        group = path.stem.removeprefix("bench_")
+        for name, func in module.CASES.items():
+            key = f"{group}: {name}"
+            if name_filter is None or name_filter in key:
+                cases[key] = func
+    return cases
+
+
+def time_case(func, repeat: int = 5) -> float:
+    """Get the best time per call in seconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """List the cases that regressed beyond `threshold` against `baseline`."""
+    return [
+        name
+        for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + threshold)
+    ]
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:9.2f} ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:9.2f} us"
+    return f"{seconds * 1e9:9.0f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite and return the process exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", help="Only run cases whose name contains this")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown as a fraction (default: 0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Write the results to the baseline file instead of comparing",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+
+    results = {}
+    for name, func in load_cases(args.filter).items():
+        results[name] = seconds = time_case(func)
+        line = f"{name:48} {format_time(seconds)}"
+        if name in baseline:
+            line += f"  {seconds / baseline[name] - 1:+7.1%}"
+        print(line)
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2) + "\n"
+    args.output.write_text(text)
+    if args.save_baseline:
+        args.baseline.write_text(text)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for name in regressions:
+            print(f"  {name}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
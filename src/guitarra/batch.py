@@ -0,0 +1,33 @@
+"""Streaming batch mode: JSONL requests in, JSONL responses out."""
+
+import json
+from collections.abc import Iterable
+from typing import TextIO
+
+from guitarra.protocol import handle_line
+
+
+def run_batch(lines: Iterable[str], output: TextIO, flush: bool = False) -> int:
+    """Answer one request per input line, writing each response as it is ready.
+
+    Input is consumed lazily line by line, so memory use does not grow with
+    the number of requests. Blank lines are skipped; every other line gets a
+    response, an error for invalid JSON or a bad request.
+
+    Args:
+        lines: Request lines (e.g., sys.stdin)
+        output: Stream to write response lines to
+        flush: Flush the stream after every response
+
+    Returns:
+        Number of requests answered
+    """
+    count = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        output.write(json.dumps(handle_line(line)) + "\n")
+        if flush:
+            output.flush()
+        count += 1
+    return count
@@ -1,17 +1,16 @@
-"""12 bar blues chord progression generator."""
+"""Blues chord progression generator."""
 
+from guitarra.cache import render_cache
+from guitarra.pitch import SHARP_NAMES, parse_root
+from guitarra.progressions import ProgressionForm, format_chart, get_form
+from guitarra.scales import Scale, rotate_mask
 
-class TwelveBarBlues:
-    """Generate 12 bar blues chord progressions."""
-
-    # Major blues progression (I-IV-V)
-    MAJOR_PATTERN = ["I", "I", "I", "I", "IV", "IV", "I", "I", "V", "IV", "I", "I"]
 
-    # Minor blues progression (i-iv-V)
-    MINOR_PATTERN = ["i", "i", "i", "i", "iv", "iv", "i", "i", "V", "iv", "i", "i"]
+class TwelveBarBlues:
+    """Generate blues chord progressions in any form (12 bar by default)."""
 
     # Chromatic note progression
-    CHROMATIC = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+    CHROMATIC = list(SHARP_NAMES)
 
     def __init__(self, root: str):
         """Initialize with root note.
@@ -19,78 +18,87 @@ class TwelveBarBlues:
         Args:
             root: Root note (e.g., 'A', 'C#', 'Bb')
         """
-        self.root = self._normalize_root(root)
-        self.root_index = self._get_root_index()
-
-    def _normalize_root(self, root: str) -> str:
-        """Normalize root note notation."""
-        root = root.upper()
-        # Convert flat notation to sharp
-        flat_to_sharp = {"DB": "C#", "EB": "D#", "GB": "F#", "AB": "G#", "BB": "A#"}
-        return flat_to_sharp.get(root, root)
-
-    def _get_root_index(self) -> int:
-        """Get chromatic index of root note."""
-        try:
-            return self.CHROMATIC.index(self.root)
-        except ValueError:
-            raise ValueError(f"Invalid root note: {self.root}")
-
-    def _get_chord_note(self, interval: int) -> str:
-        """Get note at specified interval from root."""
-        return self.CHROMATIC[(self.root_index + interval) % 12]
+        self.note = parse_root(root)
+        self.root = self.note.name
+        self.root_index = self.note.pitch_class
+
+    def get_scale_mask(self) -> int:
+        """Get the pitch-class set of the blues scale on this root."""
+        return rotate_mask(Scale.SCALE_MASKS["blues"], self.root_index)
+
+    def get_progression(self, form: str | ProgressionForm = "major") -> list[str]:
+        """Get the chords of each bar of a form in this key.
+
+        Args:
+            form: Built-in form name or alias (small typos are corrected), or
+                a compiled form
+        """
+        if isinstance(form, str):
+            form = get_form(form)
+        return form.in_key(self.note)
 
     def get_major_progression(self) -> list[str]:
         """Get major 12 bar blues progression."""
-        chord_mapping = {
-            "I": self.root,  # Root (0 semitones)
-            "IV": self._get_chord_note(5),  # Perfect 4th (5 semitones)
-            "V": self._get_chord_note(7),  # Perfect 5th (7 semitones)
-        }
-        return [chord_mapping[roman] for roman in self.MAJOR_PATTERN]
+        return self.get_progression("major")
 
     def get_minor_progression(self) -> list[str]:
         """Get minor 12 bar blues progression."""
-        chord_mapping = {
-            "i": self.root + "m",  # Root minor
-            "iv": self._get_chord_note(5) + "m",  # 4th minor
-            "V": self._get_chord_note(7),  # 5th major (dominant)
-        }
-        return [chord_mapping[roman] for roman in self.MINOR_PATTERN]
+        return self.get_progression("minor")
+
+    def format_title(
+        self,
+        minor: bool = False,
+        root: str | None = None,
+        form: str | ProgressionForm | None = None,
+    ) -> str:
+        """Format the chart title.
+
+        Args:
+            minor: Title for the minor progression
+            root: Root spelling to show (defaults to the normalized root)
+            form: Form to title instead of the major or minor 12 bar blues
+        """
+        if form is None:
+            form = "minor" if minor else "major"
+        if isinstance(form, str):
+            form = get_form(form)
+        return form.format_title(root or self.root)
 
     def format_progression(
-        self, progression: list[str], show_degrees: bool = False
+        self,
+        progression: list[str],
+        show_degrees: bool = False,
+        form: str | ProgressionForm | None = None,
+        output_format: str = "plain",
+        title: str | None = None,
     ) -> str:
-        """Format progression as a readable chart."""
-        bars = []
+        """Format progression as a readable chart.
+
+        Charts are memoized in the shared render cache.
 
+        Args:
+            progression: Chords of each bar
+            show_degrees: Show Roman numerals under the chords
+            form: Form whose degrees are shown (by default the major or minor
+                12 bar blues, depending on the chords)
+            output_format: Output format (see guitarra.grid.FORMATS)
+            title: Optional title written with the chart
+        """
+        degrees = None
         if show_degrees:
-            # Get the roman numeral pattern for degrees
-            degrees = (
-                self.MINOR_PATTERN
-                if any("m" in chord for chord in progression)
-                else self.MAJOR_PATTERN
-            )
-
-            for i in range(0, 12, 4):
-                # Format chord line
-                chord_line = " | ".join(
-                    f"{chord:>4}" for chord in progression[i : i + 4]
-                )
-                bars.append(f"| {chord_line} |")
-
-                # Format degree line
-                degree_line = " | ".join(
-                    f"{degree:>4}" for degree in degrees[i : i + 4]
-                )
-                bars.append(f"| {degree_line} |")
-
-                # Add separator line except for the last group
-                if i < 8:
-                    bars.append("")
-        else:
-            for i in range(0, 12, 4):
-                bar_line = " | ".join(f"{chord:>4}" for chord in progression[i : i + 4])
-                bars.append(f"| {bar_line} |")
-
-        return "\n".join(bars)
+            degrees = self._resolve_form(form, progression).degrees
+
+        key = ("blues", self.root, tuple(progression), degrees, output_format, title)
+        return render_cache.get_or_render(
+            key, lambda: format_chart(progression, degrees, output_format, title)
+        )
+
+    def _resolve_form(
+        self, form: str | ProgressionForm | None, progression: list[str]
+    ) -> ProgressionForm:
+        """Get a compiled form, inferring major or minor 12 bar blues if unset."""
+        if form is None:
+            form = "minor" if any("m" in chord for chord in progression) else "major"
+        if isinstance(form, str):
+            form = get_form(form)
+        return form
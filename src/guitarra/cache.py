@@ -0,0 +1,124 @@
+"""Bounded in-memory cache for rendered diagrams and charts."""
+
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Protocol
+
+# Default number of renders kept in memory
+DEFAULT_CACHE_SIZE = 256
+
+
+class PersistentStore(Protocol):
+    """Second-level store consulted on memory misses (see guitarra.diskcache)."""
+
+    def get(self, key: str) -> str | None: ...
+
+    def put(self, key: str, value: str) -> None: ...
+
+
+class RenderCache:
+    """Least-recently-used cache of rendered output with hit/miss counters."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (0 disables caching)
+        """
+        if maxsize < 0:
+            raise ValueError("Cache size must be non-negative")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk: PersistentStore | None = None
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._entries)
+
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> str:
+        """Get the cached output for `key`, rendering and storing it on a miss."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+        if self.disk is None:
+            value = render()
+        else:
+            disk_key = repr(key)
+            value = self.disk.get(disk_key)
+            if value is None:
+                value = render()
+                self.disk.put(disk_key, value)
+
+        if self.maxsize:
+            self._entries[key] = value
+            self._evict()
+        return value
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum size, evicting the oldest entries if needed."""
+        if maxsize < 0:
+            raise ValueError("Cache size must be non-negative")
+        self.maxsize = maxsize
+        self._evict()
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits."""
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+def cache_size_from_env() -> int:
+    """Get the cache size from $GUITARRA_RENDER_CACHE_SIZE.
+
+    An invalid or negative value falls back to DEFAULT_CACHE_SIZE with a
+    warning, so a bad setting never breaks importing the renderers.
+    """
+    value = os.environ.get("GUITARRA_RENDER_CACHE_SIZE")
+    if value is None:
+        return DEFAULT_CACHE_SIZE
+    try:
+        size = int(value)
+    except ValueError:
+        size = -1
+    if size < 0:
+        import warnings
+
+        warnings.warn(
+            f"Invalid GUITARRA_RENDER_CACHE_SIZE: {value!r} "
+            f"(using {DEFAULT_CACHE_SIZE})",
+            stacklevel=2,
+        )
+        return DEFAULT_CACHE_SIZE
+    return size
+
+
+# Shared cache used by the fretboard and blues renderers
+render_cache = RenderCache(cache_size_from_env())
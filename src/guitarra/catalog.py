@@ -0,0 +1,344 @@
+"""User catalogs: scales, tunings and progression forms from TOML files.
+
+Every ``*.toml`` file in the catalog directory ($GUITARRA_CATALOG_DIR, or
+``guitarra`` in the user config directory) adds to the built-in catalog::
+
+    [scales]
+    hirajoshi = [0, 2, 3, 7, 8]
+
+    [scales.in_sen]
+    intervals = [0, 1, 5, 7, 10]
+    aliases = ["insen"]
+
+    [tunings]
+    all_fourths = ["E", "A", "D", "G", "C", "F"]
+
+    [forms.minor_swing]
+    title = "Minor Swing in {root}:"
+    degrees = "i6 | iv6 | i6 | V7 | i6 | iv6 | V7 | i6"
+    aliases = ["gypsy"]
+
+A form can also be just its degrees, titled after its name. Entries with the
+name of a built-in replace it, and later files (in name order) replace
+earlier ones.
+
+Catalogs are read on first use, not at import. The compiled catalog (scale
+bitmasks, tunings, and forms checked against the chord grammar) is cached in
+``catalog.json`` in the cache directory ($GUITARRA_CACHE_DIR, or ``guitarra``
+in the user cache directory). The cache is used while every file keeps its
+modification time and size; when only the times changed, a matching content
+hash still reuses it. Otherwise the files are parsed and compiled again.
+The daemon compares the file stamps before each request and loads the
+catalog again when they changed.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from guitarra.lookup import normalize_name
+from guitarra.pitch import find_note
+from guitarra.progressions import parse_form
+
+# Version of the compiled cache layout (older caches are recompiled)
+CACHE_VERSION = 1
+
+# Name of the compiled cache file in the cache directory
+CACHE_FILE = "catalog.json"
+
+
+class Catalog(NamedTuple):
+    """Scales, tunings and forms added by user catalog files."""
+
+    # Scale name to intervals (semitones from the root) and bitmask
+    scales: dict[str, tuple[list[int], int]]
+    scale_aliases: dict[str, str]
+    # Tuning name to open string notes, low to high
+    tunings: dict[str, list[str]]
+    # Form name to chart title and degrees
+    forms: dict[str, tuple[str, str]]
+    form_aliases: dict[str, str]
+
+
+def empty_catalog() -> Catalog:
+    """Get a catalog with no entries."""
+    return Catalog({}, {}, {}, {}, {})
+
+
+def catalog_dir() -> Path:
+    """Get the directory of user catalog files."""
+    directory = os.environ.get("GUITARRA_CATALOG_DIR")
+    if directory:
+        return Path(directory)
+    config = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return Path(config) / "guitarra"
+
+
+def cache_dir() -> Path:
+    """Get the directory of the compiled catalog cache."""
+    directory = os.environ.get("GUITARRA_CACHE_DIR")
+    if directory:
+        return Path(directory)
+    cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache) / "guitarra"
+
+
+def _intervals(source: str, name: str, value) -> list[int]:
+    """Check scale intervals: rising semitones from 0, below 12."""
+    if (
+        not isinstance(value, list)
+        or not value
+        or not all(type(step) is int for step in value)
+        or value[0] != 0
+        or value[-1] > 11
+        or any(b <= a for a, b in zip(value, value[1:]))
+    ):
+        raise ValueError(
+            f"{source}: scale {name} needs rising semitones from 0 to 11, got {value!r}"
+        )
+    return value
+
+
+def _aliases(source: str, kind: str, name: str, entry: dict) -> list[str]:
+    """Get the aliases of a table entry."""
+    aliases = entry.get("aliases", [])
+    if not isinstance(aliases, list) or not all(isinstance(a, str) for a in aliases):
+        raise ValueError(f"{source}: aliases of {kind} {name} must be strings")
+    return aliases
+
+
+def _section(source: str, data: dict, kind: str) -> dict:
+    """Get a table of a catalog file, empty if it is missing."""
+    section = data.get(kind, {})
+    if not isinstance(section, dict):
+        raise ValueError(f"{source}: [{kind}] must be a table")
+    return section
+
+
+def compile_catalog(sources: list[tuple[str, bytes]]) -> Catalog:
+    """Parse and check catalog files.
+
+    Args:
+        sources: File name and content of each catalog file, in load order
+
+    Raises:
+        ValueError: If a file is not valid TOML or has an invalid entry
+    """
+    import tomllib
+
+    catalog = empty_catalog()
+    for source, content in sources:
+        try:
+            data = tomllib.loads(content.decode())
+        except (UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
+            raise ValueError(f"Invalid catalog file {source}: {e}")
+
+        for key, entry in _section(source, data, "scales").items():
+            name = normalize_name(key)
+            if isinstance(entry, dict):
+                intervals = _intervals(source, name, entry.get("intervals"))
+                for alias in _aliases(source, "scale", name, entry):
+                    catalog.scale_aliases[alias] = name
+            else:
+                intervals = _intervals(source, name, entry)
+            mask = sum(1 << step for step in intervals)
+            catalog.scales[name] = (intervals, mask)
+
+        for key, notes in _section(source, data, "tunings").items():
+            name = normalize_name(key)
+            if not isinstance(notes, list) or not notes:
+                raise ValueError(f"{source}: tuning {name} needs a list of notes")
+            spelled = []
+            for note in notes:
+                found = find_note(note) if isinstance(note, str) else None
+                if found is None:
+                    raise ValueError(f"{source}: tuning {name}: Invalid note: {note}")
+                spelled.append(found.name)
+            catalog.tunings[name] = spelled
+
+        for key, entry in _section(source, data, "forms").items():
+            name = normalize_name(key)
+            title = name.replace("_", " ").title() + " in {root}:"
+            if isinstance(entry, dict):
+                title = entry.get("title", title)
+                degrees = entry.get("degrees")
+                for alias in _aliases(source, "form", name, entry):
+                    catalog.form_aliases[alias] = name
+            else:
+                degrees = entry
+            if not isinstance(degrees, str) or not isinstance(title, str):
+                raise ValueError(f"{source}: form {name} needs degrees as a string")
+            try:
+                title.format(root="C")
+                parse_form(degrees, name, title)
+            except (IndexError, KeyError, ValueError) as e:
+                raise ValueError(f"{source}: form {name}: {e}")
+            catalog.forms[name] = (title, degrees)
+    return catalog
+
+
+def _read_cache(path: Path) -> dict | None:
+    """Read a compiled catalog, or None if it is missing or unreadable."""
+    try:
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("version") != CACHE_VERSION:
+        return None
+    return cached
+
+
+def _write_cache(path: Path, cached: dict) -> None:
+    """Write a compiled catalog atomically; an unwritable cache is skipped."""
+    import tempfile
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cached, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _from_cache(cached: dict) -> Catalog:
+    """Rebuild a catalog from its JSON form."""
+    entries = cached["catalog"]
+    return Catalog(
+        scales={name: (steps, mask) for name, (steps, mask) in entries[0].items()},
+        scale_aliases=entries[1],
+        tunings=entries[2],
+        forms={name: (title, text) for name, (title, text) in entries[3].items()},
+        form_aliases=entries[4],
+    )
+
+
+def catalog_stamps(directory: Path | None = None) -> list[list]:
+    """Get the name, modification time and size of each catalog file.
+
+    Args:
+        directory: Catalog directory (see catalog_dir)
+    """
+    directory = directory or catalog_dir()
+    try:
+        files = sorted(directory.glob("*.toml"))
+    except OSError:
+        return []
+    stamps = []
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError:
+            # Removed since the directory was listed
+            continue
+        stamps.append([path.name, stat.st_mtime_ns, stat.st_size])
+    return stamps
+
+
+def load_catalog(directory: Path | None = None, cache: Path | None = None) -> Catalog:
+    """Load the user catalog, from the compiled cache when it is current.
+
+    Args:
+        directory: Catalog directory (see catalog_dir)
+        cache: Compiled cache file (``catalog.json`` in cache_dir)
+
+    Raises:
+        ValueError: If a catalog file has to be compiled and is invalid
+    """
+    directory = directory or catalog_dir()
+    stamps = catalog_stamps(directory)
+    if not stamps:
+        return empty_catalog()
+
+    cache = cache or cache_dir() / CACHE_FILE
+    files = [directory / name for name, _, _ in stamps]
+    cached = _read_cache(cache)
+    if cached and cached["directory"] != str(directory.resolve()):
+        cached = None
+    if cached and cached["stamps"] == stamps:
+        return _from_cache(cached)
+
+    import hashlib
+
+    sources = [(path.name, path.read_bytes()) for path in files]
+    digest = hashlib.sha256()
+    for name, content in sources:
+        digest.update(name.encode() + b"\0" + content + b"\0")
+    if cached and cached["hash"] == digest.hexdigest():
+        catalog = _from_cache(cached)
+    else:
+        catalog = compile_catalog(sources)
+
+    _write_cache(
+        cache,
+        {
+            "version": CACHE_VERSION,
+            "directory": str(directory.resolve()),
+            "stamps": stamps,
+            "hash": digest.hexdigest(),
+            "catalog": list(catalog),
+        },
+    )
+    return catalog
+
+
+# Catalog of this process, loaded on first use, and the stamps of its files
+_user_catalog: Catalog | None = None
+_user_stamps: list[list] = []
+
+
+def user_catalog() -> Catalog:
+    """Get the user catalog, loading it on first use."""
+    global _user_catalog, _user_stamps
+    if _user_catalog is None:
+        # Stamped first, so a file changed while loading is seen as changed
+        stamps = catalog_stamps()
+        _user_catalog = load_catalog()
+        _user_stamps = stamps
+    return _user_catalog
+
+
+def reset_catalog() -> None:
+    """Drop the loaded catalog and everything built from it."""
+    global _user_catalog
+    from guitarra.cache import render_cache
+    from guitarra.identify import reset_scale_index
+    from guitarra.progressions import reset_forms
+    from guitarra.protocol import reset_objects
+    from guitarra.scales import GuitarFretboard, Scale
+
+    _user_catalog = None
+    Scale.reset_catalog()
+    GuitarFretboard.reset_catalog()
+    reset_forms()
+    reset_scale_index()
+    reset_objects()
+    render_cache.clear()
+
+
+def refresh_catalog() -> bool:
+    """Drop the loaded catalog if its files changed since it was loaded.
+
+    Long-running processes call this before each request; the new catalog is
+    loaded on next use, so an invalid file is reported by the lookups that
+    need it.
+
+    Returns:
+        Whether the catalog was dropped
+    """
+    if _user_catalog is None or catalog_stamps() == _user_stamps:
+        return False
+    reset_catalog()
+    return True
+
+
+def reload_catalog() -> Catalog:
+    """Drop the loaded catalog and everything built from it, then load it again.
+
+    Scale, tuning and form lookups, the objects reused by the daemon and
+    rendered output pick up the new catalog on next use.
+    """
+    reset_catalog()
+    return user_catalog()
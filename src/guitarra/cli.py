@@ -1,45 +1,77 @@
 """Guitar CLI main command interface."""
 
+from pathlib import Path
 from typing import Annotated
 
-import metronome_rs
 import typer
 
 from guitarra.blues import TwelveBarBlues
-from guitarra.scales import GuitarFretboard, Scale
+from guitarra.client import default_socket_path, send_request
+from guitarra.completion import SHELLS
+from guitarra.diskcache import disk_render_cache
+from guitarra.grid import FORMATS, TEXT_FORMATS
+from guitarra.identify import format_matches, identify_scales, notes_to_mask
+from guitarra.progressions import FORMS, form_names, get_form, parse_form
+from guitarra.scales import (
+    GuitarFretboard,
+    Scale,
+    fret_pages,
+    note_names,
+    validate_fret_range,
+)
+
+CacheDirOption = Annotated[
+    Path | None,
+    typer.Option(
+        "--cache-dir",
+        envvar="GUITARRA_CACHE_DIR",
+        help="Directory for the persistent render cache",
+    ),
+]
+
+FormatOption = Annotated[
+    str | None,
+    typer.Option(
+        "--format",
+        "-o",
+        help="Output format: " + ", ".join(FORMATS),
+        autocompletion=lambda incomplete: [
+            name for name in FORMATS if name.startswith(incomplete)
+        ],
+    ),
+]
+
+TuningOption = Annotated[
+    str | None,
+    typer.Option(
+        "--tuning",
+        "-t",
+        help="Tuning name (e.g., drop_d, seven_string, bass) or notes, low to high",
+        autocompletion=lambda incomplete: GuitarFretboard.tuning_index().complete(
+            incomplete
+        ),
+    ),
+]
 
 
 def complete_scale_name(incomplete: str):
-    """Autocomplete function for scale names."""
-    scale_names = Scale.get_available_scales()
-    return [name for name in scale_names if name.startswith(incomplete.lower())]
+    """Autocomplete function for scale names, matching aliases too."""
+    return Scale.name_index().complete(incomplete)
+
+
+def complete_form_name(incomplete: str):
+    """Autocomplete function for progression forms, matching aliases too."""
+    return form_names().complete(incomplete)
 
 
 def complete_root_note(incomplete: str):
     """Autocomplete function for root notes."""
-    notes = [
-        "C",
-        "C#",
-        "D",
-        "D#",
-        "E",
-        "F",
-        "F#",
-        "G",
-        "G#",
-        "A",
-        "A#",
-        "B",
-        "Db",
-        "Eb",
-        "Gb",
-        "Ab",
-        "Bb",
-    ]
-    return [note for note in notes if note.upper().startswith(incomplete.upper())]
+    return note_names().complete(incomplete)
 
 
 app = typer.Typer(help="Guitar practice CLI tool")
+completion_app = typer.Typer(help="Shell completion scripts with embedded candidates")
+app.add_typer(completion_app, name="completion")
 
 
 @app.command()
@@ -56,26 +88,107 @@ def blues(
     degrees: Annotated[
         bool, typer.Option("--degrees", "-d", help="Show Roman numeral degrees")
     ] = False,
+    form: Annotated[
+        str | None,
+        typer.Option(
+            "--form",
+            "-f",
+            help="Progression form: " + ", ".join(FORMS),
+            autocompletion=complete_form_name,
+        ),
+    ] = None,
+    custom: Annotated[
+        str | None,
+        typer.Option(
+            "--custom",
+            help='Custom form in Roman numerals, bars separated by | ("I7 | IV7 V7")',
+        ),
+    ] = None,
+    voicings: Annotated[
+        bool,
+        typer.Option(
+            "--voicings", help="Choose a voicing per bar with smooth voice leading"
+        ),
+    ] = False,
+    candidates: Annotated[
+        int,
+        typer.Option(
+            "--candidates", min=1, help="Candidate voicings considered per chord"
+        ),
+    ] = 20,
+    output_format: FormatOption = None,
+    cache_dir: CacheDirOption = None,
 ):
     """Generate 12 bar blues chord progression."""
+    form = form or ("minor" if minor else "major")
+    output_format = output_format or "plain"
     try:
-        blues_gen = TwelveBarBlues(root)
+        if voicings and output_format not in TEXT_FORMATS:
+            raise ValueError(
+                f"--voicings is only shown in text formats ({', '.join(TEXT_FORMATS)})"
+            )
 
-        if minor:
-            progression = blues_gen.get_minor_progression()
-            typer.echo(f"12 Bar Blues in {root} minor (i-iv-V):")
+        # Forward to a running daemon when there is one
+        response = send_request(
+            {
+                "op": "blues",
+                "root": root,
+                "minor": minor,
+                "degrees": degrees,
+                "form": form,
+                "custom": custom,
+                "format": output_format,
+            }
+        )
+        if response is not None:
+            if not response["ok"]:
+                raise ValueError(response["error"])
+            title, chart = response["title"], response["output"]
         else:
-            progression = blues_gen.get_major_progression()
-            typer.echo(f"12 Bar Blues in {root} major (I-IV-V):")
+            blues_gen = TwelveBarBlues(root)
+            progression_form = parse_form(custom) if custom else get_form(form)
+            progression = blues_gen.get_progression(progression_form)
+            title = blues_gen.format_title(form=progression_form)
+
+            with disk_render_cache(cache_dir):
+                chart = blues_gen.format_progression(
+                    progression,
+                    show_degrees=degrees,
+                    form=progression_form,
+                    output_format=output_format,
+                    title=None if output_format in TEXT_FORMATS else title,
+                )
+
+        if output_format not in TEXT_FORMATS:
+            # Other formats carry the title themselves
+            typer.echo(chart)
+            return
 
+        typer.echo(title)
         typer.echo()
-        typer.echo(blues_gen.format_progression(progression, show_degrees=degrees))
+        typer.echo(chart)
         typer.echo()
 
+        if voicings:
+            from guitarra.voiceleading import format_voice_leading, voice_progression
+
+            bars = TwelveBarBlues(root).get_progression(
+                parse_form(custom) if custom else get_form(form)
+            )
+            with disk_render_cache(cache_dir):
+                leading = voice_progression(bars, candidates=candidates)
+            typer.echo(format_voice_leading(bars, leading))
+            typer.echo()
+
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
-        typer.echo("Valid notes: C, C#, D, D#, E, F, F#, G, G#, A, A#, B", err=True)
-        typer.echo("You can also use flat notation: Db, Eb, Gb, Ab, Bb", err=True)
+        if str(e).startswith("Unknown form"):
+            typer.echo(f"Valid forms: {', '.join(FORMS)}", err=True)
+        elif str(e).startswith("Unknown output format"):
+            typer.echo(f"Valid formats: {', '.join(FORMATS)}", err=True)
+        elif not str(e).startswith(("No playable", "--voicings")):
+            typer.echo("Valid notes: C, C#, D, D#, E, F, F#, G, G#, A, A#, B", err=True)
+            typer.echo("You can also use flat notation: Db, Eb, Gb, Ab, Bb", err=True)
 
 
 @app.command()
@@ -100,26 +213,148 @@ def scale(
             "--degrees", "-d", help="Show scale degrees instead of note names"
         ),
     ] = False,
+    tuning: TuningOption = None,
+    capo: Annotated[
+        int, typer.Option("--capo", help="Capo fret; frets are counted from it")
+    ] = 0,
+    page_frets: Annotated[
+        int,
+        typer.Option(
+            "--page-frets",
+            help="Frets per text diagram (0 splits only ranges over 24 frets)",
+        ),
+    ] = 0,
+    output_format: FormatOption = None,
+    cache_dir: CacheDirOption = None,
 ):
     """Display guitar scale on fretboard."""
     try:
         # Validate fret range
-        if start < 0 or end < 0:
-            raise ValueError("Fret positions must be non-negative")
-        if start > end:
-            raise ValueError("Start fret must be less than or equal to end fret")
-        if end - start > 24:
-            raise ValueError("Fret range too large (max 24 frets)")
-
-        # Create scale and fretboard
+        validate_fret_range(start, end)
+
+        # Text diagrams of wide ranges are split into pages of frets, each
+        # written as soon as it is rendered
+        if (output_format or "ansi") in TEXT_FORMATS:
+            pages = fret_pages(start, end, page_frets)
+        else:
+            pages = [(start, end)]
+
+        fretboard = guitar_scale = None
+        # One disk cache for every page, flushed once at the end
+        with disk_render_cache(cache_dir):
+            for number, (first, last) in enumerate(pages):
+                # Forward to a running daemon when there is one
+                response = send_request(
+                    {
+                        "op": "scale",
+                        "root": root,
+                        "scale": scale_name,
+                        "start": first,
+                        "end": last,
+                        "degrees": degrees,
+                        "format": output_format,
+                        "tuning": tuning,
+                        "capo": capo,
+                    }
+                )
+                if response is not None:
+                    if not response["ok"]:
+                        raise ValueError(response["error"])
+                    scale_display = response["output"]
+                else:
+                    # Create scale and fretboard once, for every page
+                    if fretboard is None:
+                        guitar_scale = Scale(root, scale_name)
+                        fretboard = GuitarFretboard(tuning, capo)
+
+                    # Display scale
+                    scale_display = fretboard.display_scale(
+                        guitar_scale,
+                        start_fret=first,
+                        end_fret=last,
+                        show_degrees=degrees,
+                        output_format=output_format,
+                    )
+                if number:
+                    typer.echo()
+                typer.echo(scale_display)
+
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        if "Invalid root note" in str(e):
+            typer.echo("Valid notes: C, C#, D, D#, E, F, F#, G, G#, A, A#, B", err=True)
+            typer.echo("You can also use flat notation: Db, Eb, Gb, Ab, Bb", err=True)
+        elif "Unknown scale" in str(e):
+            typer.echo(
+                f"Available scales: {', '.join(Scale.get_available_scales())}", err=True
+            )
+        elif "Unknown tuning" in str(e):
+            typer.echo(
+                f"Available tunings: {', '.join(GuitarFretboard.TUNINGS)}", err=True
+            )
+        elif "Unknown output format" in str(e):
+            typer.echo(f"Valid formats: {', '.join(FORMATS)}", err=True)
+
+
+@app.command()
+def fingering(
+    root: Annotated[
+        str,
+        typer.Argument(
+            help="Root note (e.g., A, C#, Bb)", autocompletion=complete_root_note
+        ),
+    ],
+    scale_name: Annotated[
+        str,
+        typer.Argument(help="Name of the scale", autocompletion=complete_scale_name),
+    ],
+    system: Annotated[
+        str,
+        typer.Option("--system", "-y", help="Fingering system: box, 3nps, caged"),
+    ] = "box",
+    position: Annotated[
+        int,
+        typer.Option("--position", "-p", help="Position to show (0 for all)"),
+    ] = 0,
+    degrees: Annotated[
+        bool,
+        typer.Option(
+            "--degrees", "-d", help="Show scale degrees instead of finger numbers"
+        ),
+    ] = False,
+    tuning: TuningOption = None,
+    output_format: FormatOption = None,
+    cache_dir: CacheDirOption = None,
+):
+    """Show playable fingerings of a scale, lowest on the neck first."""
+    from guitarra.fingerings import format_fingering, scale_fingerings
+
+    try:
         guitar_scale = Scale(root, scale_name)
-        fretboard = GuitarFretboard()
+        fretboard = GuitarFretboard(tuning)
+        with disk_render_cache(cache_dir):
+            fingerings = scale_fingerings(guitar_scale, system, fretboard)
+        if position:
+            if not 1 <= position <= len(fingerings):
+                raise ValueError(
+                    f"No position {position} (this scale has {len(fingerings)})"
+                )
+            fingerings = [fingerings[position - 1]]
 
-        # Display scale
-        scale_display = fretboard.display_scale(
-            guitar_scale, start_fret=start, end_fret=end, show_degrees=degrees
+        # Text diagrams are separated by a blank line, other formats by lines
+        separator = "\n\n" if (output_format or "ansi") in TEXT_FORMATS else "\n"
+        typer.echo(
+            separator.join(
+                format_fingering(
+                    guitar_scale,
+                    shape,
+                    tuning=fretboard.tuning,
+                    show_degrees=degrees,
+                    output_format=output_format,
+                )
+                for shape in fingerings
+            )
         )
-        typer.echo(scale_display)
 
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
@@ -130,11 +365,241 @@ def scale(
             typer.echo(
                 f"Available scales: {', '.join(Scale.get_available_scales())}", err=True
             )
+        elif "Unknown tuning" in str(e):
+            typer.echo(
+                f"Available tunings: {', '.join(GuitarFretboard.TUNINGS)}", err=True
+            )
+        elif "Unknown output format" in str(e):
+            typer.echo(f"Valid formats: {', '.join(FORMATS)}", err=True)
+
+
+@app.command()
+def identify(
+    notes: Annotated[
+        list[str],
+        typer.Argument(
+            help="Notes to look up (e.g., C E G Bb)", autocompletion=complete_root_note
+        ),
+    ],
+    exact: Annotated[
+        bool,
+        typer.Option("--exact", "-x", help="Only show scales with exactly these notes"),
+    ] = False,
+):
+    """Find scales that contain the given notes."""
+    try:
+        matches = identify_scales(notes, exact=exact)
+        query = notes_to_mask(notes)
+
+        if not matches:
+            typer.echo("No matching scales found.")
+            return
+
+        typer.echo(f"Scales containing {' '.join(notes)}:")
+        typer.echo()
+        typer.echo(format_matches(matches, query))
+
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        typer.echo("Valid notes: C, C#, D, D#, E, F, F#, G, G#, A, A#, B", err=True)
+        typer.echo("You can also use flat notation: Db, Eb, Gb, Ab, Bb", err=True)
+
+
+SpanOption = Annotated[
+    int, typer.Option("--span", min=1, help="Frets covered by the fretting hand")
+]
+OpenOption = Annotated[
+    bool, typer.Option("--open/--no-open", help="Allow open strings")
+]
+MaxFretOption = Annotated[int, typer.Option("--max-fret", help="Highest fret searched")]
+
+
+@app.command()
+def chord(
+    symbol: Annotated[
+        str, typer.Argument(help="Chord symbol (e.g., A7, Bbmaj7, F#m7b5)")
+    ],
+    limit: Annotated[
+        int,
+        typer.Option("--limit", "-n", min=0, help="Voicings to show (0 for all)"),
+    ] = 10,
+    span: SpanOption = 4,
+    allow_open: OpenOption = True,
+    max_fret: MaxFretOption = 24,
+    tuning: TuningOption = None,
+    cache_dir: CacheDirOption = None,
+):
+    """Show the playable voicings of a chord, easiest first."""
+    from guitarra.voicings import chord_voicings, format_voicings
+
+    try:
+        fretboard = GuitarFretboard(tuning)
+        with disk_render_cache(cache_dir):
+            voicings = chord_voicings(
+                symbol,
+                fretboard,
+                max_span=span,
+                allow_open=allow_open,
+                max_fret=max_fret,
+            )
+        typer.echo(format_voicings(symbol, voicings, limit))
+
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+
+
+@app.command()
+def voicings(
+    root: Annotated[
+        str,
+        typer.Argument(
+            help="Root note (e.g., A, C#, Bb)", autocompletion=complete_root_note
+        ),
+    ],
+    minor: Annotated[
+        bool, typer.Option("--minor", "-m", help="Use the minor blues progression")
+    ] = False,
+    form: Annotated[
+        str | None,
+        typer.Option(
+            "--form",
+            "-f",
+            help="Progression form: " + ", ".join(FORMS),
+            autocompletion=complete_form_name,
+        ),
+    ] = None,
+    custom: Annotated[
+        str | None,
+        typer.Option("--custom", help="Custom form in Roman numerals"),
+    ] = None,
+    limit: Annotated[
+        int,
+        typer.Option(
+            "--limit", "-n", min=0, help="Voicings to show per chord (0 for all)"
+        ),
+    ] = 3,
+    span: SpanOption = 4,
+    allow_open: OpenOption = True,
+    max_fret: MaxFretOption = 24,
+    tuning: TuningOption = None,
+    cache_dir: CacheDirOption = None,
+):
+    """Show voicings for every chord of a blues progression."""
+    from guitarra.voicings import chord_voicings, format_voicings
+
+    form = form or ("minor" if minor else "major")
+    try:
+        blues_gen = TwelveBarBlues(root)
+        progression_form = parse_form(custom) if custom else get_form(form)
+        progression = blues_gen.get_progression(progression_form)
+        symbols = dict.fromkeys(symbol for bar in progression for symbol in bar.split())
+
+        fretboard = GuitarFretboard(tuning)
+
+        typer.echo(blues_gen.format_title(form=progression_form))
+        with disk_render_cache(cache_dir):
+            for symbol in symbols:
+                voicing_list = chord_voicings(
+                    symbol,
+                    fretboard,
+                    max_span=span,
+                    allow_open=allow_open,
+                    max_fret=max_fret,
+                )
+                typer.echo()
+                typer.echo(format_voicings(symbol, voicing_list, limit))
+
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+
+
+@app.command()
+def export(
+    destination: Annotated[
+        Path, typer.Argument(help="Output directory, or a .zip archive path")
+    ],
+    window: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--window",
+            "-w",
+            help="Fret window to render, e.g. 5-9 (repeatable)",
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", "-j", help="Worker processes (default: CPU count)"),
+    ] = None,
+):
+    """Export every scale in every key, plus all blues charts."""
+    from guitarra.export import export_book, parse_window
+
+    try:
+        windows = [parse_window(w) for w in window] if window else None
+        if workers is not None and workers < 1:
+            raise ValueError("Workers must be at least 1")
+
+        result = export_book(destination, windows=windows, workers=workers)
+        typer.echo(
+            f"Exported {result.count} diagrams to {destination} "
+            f"in {result.seconds:.2f}s ({result.per_second:.0f} diagrams/sec)"
+        )
+
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+
+
+@app.command()
+def batch(
+    flush: Annotated[
+        bool,
+        typer.Option("--flush", help="Flush stdout after every response"),
+    ] = False,
+):
+    """Answer JSONL requests from stdin, one JSON response per line on stdout."""
+    import sys
+
+    from guitarra.batch import run_batch
+
+    run_batch(sys.stdin, sys.stdout, flush=flush or sys.stdout.isatty())
+
+
+@app.command()
+def serve(
+    socket_path: Annotated[
+        Path | None,
+        typer.Option(
+            "--socket",
+            help="Unix socket path (default: $GUITARRA_SOCKET or a per-user socket)",
+        ),
+    ] = None,
+):
+    """Run a warm daemon that answers scale, blues and identify requests."""
+    import asyncio
+
+    from guitarra import server
+
+    path = str(socket_path) if socket_path else default_socket_path()
+    if server.is_serving(path):
+        typer.echo(f"Error: A daemon is already serving on {path}", err=True)
+        return
+    typer.echo(f"Serving on {path}")
+    typer.echo("Press Ctrl+C to stop")
+
+    try:
+        asyncio.run(server.serve(path))
+    except FileExistsError as e:
+        typer.echo(f"Error: {e}", err=True)
+    except KeyboardInterrupt:
+        typer.echo("\nServer stopped.")
 
 
 @app.command()
 def metronome(
-    bpm: Annotated[int, typer.Argument(help="Beats per minute (BPM)")],
+    bpm: Annotated[
+        int | None,
+        typer.Argument(help="Beats per minute (BPM), not needed with --join"),
+    ] = None,
     beats: Annotated[int, typer.Option("--beats", "-b", help="Beats per measure")] = 4,
     duration: Annotated[
         int,
@@ -154,10 +619,58 @@ def metronome(
             "--style", "-st", help="Metronome style: simple, practice, performance"
         ),
     ] = "practice",
+    stats_json: Annotated[
+        bool,
+        typer.Option(
+            "--stats-json", help="Print session timing statistics as JSON on exit"
+        ),
+    ] = False,
+    render: Annotated[
+        Path | None,
+        typer.Option(
+            "--render",
+            help="Write the click track to a WAV file instead of playing it",
+        ),
+    ] = None,
+    pattern: Annotated[
+        str | None,
+        typer.Option(
+            "--pattern",
+            "-p",
+            help="Accent map (X-x-), grouping (2+2+3) or polyrhythm (3:2)",
+        ),
+    ] = None,
+    serve: Annotated[
+        bool,
+        typer.Option("--serve", help="Share this metronome with --join clients"),
+    ] = False,
+    join: Annotated[
+        str | None,
+        typer.Option(
+            "--join", help="Click in sync with a --serve metronome at HOST[:PORT]"
+        ),
+    ] = None,
+    port: Annotated[
+        int | None,
+        typer.Option("--port", help="UDP port for --serve and --join (default 47800)"),
+    ] = None,
+    bind: Annotated[
+        str,
+        typer.Option(
+            "--bind",
+            help="Interface --serve listens on (0.0.0.0 for every interface)",
+        ),
+    ] = "127.0.0.1",
 ):
     """Start a metronome with customizable settings."""
     try:
+        if join is not None:
+            _join_metronome(join, port, duration, stats_json)
+            return
+
         # Validate BPM
+        if bpm is None:
+            raise ValueError("BPM is required")
         if bpm < 30 or bpm > 300:
             raise ValueError("BPM must be between 30 and 300")
 
@@ -165,6 +678,43 @@ def metronome(
         if beats < 1 or beats > 16:
             raise ValueError("Beats per measure must be between 1 and 16")
 
+        if serve:
+            if render is not None:
+                raise ValueError("--serve cannot be combined with --render")
+            _serve_metronome(
+                bpm, beats, subdivisions, pattern, bind, port, duration, stats_json
+            )
+            return
+
+        if pattern is not None:
+            _run_pattern(
+                pattern, bpm, duration, subdivisions, style, render, stats_json
+            )
+            return
+
+        if render is not None:
+            if duration <= 0:
+                raise ValueError("Duration is required when rendering (--duration)")
+
+            from guitarra.clicktrack import render_metronome
+
+            render_metronome(render, bpm, beats, duration, subdivisions, style)
+            typer.echo(
+                f"Rendered {duration}s click track to {render}: "
+                f"{bpm} BPM, {beats}/4 time, {subdivisions} notes"
+            )
+            return
+
+        # Timed playback runs entirely in the audio engine, with no session
+        if duration > 0 and stats_json:
+            raise ValueError(
+                "--stats-json cannot be combined with --duration "
+                "(except with --pattern)"
+            )
+
+        # Imported here so that other commands never load the native audio module
+        import metronome_rs
+
         typer.echo(
             f"Starting metronome: {bpm} BPM, {beats}/4 time, {subdivisions} notes"
         )
@@ -195,40 +745,273 @@ def metronome(
             else:
                 metronome_rs.py_start_practice_metronome(bpm, beats)
 
-            # Keep running until Ctrl+C
-            try:
-                import time
+            # Keep running until Ctrl+C, tracking beat timing
+            from guitarra.session import MetronomeSession
 
-                while True:
-                    time.sleep(0.1)
+            try:
+                stats = MetronomeSession(bpm).run()
             except KeyboardInterrupt:
-                metronome_rs.py_stop_global_metronome()
-                typer.echo("\nMetronome stopped.")
+                stats = None
+            metronome_rs.py_stop_global_metronome()
+            typer.echo("\nMetronome stopped.")
+            if stats is not None:
+                _echo_session_stats(stats, stats_json)
 
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
     except KeyboardInterrupt:
-        metronome_rs.py_stop_global_metronome()
-        typer.echo("\nMetronome stopped.")
+        if render is not None:
+            typer.echo("\nRendering cancelled.")
+        else:
+            import metronome_rs
+
+            metronome_rs.py_stop_global_metronome()
+            typer.echo("\nMetronome stopped.")
+
+
+@app.command()
+def program(
+    path: Annotated[
+        Path,
+        typer.Argument(help="Practice program TOML file", exists=True, dir_okay=False),
+    ],
+    render: Annotated[
+        Path | None,
+        typer.Option(
+            "--render", help="Write the program to a WAV file instead of playing it"
+        ),
+    ] = None,
+    stats_json: Annotated[
+        bool,
+        typer.Option(
+            "--stats-json", help="Print session timing statistics as JSON on exit"
+        ),
+    ] = False,
+):
+    """Play or render a practice program of tempo and subdivision segments."""
+    from guitarra.program import Timeline, load_program, play
+
+    try:
+        segments, style = load_program(path)
+        timeline = Timeline(segments)
+        bars = sum(segment.bars for segment in segments)
+        minutes, seconds = divmod(round(timeline.duration_s), 60)
+        typer.echo(
+            f"Program: {len(segments)} segments, {bars} bars, "
+            f"{len(timeline)} clicks, {minutes}:{seconds:02d}"
+        )
+
+        if render is not None:
+            timeline.render(render, style)
+            typer.echo(f"Rendered program to {render}")
+            return
+
+        typer.echo("Press Ctrl+C to stop")
+        typer.echo()
+        stats = play(timeline, _click_player())
+        typer.echo("\nProgram finished.")
+        _echo_session_stats(stats, stats_json)
+
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+
+
+@completion_app.command("generate")
+def completion_generate(
+    shell: Annotated[
+        str,
+        typer.Argument(
+            help="Shell: " + ", ".join(SHELLS),
+            autocompletion=lambda incomplete: [
+                name for name in SHELLS if name.startswith(incomplete)
+            ],
+        ),
+    ],
+):
+    """Print a completion script that completes without starting Python."""
+    from guitarra.completion import generate_script
+
+    try:
+        typer.echo(generate_script(typer.main.get_command(app), shell), nl=False)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        typer.echo(f"Supported shells: {', '.join(SHELLS)}", err=True)
+
+
+def _run_pattern(
+    spec: str,
+    bpm: int,
+    duration: int,
+    subdivisions: str,
+    style: str,
+    render: Path | None,
+    stats_json: bool,
+) -> None:
+    """Play or render a metronome click pattern."""
+    from guitarra.patterns import compile_pattern
+
+    click_pattern = compile_pattern(spec, subdivisions)
+
+    if render is not None:
+        if duration <= 0:
+            raise ValueError("Duration is required when rendering (--duration)")
+
+        from guitarra.clicktrack import render_pattern
+
+        render_pattern(render, click_pattern, bpm, duration, style)
+        typer.echo(
+            f"Rendered {duration}s click track to {render}: {bpm} BPM, pattern {spec}"
+        )
+        return
+
+    from guitarra.session import MetronomeSession
+
+    typer.echo(f"Starting metronome: {bpm} BPM, pattern {spec}")
+    typer.echo("Press Ctrl+C to stop")
+    typer.echo()
+
+    click = _click_player()
+    stats = MetronomeSession().run(
+        duration=duration or None,
+        schedule=click_pattern.schedule(bpm),
+        on_beat=lambda index: click(click_pattern.level(index)),
+    )
+    typer.echo("\nMetronome stopped.")
+    _echo_session_stats(stats, stats_json)
+
+
+def _serve_metronome(
+    bpm: int,
+    beats: int,
+    subdivisions: str,
+    spec: str | None,
+    host: str,
+    port: int | None,
+    duration: int,
+    stats_json: bool,
+) -> None:
+    """Play a metronome while sharing its timeline with joining clients."""
+    from guitarra import sync
+
+    timeline = {
+        "bpm": bpm,
+        "beats": beats,
+        "subdivisions": subdivisions,
+        "pattern": spec,
+    }
+    # Compile before binding so that a bad pattern fails early
+    sync.timeline_pattern(timeline)
+
+    def on_report(address: tuple, report: dict) -> None:
+        line = (
+            f"{address[0]}:{address[1]}: "
+            f"offset {report.get('offset_ms', 0.0):+.3f} ms, "
+            f"jitter {report.get('jitter_ms', 0.0):.3f} ms"
+        )
+        if "beats" in report:
+            line += (
+                f", {report['beats']} beats ({report.get('missed_beats', 0)} missed)"
+            )
+        typer.echo(line)
+
+    try:
+        server = sync.SyncServer(
+            timeline,
+            host=host,
+            port=port or sync.DEFAULT_SYNC_PORT,
+            on_report=on_report,
+        )
+    except OSError as e:
+        raise ValueError(f"Cannot listen on {host}: {e.strerror or e}")
+    host, server_port = server.address
+    typer.echo(f"Serving metronome on UDP {host}:{server_port}: {bpm} BPM")
+    typer.echo("Press Ctrl+C to stop")
+    typer.echo()
+
+    server.start()
+    try:
+        stats = sync.play_server(server, _click_player(), duration or None)
+    finally:
+        server.close()
+    typer.echo("\nMetronome stopped.")
+    _echo_session_stats(stats, stats_json)
+
+
+def _join_metronome(
+    address: str, port: int | None, duration: int, stats_json: bool
+) -> None:
+    """Click in sync with a served metronome, reporting clock offset and jitter."""
+    from guitarra import sync
+
+    host, server_port = sync.parse_address(address, port or sync.DEFAULT_SYNC_PORT)
+    client = sync.SyncClient(host, server_port)
+    typer.echo(f"Joining metronome at {host}:{server_port}")
+    typer.echo("Press Ctrl+C to stop")
+    typer.echo()
+
+    try:
+        stats = sync.play_synced(
+            client,
+            _click_player(),
+            duration or None,
+            on_estimate=lambda estimate: typer.echo(estimate.format()),
+        )
+    except ConnectionError as e:
+        raise ValueError(str(e))
+    finally:
+        client.close()
+    typer.echo("\nMetronome stopped.")
+    _echo_session_stats(stats, stats_json)
+
+
+# Click output worker, shared by every live click source
+_player = None
+
+
+def _click_player():
+    """Get the click output worker of this process, started on first use."""
+    global _player
+    if _player is None:
+        import metronome_rs
+
+        from guitarra.clicktrack import CLICK_SOUNDS
+        from guitarra.session import ClickPlayer
+
+        _player = ClickPlayer(
+            metronome_rs.py_beep_frequency,
+            {level: frequency for level, (frequency, _) in CLICK_SOUNDS.items()},
+        )
+    return _player
+
+
+def _echo_session_stats(stats, as_json: bool) -> None:
+    """Print metronome session statistics as text or JSON."""
+    if as_json:
+        import json
+
+        typer.echo(json.dumps(stats._asdict()))
+    else:
+        typer.echo(stats.format())
 
 
 def _get_accent_config(subdivisions: str, style: str):
     """Get accent configuration based on subdivisions and style."""
-    if style == "performance":
-        base_config = metronome_rs.PyAccentConfig.strong()
-    elif style == "simple":
-        base_config = metronome_rs.PyAccentConfig.default()
-    else:
-        base_config = metronome_rs.PyAccentConfig.subtle()
+    import metronome_rs
 
+    # Subdivided clicks use the subdivision presets, so the style preset is
+    # only built for plain quarter notes
     if subdivisions == "eighth":
         return metronome_rs.PyAccentConfig.with_eighth_notes()
     elif subdivisions == "sixteenth":
         return metronome_rs.PyAccentConfig.with_sixteenth_notes()
     elif subdivisions == "triplets":
         return metronome_rs.PyAccentConfig.with_triplets()
+    elif style == "performance":
+        return metronome_rs.PyAccentConfig.strong()
+    elif style == "simple":
+        return metronome_rs.PyAccentConfig.default()
     else:
-        return base_config
+        return metronome_rs.PyAccentConfig.subtle()
 
 
 def main():
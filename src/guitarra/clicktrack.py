@@ -0,0 +1,185 @@
+"""Offline click-track rendering to WAV, without an audio device.
+
+Click waveforms are synthesized once per accent level and copied into place
+with array slice assignment. Audio is written in fixed-size chunks, so memory
+use does not depend on the length of the track.
+"""
+
+import math
+import os
+import sys
+import wave
+from array import array
+from collections.abc import Iterable, Iterator
+
+from guitarra.patterns import ClickPattern, standard_pattern
+
+DEFAULT_SAMPLE_RATE = 44100
+
+# Frames synthesized and written per chunk
+DEFAULT_CHUNK_FRAMES = 1 << 16
+
+# Click sounds per accent level: (frequency Hz, duration ms), matching the
+# metronome_rs defaults for accented, regular and subdivision clicks
+CLICK_SOUNDS = {
+    "accent": (880.0, 150),
+    "regular": (440.0, 100),
+    "subdivision": (523.25, 80),
+}
+
+# Click volume per accent level for each style, mirroring _get_accent_config:
+# performance -> strong accents, simple -> no accents, practice -> subtle
+STYLE_VOLUMES = {
+    "performance": {"accent": 1.0, "regular": 0.6, "subdivision": 0.4},
+    "simple": {"accent": 0.7, "regular": 0.7, "subdivision": 0.5},
+    "practice": {"accent": 0.8, "regular": 0.6, "subdivision": 0.4},
+}
+
+
+def synthesize_click(
+    frequency: float,
+    duration_ms: int,
+    volume: float,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+) -> array:
+    """Synthesize one decaying sine click as 16-bit samples."""
+    length = int(sample_rate * duration_ms / 1000)
+    step = 2 * math.pi * frequency / sample_rate
+    decay = 5.0 / length
+    amplitude = 32767 * volume
+    return array(
+        "h",
+        (
+            int(amplitude * math.exp(-i * decay) * math.sin(i * step))
+            for i in range(length)
+        ),
+    )
+
+
+def build_clicks(
+    style: str = "practice", sample_rate: int = DEFAULT_SAMPLE_RATE
+) -> dict[str, array]:
+    """Synthesize the click waveform for each accent level of a style."""
+    volumes = STYLE_VOLUMES.get(style, STYLE_VOLUMES["practice"])
+    return {
+        level: synthesize_click(frequency, duration_ms, volumes[level], sample_rate)
+        for level, (frequency, duration_ms) in CLICK_SOUNDS.items()
+    }
+
+
+def metronome_events(
+    bpm: float,
+    beats_per_measure: int,
+    subdivisions: str,
+    total_frames: int,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+) -> Iterator[tuple[int, str]]:
+    """Generate (frame, accent level) for every click of a steady metronome.
+
+    Frame positions are computed from the click index rather than accumulated,
+    so rounding never drifts over long tracks.
+    """
+    return standard_pattern(beats_per_measure, subdivisions).events(
+        bpm, total_frames, sample_rate
+    )
+
+
+def write_click_track(
+    path: str | os.PathLike[str],
+    events: Iterable[tuple[int, str]],
+    total_frames: int,
+    clicks: dict[str, array],
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+) -> None:
+    """Write clicks at the given frames to a mono 16-bit WAV file.
+
+    Args:
+        path: Output WAV path
+        events: (frame, accent level) pairs in ascending frame order
+        total_frames: Length of the track in frames
+        clicks: Click waveform for each accent level
+        sample_rate: Sample rate in Hz
+        chunk_frames: Frames synthesized and written at a time
+    """
+    events = iter(events)
+    pending = next(events, None)
+    # Clicks that started in an earlier chunk and are still sounding
+    sounding: list[tuple[int, array]] = []
+
+    with wave.open(os.fspath(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+
+        for chunk_start in range(0, total_frames, chunk_frames):
+            chunk_end = min(chunk_start + chunk_frames, total_frames)
+            buffer = array("h", bytes(2 * (chunk_end - chunk_start)))
+
+            starting = []
+            while pending is not None and pending[0] < chunk_end:
+                starting.append((pending[0], clicks[pending[1]]))
+                pending = next(events, None)
+
+            carried = []
+            for start, samples in sounding + starting:
+                low = max(start, chunk_start)
+                high = min(start + len(samples), chunk_end)
+                buffer[low - chunk_start : high - chunk_start] = samples[
+                    low - start : high - start
+                ]
+                if start + len(samples) > chunk_end:
+                    carried.append((start, samples))
+            sounding = carried
+
+            if sys.byteorder == "big":
+                buffer.byteswap()
+            wav.writeframes(buffer.tobytes())
+
+
+def render_pattern(
+    path: str | os.PathLike[str],
+    pattern: ClickPattern,
+    bpm: float,
+    duration_s: float,
+    style: str = "practice",
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+) -> int:
+    """Render a compiled click pattern, repeated for `duration_s`, to a WAV file.
+
+    Returns:
+        Number of frames written
+    """
+    total_frames = int(duration_s * sample_rate)
+    write_click_track(
+        path,
+        pattern.events(bpm, total_frames, sample_rate),
+        total_frames,
+        build_clicks(style, sample_rate),
+        sample_rate,
+    )
+    return total_frames
+
+
+def render_metronome(
+    path: str | os.PathLike[str],
+    bpm: float,
+    beats_per_measure: int,
+    duration_s: float,
+    subdivisions: str = "quarter",
+    style: str = "practice",
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+) -> int:
+    """Render a steady metronome click track to a WAV file.
+
+    Returns:
+        Number of frames written
+    """
+    return render_pattern(
+        path,
+        standard_pattern(beats_per_measure, subdivisions),
+        bpm,
+        duration_s,
+        style,
+        sample_rate,
+    )
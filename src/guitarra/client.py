@@ -0,0 +1,57 @@
+"""Client for the warm ``guitar serve`` daemon.
+
+Kept free of asyncio and typer, and socket is only imported once a daemon
+socket exists, so checking for the daemon costs almost nothing on top of
+interpreter startup.
+"""
+
+import json
+import os
+
+# Seconds to wait for the daemon before falling back to local rendering
+DEFAULT_TIMEOUT = 2.0
+
+
+def default_socket_path() -> str:
+    """Get the daemon socket path.
+
+    Uses GUITARRA_SOCKET if set, otherwise a per-user socket in the runtime
+    directory (or the temporary directory when XDG_RUNTIME_DIR is unset).
+    """
+    path = os.environ.get("GUITARRA_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "guitarra.sock")
+    import tempfile
+
+    return os.path.join(tempfile.gettempdir(), f"guitarra-{os.getuid()}.sock")
+
+
+def send_request(
+    request: dict, path: str | None = None, timeout: float = DEFAULT_TIMEOUT
+) -> dict | None:
+    """Send one request to the daemon and wait for its response.
+
+    Returns:
+        The response, or None if no daemon is listening on `path`
+    """
+    path = path or default_socket_path()
+    if not os.path.exists(path):
+        return None
+    import socket
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+    except OSError:
+        return None
+
+    if not line:
+        return None
+    return json.loads(line)
@@ -0,0 +1,510 @@
+"""Static shell completion scripts.
+
+Typer's completion runs ``guitar`` on every Tab press, so each keystroke pays
+for Python startup and the CLI imports. Almost every candidate comes from a
+fixed table (notes, scale names, forms, formats...), so ``guitar completion
+generate SHELL`` writes a native bash, zsh or fish script with the command
+tree and those tables embedded, and completing never starts Python.
+Parameters with a completion function but no table still ask the CLI through
+Typer's completion protocol.
+
+The command tree is read from the Click command behind the Typer app, so the
+scripts follow the CLI without a second list of commands and options.
+"""
+
+from typing import NamedTuple
+
+SHELLS = ("bash", "zsh", "fish")
+
+PROG_NAME = "guitar"
+
+# Candidate table of each parameter, by parameter name
+PARAMETER_TABLES = {
+    "root": "notes",
+    "notes": "notes",
+    "scale_name": "scales",
+    "tuning": "tunings",
+    "form": "forms",
+    "output_format": "formats",
+    "system": "systems",
+    "subdivisions": "subdivisions",
+    "style": "styles",
+    "shell": "shells",
+}
+
+HELP_OPTION = "Show this message and exit."
+
+# Value kinds besides the candidate tables (a flag takes no value: None)
+FREE, FILE, DIRECTORY, DYNAMIC, COMMANDS = "", "file", "dir", "dynamic", "commands"
+
+
+def candidate_tables() -> dict[str, tuple[str, ...]]:
+    """Get the static candidates of each table."""
+    from guitarra.clicktrack import STYLE_VOLUMES
+    from guitarra.fingerings import SYSTEMS
+    from guitarra.grid import FORMATS
+    from guitarra.patterns import SUBDIVISIONS
+    from guitarra.progressions import form_names
+    from guitarra.scales import NOTE_NAMES, GuitarFretboard, Scale
+
+    return {
+        "notes": NOTE_NAMES,
+        "scales": tuple(Scale.get_available_scales()),
+        "forms": form_names().names,
+        "tunings": GuitarFretboard.tuning_index().names,
+        "formats": tuple(FORMATS),
+        "systems": SYSTEMS,
+        "subdivisions": tuple(SUBDIVISIONS),
+        "styles": tuple(STYLE_VOLUMES),
+        "shells": SHELLS,
+    }
+
+
+class Option(NamedTuple):
+    """A command option: its names, help and value kind (None for flags)."""
+
+    names: tuple[str, ...]
+    help: str
+    kind: str | None
+
+
+class Command(NamedTuple):
+    """A command or group of the CLI, by its path of subcommand names."""
+
+    path: tuple[str, ...]
+    help: str
+    options: tuple[Option, ...]
+    # Value kind of each positional argument, the last one repeating if
+    # variadic; a group takes a subcommand name instead
+    arguments: tuple[str, ...]
+    variadic: bool
+    subcommands: tuple[tuple[str, str], ...]
+
+
+def _kind(param) -> str | None:
+    """Get the value kind of a Click parameter."""
+    if getattr(param, "is_flag", False):
+        return None
+    if param.name in PARAMETER_TABLES:
+        return PARAMETER_TABLES[param.name]
+    # Click names path types after what they accept
+    if param.type.name in ("path", "file"):
+        return FILE
+    if param.type.name == "directory":
+        return DIRECTORY
+    if getattr(param, "_custom_shell_complete", None) is not None:
+        return DYNAMIC
+    return FREE
+
+
+def _summary(text: str | None) -> str:
+    """Get the first line of a help text."""
+    return (text or "").strip().split("\n", 1)[0]
+
+
+def command_tree(command, path: tuple[str, ...] = ()) -> list[Command]:
+    """List a Click command and all its subcommands, parents first.
+
+    Args:
+        command: Click command or group (``typer.main.get_command(app)``)
+        path: Subcommand names leading to the command
+    """
+    options = []
+    arguments = []
+    variadic = False
+    for param in command.params:
+        if param.param_type_name == "option":
+            names = tuple(param.opts) + tuple(param.secondary_opts)
+            options.append(Option(names, _summary(param.help), _kind(param)))
+        elif param.param_type_name == "argument":
+            arguments.append(_kind(param) or FREE)
+            variadic = param.nargs == -1
+    options.append(Option(("--help",), HELP_OPTION, None))
+
+    subcommands = getattr(command, "commands", {})
+    if subcommands:
+        arguments = [COMMANDS]
+    tree = [
+        Command(
+            path=path,
+            help=_summary(command.help),
+            options=tuple(options),
+            arguments=tuple(arguments),
+            variadic=variadic,
+            subcommands=tuple(
+                (name, _summary(sub.help)) for name, sub in subcommands.items()
+            ),
+        )
+    ]
+    for name, sub in subcommands.items():
+        tree.extend(command_tree(sub, path + (name,)))
+    return tree
+
+
+def _kinds(tree: list[Command]) -> set[str]:
+    """Collect the value kinds used anywhere in a command tree."""
+    kinds = set()
+    for command in tree:
+        kinds.update(command.arguments)
+        kinds.update(option.kind for option in command.options if option.kind)
+    return kinds
+
+
+def _header(shell: str) -> str:
+    return (
+        f"# {shell} completion for {PROG_NAME}, generated by "
+        f"`{PROG_NAME} completion generate {shell}`.\n"
+        "# Candidates are embedded: completing does not start Python.\n"
+    )
+
+
+def _quote(text: str) -> str:
+    """Quote a word for bash or zsh."""
+    return "'" + text.replace("'", "'\\''") + "'"
+
+
+def _bash_script(tree: list[Command], tables: dict[str, tuple[str, ...]]) -> str:
+    lines = [_header("bash")]
+    for name, values in tables.items():
+        lines.append(f"_{PROG_NAME}_{name}={_quote(' '.join(values))}")
+
+    # Value kind of an option or positional argument (#N)
+    lines += [
+        "",
+        "# Set REPLY to the value kind of an option or argument (#N) of a command",
+        f"_{PROG_NAME}_kind() {{",
+        '    case "$1|$2" in',
+    ]
+    for command in tree:
+        prefix = " ".join(command.path) + "|"
+        for option in command.options:
+            if option.kind is not None:
+                patterns = "|".join(_quote(prefix + name) for name in option.names)
+                lines.append(f"        {patterns}) REPLY={_quote(option.kind)} ;;")
+        for index, kind in enumerate(command.arguments):
+            pattern = _quote(f"{prefix}#{index}")
+            if command.variadic and index == len(command.arguments) - 1:
+                pattern = _quote(f"{prefix}#") + "*"
+            lines.append(f"        {pattern}) REPLY={_quote(kind)} ;;")
+    lines += ["        *) return 1 ;;", "    esac", "}"]
+
+    for function, field in (("options", "options"), ("commands", "subcommands")):
+        lines += [
+            "",
+            f"_{PROG_NAME}_{function}() {{",
+            '    case "$1" in',
+        ]
+        for command in tree:
+            if field == "options":
+                words = [name for option in command.options for name in option.names]
+            else:
+                words = [name for name, _ in command.subcommands]
+            if words:
+                key = _quote(" ".join(command.path))
+                lines.append(f"        {key}) REPLY={_quote(' '.join(words))} ;;")
+        lines += ["        *) REPLY= ;;", "    esac", "}"]
+
+    # Only values without a table ask the CLI
+    dynamic = ""
+    if DYNAMIC in _kinds(tree):
+        dynamic = (
+            f"\n        {DYNAMIC}) local IFS=$'\\n'\n            COMPREPLY=($(env "
+            f'COMP_WORDS="${{COMP_WORDS[*]}}" COMP_CWORD=$COMP_CWORD '
+            f"_{PROG_NAME.upper()}_COMPLETE=complete_bash {PROG_NAME})); return ;;"
+        )
+    lines.append(
+        f"""
+# Complete the current word from a value kind
+_{PROG_NAME}_complete() {{
+    local candidates word nocase=0
+    case $1 in
+        {FILE}) compopt -o filenames 2>/dev/null
+            COMPREPLY=($(compgen -f -- "$cur")); return ;;
+        {DIRECTORY}) compopt -o filenames 2>/dev/null
+            COMPREPLY=($(compgen -d -- "$cur")); return ;;{dynamic}
+        options | commands) _{PROG_NAME}_$1 "$command"; candidates=$REPLY ;;
+        '') return ;;
+        *) candidates=_{PROG_NAME}_$1; candidates=${{!candidates}} ;;
+    esac
+    shopt -q nocasematch || nocase=1
+    shopt -s nocasematch
+    for word in $candidates; do
+        [[ $word == "$cur"* ]] && COMPREPLY+=("$word")
+    done
+    ((nocase)) && shopt -u nocasematch
+    return 0
+}}
+
+_{PROG_NAME}() {{
+    local cur=${{COMP_WORDS[COMP_CWORD]}} command= word REPLY i arg=0
+    COMPREPLY=()
+    for ((i = 1; i < COMP_CWORD; i++)); do
+        word=${{COMP_WORDS[i]}}
+        if [[ $word == -* ]]; then
+            _{PROG_NAME}_kind "$command" "$word" || continue
+            if ((i + 1 == COMP_CWORD)); then
+                _{PROG_NAME}_complete "$REPLY"
+                return
+            fi
+            i=$((i + 1))
+        elif _{PROG_NAME}_kind "$command" "#$arg" && [[ $REPLY == commands ]]; then
+            command=${{command:+$command }}$word
+        else
+            arg=$((arg + 1))
+        fi
+    done
+    if [[ $cur == -* ]]; then
+        _{PROG_NAME}_complete options
+    elif _{PROG_NAME}_kind "$command" "#$arg"; then
+        _{PROG_NAME}_complete "$REPLY"
+    fi
+}}
+
+complete -F _{PROG_NAME} {PROG_NAME}"""
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _zsh_escape(text: str) -> str:
+    """Escape a description for an _arguments spec."""
+    for char in "\\[]":
+        text = text.replace(char, "\\" + char)
+    return text
+
+
+def _zsh_action(kind: str, message: str) -> str:
+    """Get the _arguments message and action for a value kind."""
+    actions = {
+        FREE: " ",
+        FILE: "_files",
+        DIRECTORY: "_files -/",
+        DYNAMIC: f"_{PROG_NAME}_dynamic",
+    }
+    return f"{message}:{actions.get(kind, f'_{PROG_NAME}_values {kind}')}"
+
+
+def _zsh_function(command: Command) -> list[str]:
+    """Build the completion function of one command."""
+    name = "_".join((PROG_NAME,) + command.path)
+    specs = []
+    for option in command.options:
+        exclusive = f"({' '.join(option.names)})" if len(option.names) > 1 else ""
+        names = (
+            "{" + ",".join(option.names) + "}"
+            if len(option.names) > 1
+            else option.names[0]
+        )
+        spec = f"[{_zsh_escape(option.help)}]"
+        if option.kind is not None:
+            message = option.names[0].lstrip("-")
+            spec += ":" + _zsh_action(option.kind, message)
+        specs.append((_quote(exclusive) if exclusive else "") + names + _quote(spec))
+
+    lines = [f"_{name}() {{"]
+    if command.subcommands:
+        subcommands = " ".join(
+            _quote(f"{sub}:{text}") for sub, text in command.subcommands
+        )
+        lines += [
+            "  local curcontext=$curcontext state line",
+            "  _arguments -C \\",
+            *(f"    {spec} \\" for spec in specs),
+            "    ': :->command' \\",
+            "    '*:: :->argument'",
+            "  case $state in",
+            "    command)",
+            f"      local -a subcommands=({subcommands})",
+            "      _describe -t commands command subcommands ;;",
+            "    argument)",
+            f"      curcontext=${{curcontext%:*:*}}:{name}-$words[1]:",
+            "      case $words[1] in",
+        ]
+        for sub, _ in command.subcommands:
+            lines.append(f"        {_quote(sub)}) _{name}_{sub} ;;")
+        lines += ["      esac ;;", "  esac", "}"]
+        return lines
+
+    for index, kind in enumerate(command.arguments):
+        position = index + 1
+        if command.variadic and index == len(command.arguments) - 1:
+            position = "*"
+        specs.append(_quote(f"{position}:" + _zsh_action(kind, kind or "argument")))
+    lines.append("  _arguments \\")
+    lines += [f"    {spec} \\" for spec in specs[:-1]]
+    lines += [f"    {specs[-1]}", "}"]
+    return lines
+
+
+def _zsh_script(tree: list[Command], tables: dict[str, tuple[str, ...]]) -> str:
+    lines = [f"#compdef {PROG_NAME}", _header("zsh")]
+    for name, values in tables.items():
+        words = " ".join(_quote(value) for value in values)
+        lines.append(f"_{PROG_NAME}_{name}=({words})")
+    lines += [
+        "",
+        f"_{PROG_NAME}_values() {{",
+        "  local -a values",
+        f"  values=(${{(P)${{:-_{PROG_NAME}_$1}}}})",
+        "  compadd -M 'm:{[:lower:][:upper:]}={[:upper:][:lower:]}' -a values",
+        "}",
+    ]
+    if DYNAMIC in _kinds(tree):
+        lines += [
+            "",
+            f"_{PROG_NAME}_dynamic() {{",
+            f'  eval $(env _TYPER_COMPLETE_ARGS="$LBUFFER" '
+            f"_{PROG_NAME.upper()}_COMPLETE=complete_zsh {PROG_NAME})",
+            "}",
+        ]
+    for command in tree:
+        lines.append("")
+        lines += _zsh_function(command)
+    lines += [
+        "",
+        "if [[ $zsh_eval_context[-1] == loadautofunc ]]; then",
+        f'  _{PROG_NAME} "$@"',
+        "else",
+        f"  compdef _{PROG_NAME} {PROG_NAME}",
+        "fi",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _fish_quote(text: str) -> str:
+    """Quote a word for fish."""
+    return "'" + text.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _fish_values(kind: str) -> str:
+    """Get the complete arguments offering the values of a kind."""
+    if kind == FREE:
+        return ""
+    if kind == FILE:
+        return " -F"
+    if kind == DIRECTORY:
+        return " -a '(__fish_complete_directories)'"
+    if kind == DYNAMIC:
+        return f" -a '(__{PROG_NAME}_dynamic)'"
+    return f" -a '(printf \"%s\\n\" $__{PROG_NAME}_{kind})'"
+
+
+def _fish_script(tree: list[Command], tables: dict[str, tuple[str, ...]]) -> str:
+    prog = PROG_NAME
+    lines = [_header("fish")]
+    for name, values in tables.items():
+        words = " ".join(_fish_quote(value) for value in values)
+        lines.append(f"set -g __{prog}_{name} {words}")
+
+    groups = " ".join(
+        _fish_quote(" ".join(command.path)) for command in tree if command.subcommands
+    )
+    lines.append(f"set -g __{prog}_groups {groups}")
+    for command in tree:
+        values = [
+            name
+            for option in command.options
+            if option.kind is not None
+            for name in option.names
+        ]
+        if values:
+            variable = "_".join(command.path).replace("-", "_")
+            lines.append(f"set -g __{prog}_values_{variable} {' '.join(values)}")
+
+    lines.append(
+        f"""
+# Succeed when the cursor is in a command (a path of subcommand names) at a
+# positional argument index, or at least at N with N+
+function __{prog}_at --argument-names path index
+    set -l words (commandline -opc)
+    set -e words[1]
+    set -l command ''
+    set -l position 0
+    set -l skip 0
+    for word in $words
+        if test $skip = 1
+            set skip 0
+        else if string match -q -- '-*' $word
+            set -l values __{prog}_values_(string replace -ra '[ -]' _ -- $command)
+            contains -- $word $$values; and set skip 1
+        else if test $position = 0; and contains -- $command $__{prog}_groups
+            set command (string trim -- "$command $word")
+        else
+            set position (math $position + 1)
+        end
+    end
+    test $skip = 0; and test "$command" = "$path"; or return 1
+    if string match -q -- '*+' $index
+        test $position -ge (string trim -r -c + -- $index)
+    else
+        test $position = $index
+    end
+end"""
+    )
+    if DYNAMIC in _kinds(tree):
+        lines.append(
+            f"""
+function __{prog}_dynamic
+    env _{prog.upper()}_COMPLETE=complete_fish _TYPER_COMPLETE_FISH_ACTION=get-args \\
+        _TYPER_COMPLETE_ARGS=(commandline -cp) {prog}
+end"""
+        )
+
+    lines += ["", f"complete -c {prog} -f"]
+    for command in tree:
+        path = _fish_quote(" ".join(command.path))
+        anywhere = f"-n {_fish_quote(f'__{prog}_at {path} 0+')}"
+        for option in command.options:
+            flags = []
+            for name in option.names:
+                if name.startswith("--"):
+                    flags.append(f"-l {name[2:]}")
+                elif len(name) == 2:
+                    flags.append(f"-s {name[1:]}")
+                else:
+                    flags.append(f"-o {name[1:]}")
+            values = "" if option.kind is None else " -r" + _fish_values(option.kind)
+            lines.append(
+                f"complete -c {prog} {anywhere} {' '.join(flags)}{values}"
+                f" -d {_fish_quote(option.help)}"
+            )
+        for sub, text in command.subcommands:
+            condition = _fish_quote(f"__{prog}_at {path} 0")
+            lines.append(
+                f"complete -c {prog} -n {condition} -a {_fish_quote(sub)}"
+                f" -d {_fish_quote(text)}"
+            )
+        if command.subcommands:
+            continue
+        for index, kind in enumerate(command.arguments):
+            values = _fish_values(kind)
+            if not values:
+                continue
+            if command.variadic and index == len(command.arguments) - 1:
+                index = f"{index}+"
+            condition = _fish_quote(f"__{prog}_at {path} {index}")
+            lines.append(f"complete -c {prog} -n {condition}{values}")
+    return "\n".join(lines) + "\n"
+
+
+GENERATORS = {"bash": _bash_script, "zsh": _zsh_script, "fish": _fish_script}
+
+
+def generate_script(command, shell: str) -> str:
+    """Generate a completion script with the candidates embedded.
+
+    Args:
+        command: Click command of the CLI (``typer.main.get_command(app)``)
+        shell: One of SHELLS
+
+    Raises:
+        ValueError: If the shell is not supported
+    """
+    if shell not in GENERATORS:
+        raise ValueError(f"Unknown shell: {shell}")
+    tree = command_tree(command)
+    tables = {
+        name: values
+        for name, values in candidate_tables().items()
+        if name in _kinds(tree)
+    }
+    return GENERATORS[shell](tree, tables)
@@ -0,0 +1,158 @@
+"""Persistent render cache shared across CLI invocations.
+
+All renders live in a single file per package version. The file starts with a
+small header and a JSON index of ``key -> (offset, length)``, followed by the
+rendered text. Reads memory-map the file and slice the requested entry, so a
+cache hit costs one mmap and no rendering.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from guitarra.cache import RenderCache, render_cache
+
+# File signature and header layout: magic, index length
+MAGIC = b"GUITARRA"
+HEADER = struct.Struct(f"<{len(MAGIC)}sI")
+
+
+def _package_version() -> str:
+    """Get the installed package version used to invalidate old cache files."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("guitarra")
+    except PackageNotFoundError:
+        return "dev"
+
+
+class DiskRenderCache:
+    """Single-file, memory-mapped store of rendered output."""
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        """Initialize the cache in `directory`.
+
+        Args:
+            directory: Cache directory (created on first write)
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / f"renders-{_package_version()}.bin"
+        self._index: dict[str, tuple[int, int]] | None = None
+        self._map: mmap.mmap | None = None
+        self._data_start = 0
+        self._pending: dict[str, str] = {}
+
+    def get(self, key: str) -> str | None:
+        """Get a cached render, or None if it is not stored."""
+        if key in self._pending:
+            return self._pending[key]
+        if self._index is None:
+            self._load()
+        entry = self._index.get(key)
+        if entry is None or self._map is None:
+            return None
+        start = self._data_start + entry[0]
+        return self._map[start : start + entry[1]].decode()
+
+    def put(self, key: str, value: str) -> None:
+        """Queue a render to be written on the next flush."""
+        self._pending[key] = value
+
+    def flush(self) -> None:
+        """Write queued renders, merged with the stored ones, to disk.
+
+        The file is rewritten atomically, so concurrent readers always see a
+        complete file. Cache files from other package versions are removed.
+        """
+        if not self._pending:
+            return
+        if self._index is None:
+            self._load()
+
+        entries = {key: self.get(key) for key in self._index}
+        entries.update(self._pending)
+
+        index = {}
+        chunks = []
+        offset = 0
+        for key, value in entries.items():
+            data = value.encode()
+            index[key] = (offset, len(data))
+            chunks.append(data)
+            offset += len(data)
+        index_bytes = json.dumps(index, separators=(",", ":")).encode()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(index_bytes)))
+            f.write(index_bytes)
+            f.writelines(chunks)
+
+        self.close()
+        os.replace(tmp_path, self.path)
+        self._pending.clear()
+
+        for stale in self.directory.glob("renders-*.bin"):
+            if stale != self.path:
+                stale.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Release the memory map; the index is reloaded on next access."""
+        if self._map is not None:
+            self._map.close()
+        self._map = None
+        self._index = None
+
+    def _load(self) -> None:
+        """Map the cache file and parse its index."""
+        self._index = {}
+        try:
+            with open(self.path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            # Missing or empty file
+            return
+
+        try:
+            magic, index_length = HEADER.unpack_from(mapped)
+            if magic != MAGIC:
+                raise ValueError("Not a render cache file")
+            index_end = HEADER.size + index_length
+            index = json.loads(mapped[HEADER.size : index_end])
+        except (struct.error, ValueError):
+            # Corrupt or foreign file: treat as empty, it is rewritten on flush
+            mapped.close()
+            return
+
+        self._index = {key: tuple(entry) for key, entry in index.items()}
+        self._data_start = index_end
+        self._map = mapped
+
+
+@contextmanager
+def disk_render_cache(
+    directory: str | os.PathLike[str] | None, cache: RenderCache = render_cache
+) -> Iterator[DiskRenderCache | None]:
+    """Back `cache` with a persistent store in `directory` for the duration.
+
+    Does nothing when `directory` is None. New renders are flushed on exit.
+    """
+    if directory is None:
+        yield None
+        return
+
+    disk = DiskRenderCache(directory)
+    cache.disk = disk
+    try:
+        yield disk
+    finally:
+        cache.disk = None
+        disk.flush()
+        disk.close()
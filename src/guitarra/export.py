@@ -0,0 +1,136 @@
+"""Practice-book exporter: every scale in every key, plus every blues form."""
+
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from guitarra.pitch import parse_root
+from guitarra.progressions import FORMS, format_chart, get_form
+from guitarra.scales import GuitarFretboard, Scale, validate_fret_range
+
+# Fret windows rendered for every scale when none are given
+DEFAULT_WINDOWS = [(0, 12), (0, 5), (5, 9), (7, 12), (12, 17)]
+
+# Jobs handed to a worker process at a time
+DEFAULT_CHUNK_SIZE = 64
+
+# Fixed timestamp so archives are byte-for-byte reproducible
+ARCHIVE_DATE = (2000, 1, 1, 0, 0, 0)
+
+
+class ExportResult(NamedTuple):
+    """Summary of an export run."""
+
+    count: int
+    seconds: float
+
+    @property
+    def per_second(self) -> float:
+        """Diagrams rendered per second."""
+        return self.count / self.seconds if self.seconds else float("inf")
+
+
+def parse_window(window: str) -> tuple[int, int]:
+    """Parse a fret window such as '5-9'.
+
+    Raises:
+        ValueError: If the window is malformed or not displayable
+    """
+    try:
+        start, end = (int(part) for part in window.split("-"))
+    except ValueError:
+        raise ValueError(f"Invalid fret window: {window} (expected START-END)")
+    validate_fret_range(start, end)
+    return start, end
+
+
+def build_jobs(windows: list[tuple[int, int]]) -> list[tuple]:
+    """List every diagram in the book, in output order."""
+    jobs: list[tuple] = [
+        ("scale", root, scale_name, start, end)
+        for root in Scale.CHROMATIC
+        for scale_name in Scale.get_available_scales()
+        for start, end in windows
+    ]
+    jobs.extend(("blues", root, form) for root in Scale.CHROMATIC for form in FORMS)
+    return jobs
+
+
+def _render_job(job: tuple, fretboard: GuitarFretboard) -> tuple[str, str]:
+    """Render one job into (relative path, text)."""
+    if job[0] == "scale":
+        _, root, scale_name, start, end = job
+        text = fretboard.display_scale(
+            Scale(root, scale_name), start_fret=start, end_fret=end, color=False
+        )
+        return f"scales/{root}/{scale_name}_{start}-{end}.txt", text + "\n"
+
+    # Blues charts come straight from the form's transposition table
+    _, root, form_name = job
+    form = get_form(form_name)
+    chart = format_chart(form.in_key(parse_root(root)), form.degrees)
+    return f"blues/{root}_{form_name}.txt", f"{form.format_title(root)}\n\n{chart}\n"
+
+
+def _render_chunk(jobs: list[tuple]) -> list[tuple[str, str]]:
+    """Render a chunk of jobs in a worker process."""
+    fretboard = GuitarFretboard()
+    return [_render_job(job, fretboard) for job in jobs]
+
+
+def _write(destination: Path, rendered, archive: bool) -> None:
+    """Write rendered files to a directory or a zip archive."""
+    if archive:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(destination, "w", zipfile.ZIP_DEFLATED) as zf:
+            for chunk in rendered:
+                for path, text in chunk:
+                    info = zipfile.ZipInfo(path, date_time=ARCHIVE_DATE)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    zf.writestr(info, text)
+        return
+
+    for chunk in rendered:
+        for path, text in chunk:
+            target = destination / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(text)
+
+
+def export_book(
+    destination: str | os.PathLike[str],
+    windows: list[tuple[int, int]] | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ExportResult:
+    """Render the whole practice book to a directory or a .zip archive.
+
+    Rendering is spread over a process pool in chunks. Results are collected
+    in job order, so the output is identical regardless of worker count.
+
+    Args:
+        destination: Output directory, or a path ending in .zip
+        windows: Fret windows to render for every scale
+        workers: Number of worker processes (default: CPU count, 1 renders
+            in-process)
+        chunk_size: Jobs per worker task
+
+    Returns:
+        Number of diagrams written and elapsed time
+    """
+    destination = Path(destination)
+    jobs = build_jobs(windows or DEFAULT_WINDOWS)
+    chunks = [jobs[i : i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    archive = destination.suffix == ".zip"
+
+    start = time.perf_counter()
+    if workers == 1:
+        _write(destination, map(_render_chunk, chunks), archive)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            _write(destination, pool.map(_render_chunk, chunks), archive)
+    return ExportResult(len(jobs), time.perf_counter() - start)
@@ -0,0 +1,361 @@
+"""Scale fingerings: playable positions of a scale across the neck.
+
+A fingering plays the scale in order from the low string to the high string,
+with the hand at one position per string (the fret under the index finger)
+and one finger per fret. Notes one fret outside the hand are stretches. The
+search is memoized over (string, scale step, hand position) states and picks
+the split of notes between strings and the hand positions with the least
+cost for stretches and shifts.
+
+Three systems are supported:
+
+- ``box``: one hand position for every string, one shape per scale degree
+  on the low string
+- ``3nps``: three notes per string, shifting along the neck as needed
+- ``caged``: box shapes anchored on the C, A, G, E and D chord shapes
+
+Fingerings use no open strings, so the shapes of a scale are searched once
+with the root on C and moved to any key by a fret offset.
+"""
+
+import json
+from typing import NamedTuple
+
+from guitarra.cache import render_cache
+from guitarra.grid import FretboardGrid, Label, serialize
+from guitarra.scales import GuitarFretboard, Scale, mask_to_pitch_classes, note_index
+
+SYSTEMS = ("box", "3nps", "caged")
+
+# Cost of a note played one fret outside the hand
+STRETCH_COST = 1.0
+
+# Cost of moving the hand by one fret between strings
+SHIFT_COST = 0.5
+
+# CAGED shapes in neck order: string of the root and the hand position
+# relative to the root fret on that string
+CAGED_SHAPES = {"C": (1, -3), "A": (1, 0), "G": (0, -3), "E": (0, 0), "D": (2, 0)}
+
+
+class Fingering(NamedTuple):
+    """A scale position: frets and fingers per string, low to high."""
+
+    name: str
+    frets: tuple[tuple[int, ...], ...]
+    fingers: tuple[tuple[int, ...], ...]
+    cost: float
+
+    @property
+    def span(self) -> tuple[int, int]:
+        """Get the lowest and highest fret played."""
+        played = [fret for string in self.frets for fret in string]
+        return min(played), max(played)
+
+    def transpose(self, semitones: int) -> "Fingering":
+        """Move the fingering up the neck, keeping its lowest fret in 1-12."""
+        low = self.span[0]
+        offset = (low + semitones - 1) % 12 + 1 - low
+        return self._replace(
+            frets=tuple(
+                tuple(fret + offset for fret in string) for string in self.frets
+            )
+        )
+
+
+def _open_pitches(tuning: tuple[str, ...]) -> list[int]:
+    """Get the pitch of each open string, rising from the lowest string."""
+    pitches = [note_index(tuning[0])]
+    for note in tuning[1:]:
+        pitches.append(pitches[-1] + ((note_index(note) - pitches[-1]) % 12 or 12))
+    return pitches
+
+
+def _finger(fret: int, position: int) -> int:
+    """Get the finger for a fret, with stretches on the index or little finger."""
+    return min(max(fret - position + 1, 1), 4)
+
+
+def _search(
+    open_pitches: list[int],
+    tones: list[int],
+    start: int,
+    counts: tuple[int, ...],
+    position: int | None = None,
+    last: int | None = None,
+) -> tuple[float, tuple[tuple[int, tuple[int, ...]], ...]] | None:
+    """Find the cheapest fingering of consecutive scale tones.
+
+    Args:
+        open_pitches: Pitch of each open string
+        tones: Pitches of the scale in ascending order
+        start: Index of the first tone, played on the lowest string
+        counts: Allowed numbers of notes per string
+        position: Fixed hand position, or None to choose one per string
+        last: Index of the tone played last, or None to stop on the last string
+
+    Returns:
+        The cost and (hand position, frets) of each string, or None if the
+        tones cannot be played this way
+    """
+    strings = len(open_pitches)
+    memo: dict[tuple[int, int, int | None], tuple | None] = {}
+
+    def best(string: int, step: int, previous: int | None) -> tuple | None:
+        key = (string, step, previous)
+        if key in memo:
+            return memo[key]
+        result = None
+        if string == strings:
+            if last is None or step == last + 1:
+                result = (0.0, ())
+        else:
+            for count in counts:
+                if step + count > len(tones) or (
+                    last is not None and step + count - 1 > last
+                ):
+                    break
+                frets = tuple(
+                    tones[step + i] - open_pitches[string] for i in range(count)
+                )
+                if position is None:
+                    hands = range(max(frets[-1] - 4, 1), frets[0] + 2)
+                else:
+                    hands = (position,)
+                for hand in hands:
+                    if frets[0] < max(hand - 1, 1) or frets[-1] > hand + 4:
+                        continue
+                    # One finger per note: no stretch onto a finger in use
+                    if (hand - 1 in frets and hand in frets) or (
+                        hand + 4 in frets and hand + 3 in frets
+                    ):
+                        continue
+                    rest = best(string + 1, step + count, hand)
+                    if rest is None:
+                        continue
+                    stretches = sum(not hand <= fret <= hand + 3 for fret in frets)
+                    cost = STRETCH_COST * stretches + rest[0]
+                    if previous is not None:
+                        cost += SHIFT_COST * abs(hand - previous)
+                    if result is None or cost < result[0]:
+                        result = (cost, ((hand, frets),) + rest[1])
+        memo[key] = result
+        return result
+
+    return best(0, start, None)
+
+
+def _box(
+    open_pitches: list[int],
+    tones: list[int],
+    position: int,
+    name: str,
+    start: int | None = None,
+) -> Fingering | None:
+    """Find the box fingering at a hand position.
+
+    The box runs from the start tone (by default the lowest scale tone under
+    the hand on the low string) to the highest under the hand on the high
+    string.
+    """
+    reach = range(position, position + 4)
+    low = [i for i, tone in enumerate(tones) if tone - open_pitches[0] in reach]
+    high = [i for i, tone in enumerate(tones) if tone - open_pitches[-1] in reach]
+    if start is None:
+        start = low[0] if low else None
+    if start is None or not high:
+        return None
+    found = _search(open_pitches, tones, start, (1, 2, 3, 4), position, high[-1])
+    return _fingering(name, found)
+
+
+def _fingering(name: str, found: tuple | None) -> Fingering | None:
+    """Build a Fingering from a search result."""
+    if found is None:
+        return None
+    cost, strings = found
+    return Fingering(
+        name=name,
+        frets=tuple(frets for _, frets in strings),
+        fingers=tuple(
+            tuple(_finger(fret, hand) for fret in frets) for hand, frets in strings
+        ),
+        cost=cost,
+    )
+
+
+def find_fingerings(
+    mask: int, tuning: tuple[str, ...], system: str = "box"
+) -> list[Fingering]:
+    """Search the fingerings of a scale rooted on C, lowest on the neck first.
+
+    Args:
+        mask: Pitch-class set of the scale, rooted on C
+        tuning: Open string notes, low to high
+        system: One of SYSTEMS
+
+    Raises:
+        ValueError: If the system is unknown
+    """
+    if system not in SYSTEMS:
+        raise ValueError(f"Unknown fingering system: {system}")
+
+    open_pitches = _open_pitches(tuning)
+    tones = [
+        pitch
+        for pitch in range(open_pitches[0], open_pitches[-1] + 30)
+        if mask >> (pitch % 12) & 1
+    ]
+    # One starting tone per scale degree, on frets 2-13 of the low string
+    starts = [i for i, tone in enumerate(tones) if 2 <= tone - open_pitches[0] <= 13]
+
+    fingerings = []
+    if system == "box":
+        for step in starts:
+            fret = tones[step] - open_pitches[0]
+            # Index finger on the first note, or the middle finger when that
+            # needs fewer stretches and leaves no scale tone under the index
+            positions = [fret]
+            # The first tone has no scale tone below it on the low string
+            if step == 0 or tones[step - 1] - open_pitches[0] < fret - 1:
+                positions.append(fret - 1)
+            options = [
+                _box(open_pitches, tones, position, "Position", step)
+                for position in positions
+            ]
+            options = [option for option in options if option is not None]
+            if options:
+                fingerings.append(min(options, key=lambda option: option.cost))
+    elif system == "3nps":
+        for step in starts:
+            found = _search(open_pitches, tones, step, (3,))
+            fingering = _fingering("Position", found)
+            if fingering is not None:
+                fingerings.append(fingering)
+    else:
+        for shape, (string, offset) in CAGED_SHAPES.items():
+            root_fret = (-open_pitches[string]) % 12
+            position = (root_fret + offset - 2) % 12 + 2
+            fingering = _box(open_pitches, tones, position, f"{shape} shape")
+            if fingering is not None:
+                fingerings.append(fingering)
+
+    return _in_neck_order(fingerings)
+
+
+def _in_neck_order(fingerings) -> list[Fingering]:
+    """Sort fingerings up the neck, numbering the positions in that order."""
+    ordered = sorted(fingerings, key=lambda fingering: fingering.span)
+    return [
+        fingering._replace(name=f"Position {number}")
+        if fingering.name.startswith("Position")
+        else fingering
+        for number, fingering in enumerate(ordered, start=1)
+    ]
+
+
+def scale_fingerings(
+    scale: Scale,
+    system: str = "box",
+    fretboard: GuitarFretboard | None = None,
+) -> list[Fingering]:
+    """Get the fingerings of a scale in its key, lowest on the neck first.
+
+    Shapes are searched once per scale pattern, tuning and system (through
+    the render cache) and moved to the key of the scale.
+
+    Raises:
+        ValueError: If the system is unknown
+    """
+    tuning = tuple((fretboard or GuitarFretboard()).tuning)
+    pattern_mask = Scale.SCALE_MASKS[scale.scale_name]
+    key = ("fingerings", pattern_mask, tuning, system)
+    encoded = render_cache.get_or_render(
+        key,
+        lambda: json.dumps(find_fingerings(pattern_mask, tuning, system)),
+    )
+    shapes = [
+        Fingering(
+            name,
+            tuple(map(tuple, frets)),
+            tuple(map(tuple, fingers)),
+            cost,
+        )
+        for name, frets, fingers, cost in json.loads(encoded)
+    ]
+    return _in_neck_order(shape.transpose(scale.root_index) for shape in shapes)
+
+
+def fingering_grid(
+    scale: Scale,
+    fingering: Fingering,
+    tuning: list[str] | None = None,
+    show_degrees: bool = False,
+) -> FretboardGrid:
+    """Build the grid model of a fingering, over the frets it spans.
+
+    Args:
+        scale: Scale the fingering plays
+        fingering: Fingering to show
+        tuning: Open string notes, low to high (standard tuning by default)
+        show_degrees: Show scale degrees instead of finger numbers
+    """
+    tuning = tuning or GuitarFretboard.STANDARD_TUNING
+    low, high = fingering.span
+    degrees = {
+        pitch_class: degree
+        for degree, pitch_class in enumerate(
+            mask_to_pitch_classes(scale.mask, scale.root_index), start=1
+        )
+    }
+
+    # Label 0 is the empty position
+    labels: list[Label | None] = [None]
+    indexes: dict[Label, int] = {}
+    rows = []
+    for string_index in reversed(range(len(tuning))):
+        row = [0] * (high - low + 1)
+        open_pc = note_index(tuning[string_index])
+        for fret, finger in zip(
+            fingering.frets[string_index], fingering.fingers[string_index]
+        ):
+            pitch_class = (open_pc + fret) % 12
+            mark = degrees[pitch_class] if show_degrees else finger
+            label = Label(str(mark), pitch_class == scale.root_index)
+            if label not in indexes:
+                indexes[label] = len(labels)
+                labels.append(label)
+            row[fret - low] = indexes[label]
+        rows.append(tuple(row))
+
+    name = scale.scale_name.replace("_", " ").title()
+    return FretboardGrid(
+        title=f"{scale.root} {name} Scale, {fingering.name} (Frets {low}-{high}):",
+        strings=tuple(reversed(tuning)),
+        start_fret=low,
+        rows=tuple(rows),
+        labels=tuple(labels),
+    )
+
+
+def format_fingering(
+    scale: Scale,
+    fingering: Fingering,
+    tuning: list[str] | None = None,
+    show_degrees: bool = False,
+    color: bool = True,
+    output_format: str | None = None,
+) -> str:
+    """Format a fingering as a fretboard diagram of finger numbers.
+
+    Args:
+        scale: Scale the fingering plays
+        fingering: Fingering to show
+        tuning: Open string notes, low to high (standard tuning by default)
+        show_degrees: Show scale degrees instead of finger numbers
+        color: Highlight root notes with ANSI colors
+        output_format: Output format (see guitarra.grid.FORMATS); by default
+            ``ansi``, or ``plain`` without color
+    """
+    grid = fingering_grid(scale, fingering, tuning, show_degrees)
+    return serialize(grid, output_format or ("ansi" if color else "plain"))
@@ -0,0 +1,365 @@
+"""Intermediate grid models for diagrams, and the serializers that write them.
+
+Renderers build a compact model once: a ``FretboardGrid`` for fretboard
+diagrams (scales, fingerings) or a ``ChartGrid`` for chord charts. A
+serializer then writes the model in one pass:
+
+- ``ansi``: text with root notes highlighted in red
+- ``plain``: the same text without escape sequences
+- ``json``: machine-readable data, so tools need not parse the text
+- ``svg``: a standalone vector image
+- ``html``: a table fragment with CSS classes
+
+Fretboard rows hold indexes into a small label table (for scales, the 12
+pitch classes), so text serializers build each distinct cell once, escape
+sequences included, and render a row with a single join.
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import NamedTuple
+
+# ANSI escape sequences used to highlight root notes
+ANSI_RED = "\x1b[31m"
+ANSI_RESET = "\x1b[0m"
+
+# Bars per row of a chord chart
+BARS_PER_ROW = 4
+
+
+class Label(NamedTuple):
+    """Text shown at a fretboard position."""
+
+    text: str
+    root: bool = False
+
+
+class FretboardGrid(NamedTuple):
+    """A fretboard diagram: labels per string and fret."""
+
+    title: str
+    # String names, top row (highest string) first
+    strings: tuple[str, ...]
+    start_fret: int
+    # Index into labels for every fret of every string, top row first
+    rows: tuple[tuple[int, ...], ...]
+    # Labels by index; None leaves the position empty
+    labels: tuple[Label | None, ...]
+
+    @property
+    def end_fret(self) -> int:
+        """Get the last fret shown."""
+        return self.start_fret + len(self.rows[0]) - 1 if self.rows else 0
+
+
+class ChartGrid(NamedTuple):
+    """A chord chart: chords of each bar, with optional notes under them."""
+
+    bars: tuple[str, ...]
+    # Roman numerals (or voicings) of each bar, shown under the chords
+    notes: tuple[str, ...] | None = None
+    title: str | None = None
+
+
+# Fret number cells of the text footer, by fret
+_FRET_NUMBERS = tuple(f" {fret} " if fret < 10 else f"{fret} " for fret in range(100))
+
+
+@lru_cache(maxsize=1024)
+def _text_cell(label: Label | None, color: bool) -> str:
+    """Format one fretboard cell, three characters wide, escapes included."""
+    if label is None:
+        return "---"
+    cell = f"-{label.text}-" if len(label.text) == 1 else f"{label.text}-"
+    if color and label.root:
+        return f"{ANSI_RED}{cell}{ANSI_RESET}"
+    return cell
+
+
+def _fretboard_text(grid: FretboardGrid, color: bool) -> str:
+    """Write a fretboard as text, one line per string.
+
+    String names are padded to the longest one (F# on an eight-string), so
+    the frets line up.
+    """
+    cells = [_text_cell(label, color) for label in grid.labels]
+    lines = [grid.title, ""]
+    width = max(map(len, grid.strings), default=1)
+    for name, row in zip(grid.strings, grid.rows):
+        lines.append(f"{name:<{width}}|" + "".join(map(cells.__getitem__, row)))
+    if grid.end_fret < len(_FRET_NUMBERS):
+        footer = _FRET_NUMBERS[grid.start_fret : grid.end_fret + 1]
+    else:
+        footer = [f"{fret} " for fret in range(grid.start_fret, grid.end_fret + 1)]
+    lines.append(" " * (width + 1) + "".join(footer))
+    return "\n".join(lines)
+
+
+def _chart_text(grid: ChartGrid) -> str:
+    """Write a chord chart as text, four bars per row.
+
+    When notes are shown, each row of chords has a row of notes under it and
+    rows are separated by a blank line. A title, if any, comes first.
+    """
+    bars, notes = grid.bars, grid.notes
+    width = max(4, max(map(len, bars), default=0))
+    if notes:
+        width = max(width, max(map(len, notes)))
+    cells = [chord.rjust(width) for chord in bars]
+    lines = [grid.title, ""] if grid.title else []
+
+    for i in range(0, len(cells), BARS_PER_ROW):
+        lines.append("| " + " | ".join(cells[i : i + BARS_PER_ROW]) + " |")
+
+        if notes:
+            note_line = " | ".join(
+                note.rjust(width) for note in notes[i : i + BARS_PER_ROW]
+            )
+            lines.append(f"| {note_line} |")
+
+            # Add separator line except for the last row
+            if i + BARS_PER_ROW < len(cells):
+                lines.append("")
+
+    return "\n".join(lines)
+
+
+def _fretboard_json(grid: FretboardGrid) -> str:
+    """Write a fretboard as JSON, listing every labelled position.
+
+    Strings are numbered from 1 for the top row (the highest string), as
+    guitarists number them.
+    """
+    import json
+
+    notes = [
+        {
+            "string": string,
+            "fret": grid.start_fret + offset,
+            "label": label.text,
+            "root": label.root,
+        }
+        for string, row in enumerate(grid.rows, start=1)
+        for offset, index in enumerate(row)
+        if (label := grid.labels[index]) is not None
+    ]
+    return json.dumps(
+        {
+            "type": "fretboard",
+            "title": grid.title,
+            "strings": list(grid.strings),
+            "start_fret": grid.start_fret,
+            "end_fret": grid.end_fret,
+            "notes": notes,
+        }
+    )
+
+
+def _chart_json(grid: ChartGrid) -> str:
+    """Write a chord chart as JSON, one entry per bar."""
+    import json
+
+    bars = [{"chords": bar.split()} for bar in grid.bars]
+    if grid.notes:
+        for bar, note in zip(bars, grid.notes):
+            bar["notes"] = note
+    return json.dumps({"type": "chart", "title": grid.title, "bars": bars})
+
+
+# SVG layout, in pixels
+_SVG_FRET = 40
+_SVG_STRING = 24
+_SVG_MARGIN = 32
+_SVG_BAR = 96
+_SVG_LINE = 22
+
+
+def _fretboard_svg(grid: FretboardGrid) -> str:
+    """Write a fretboard as SVG: strings, fret wires and labelled dots."""
+    from xml.sax.saxutils import escape
+
+    frets = grid.end_fret - grid.start_fret + 1
+    width = 2 * _SVG_MARGIN + frets * _SVG_FRET
+    top = 2 * _SVG_MARGIN
+    height = top + len(grid.strings) * _SVG_STRING + _SVG_MARGIN
+    bottom = top + (len(grid.strings) - 1) * _SVG_STRING
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" font-family="sans-serif" font-size="12">',
+        f'<text x="{_SVG_MARGIN}" y="{_SVG_MARGIN}">{escape(grid.title)}</text>',
+    ]
+    for offset in range(frets + 1):
+        x = _SVG_MARGIN + offset * _SVG_FRET
+        parts.append(
+            f'<line x1="{x}" y1="{top}" x2="{x}" y2="{bottom}" stroke="#999"/>'
+        )
+    for offset in range(frets):
+        x = _SVG_MARGIN + offset * _SVG_FRET + _SVG_FRET // 2
+        parts.append(
+            f'<text x="{x}" y="{bottom + _SVG_MARGIN - 8}" text-anchor="middle" '
+            f'fill="#666">{grid.start_fret + offset}</text>'
+        )
+    for string, (name, row) in enumerate(zip(grid.strings, grid.rows)):
+        y = top + string * _SVG_STRING
+        parts.append(
+            f'<line x1="{_SVG_MARGIN}" y1="{y}" x2="{width - _SVG_MARGIN}" '
+            f'y2="{y}" stroke="#333"/>'
+        )
+        parts.append(
+            f'<text x="{_SVG_MARGIN - 8}" y="{y + 4}" '
+            f'text-anchor="end">{escape(name)}</text>'
+        )
+        for offset, index in enumerate(row):
+            label = grid.labels[index]
+            if label is None:
+                continue
+            x = _SVG_MARGIN + offset * _SVG_FRET + _SVG_FRET // 2
+            fill = "#c0392b" if label.root else "#2c3e50"
+            parts.append(
+                f'<circle cx="{x}" cy="{y}" r="10" fill="{fill}"/>'
+                f'<text x="{x}" y="{y + 4}" text-anchor="middle" '
+                f'fill="#fff">{escape(label.text)}</text>'
+            )
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def _chart_svg(grid: ChartGrid) -> str:
+    """Write a chord chart as SVG, four bars per row."""
+    from xml.sax.saxutils import escape
+
+    lines_per_row = 2 if grid.notes else 1
+    rows = -(-len(grid.bars) // BARS_PER_ROW)
+    top = _SVG_MARGIN + (_SVG_LINE if grid.title else 0)
+    row_height = lines_per_row * _SVG_LINE + 8
+    width = 2 * _SVG_MARGIN + BARS_PER_ROW * _SVG_BAR
+    height = top + rows * row_height + _SVG_MARGIN
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" font-family="sans-serif" font-size="14">'
+    ]
+    if grid.title:
+        parts.append(
+            f'<text x="{_SVG_MARGIN}" y="{_SVG_MARGIN}">{escape(grid.title)}</text>'
+        )
+    for index, bar in enumerate(grid.bars):
+        row, column = divmod(index, BARS_PER_ROW)
+        x = _SVG_MARGIN + column * _SVG_BAR
+        y = top + row * row_height
+        parts.append(
+            f'<rect x="{x}" y="{y}" width="{_SVG_BAR}" '
+            f'height="{row_height - 8}" fill="none" stroke="#333"/>'
+        )
+        parts.append(
+            f'<text x="{x + _SVG_BAR // 2}" y="{y + _SVG_LINE - 6}" '
+            f'text-anchor="middle">{escape(bar)}</text>'
+        )
+        if grid.notes:
+            parts.append(
+                f'<text x="{x + _SVG_BAR // 2}" y="{y + 2 * _SVG_LINE - 6}" '
+                f'text-anchor="middle" fill="#666">{escape(grid.notes[index])}</text>'
+            )
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def _fretboard_html(grid: FretboardGrid) -> str:
+    """Write a fretboard as an HTML table, one row per string."""
+    from html import escape
+
+    cells = [
+        "<td></td>"
+        if label is None
+        else f'<td class="{"root" if label.root else "note"}">{escape(label.text)}</td>'
+        for label in grid.labels
+    ]
+    parts = [
+        '<table class="fretboard">',
+        f"<caption>{escape(grid.title)}</caption>",
+    ]
+    for name, row in zip(grid.strings, grid.rows):
+        parts.append(
+            f"<tr><th>{escape(name)}</th>"
+            + "".join(map(cells.__getitem__, row))
+            + "</tr>"
+        )
+    parts.append(
+        "<tr><th></th>"
+        + "".join(
+            f"<th>{fret}</th>" for fret in range(grid.start_fret, grid.end_fret + 1)
+        )
+        + "</tr>"
+    )
+    parts.append("</table>")
+    return "\n".join(parts)
+
+
+def _chart_html(grid: ChartGrid) -> str:
+    """Write a chord chart as an HTML table, four bars per row."""
+    from html import escape
+
+    parts = ['<table class="chart">']
+    if grid.title:
+        parts.append(f"<caption>{escape(grid.title)}</caption>")
+    for i in range(0, len(grid.bars), BARS_PER_ROW):
+        parts.append(
+            "<tr>"
+            + "".join(
+                f"<td>{escape(bar)}</td>" for bar in grid.bars[i : i + BARS_PER_ROW]
+            )
+            + "</tr>"
+        )
+        if grid.notes:
+            parts.append(
+                '<tr class="notes">'
+                + "".join(
+                    f"<td>{escape(note)}</td>"
+                    for note in grid.notes[i : i + BARS_PER_ROW]
+                )
+                + "</tr>"
+            )
+    parts.append("</table>")
+    return "\n".join(parts)
+
+
+class Serializer(NamedTuple):
+    """Writers of each grid model for one output format."""
+
+    fretboard: Callable[[FretboardGrid], str]
+    chart: Callable[[ChartGrid], str]
+
+
+# Output formats by name; register_format adds more
+FORMATS: dict[str, Serializer] = {
+    "ansi": Serializer(lambda grid: _fretboard_text(grid, True), _chart_text),
+    "plain": Serializer(lambda grid: _fretboard_text(grid, False), _chart_text),
+    "json": Serializer(_fretboard_json, _chart_json),
+    "svg": Serializer(_fretboard_svg, _chart_svg),
+    "html": Serializer(_fretboard_html, _chart_html),
+}
+
+
+# Formats written as plain lines of text, for terminals and text files
+TEXT_FORMATS = ("ansi", "plain")
+
+
+def register_format(name: str, serializer: Serializer) -> None:
+    """Add an output format, or replace an existing one."""
+    FORMATS[name] = serializer
+
+
+def serialize(grid: FretboardGrid | ChartGrid, output_format: str = "ansi") -> str:
+    """Write a grid model in an output format.
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    try:
+        serializer = FORMATS[output_format]
+    except KeyError:
+        raise ValueError(f"Unknown output format: {output_format}")
+    if isinstance(grid, FretboardGrid):
+        return serializer.fretboard(grid)
+    return serializer.chart(grid)
@@ -0,0 +1,134 @@
+"""Reverse scale lookup: which scales contain a given set of notes."""
+
+from functools import lru_cache
+from typing import NamedTuple
+
+from guitarra.pitch import key_tonic, parse_note, spell_scale
+from guitarra.scales import (
+    Scale,
+    is_minor_mask,
+    mask_to_pitch_classes,
+    note_index,
+    rotate_mask,
+)
+
+
+class ScaleMatch(NamedTuple):
+    """A scale that contains the queried notes."""
+
+    root: str
+    scale_name: str
+    mask: int
+    extra_notes: int
+
+    @property
+    def exact(self) -> bool:
+        """Whether the scale contains exactly the queried notes."""
+        return self.extra_notes == 0
+
+
+@lru_cache(maxsize=1)
+def scale_index() -> tuple[tuple[int, str, str, int], ...]:
+    """Get every root x scale combination as (root index, root, scale name, mask).
+
+    Roots are spelled as usual for the key (Bb major, C# minor). The index is
+    built on first use, with the scales of the user catalog.
+    """
+    Scale.name_index()
+    return tuple(
+        (
+            root_index,
+            key_tonic(root_index, is_minor_mask(shape)).name,
+            scale_name,
+            rotate_mask(shape, root_index),
+        )
+        for root_index in range(12)
+        for scale_name, shape in Scale.SCALE_MASKS.items()
+    )
+
+
+def reset_scale_index() -> None:
+    """Drop the scale index and memoized lookups, after a catalog change."""
+    scale_index.cache_clear()
+    identify_mask.cache_clear()
+
+
+def notes_to_mask(notes: list[str]) -> int:
+    """Convert note names into a 12-bit pitch-class set."""
+    mask = 0
+    for note in notes:
+        mask |= 1 << note_index(note)
+    return mask
+
+
+@lru_cache(maxsize=4096)
+def identify_mask(
+    mask: int, root: int | None = None, exact: bool = False
+) -> tuple[ScaleMatch, ...]:
+    """Find every scale containing the pitch-class set `mask`.
+
+    Results are ranked by fit: exact matches first, then scales with the
+    fewest notes outside the query, then scales rooted on `root` (usually the
+    first note given), then catalog order. Results are memoized per query, so
+    repeated lookups are a single cache hit.
+
+    Args:
+        mask: 12-bit pitch-class set to look up
+        root: Optional pitch class to prefer as the scale root
+        exact: Only return scales with exactly these pitch classes
+    """
+    matches = []
+    for root_index, root_name, scale_name, scale_mask in scale_index():
+        if scale_mask & mask != mask:
+            continue
+        extra = (scale_mask & ~mask).bit_count()
+        if exact and extra:
+            continue
+        matches.append(
+            (
+                extra,
+                root_index != root,
+                ScaleMatch(root_name, scale_name, scale_mask, extra),
+            )
+        )
+    matches.sort(key=lambda match: match[:2])
+    return tuple(match for _, _, match in matches)
+
+
+def identify_scales(notes: list[str], exact: bool = False) -> list[ScaleMatch]:
+    """Find every scale containing the given notes, ranked by fit.
+
+    Args:
+        notes: Note names (e.g., ['C', 'E', 'G', 'Bb'])
+        exact: Only return scales with exactly these notes
+
+    Returns:
+        Matching scales, best fit first
+
+    Raises:
+        ValueError: If no notes are given or a note name is invalid
+    """
+    if not notes:
+        raise ValueError("At least one note is required")
+    mask = notes_to_mask(notes)
+    return list(identify_mask(mask, note_index(notes[0]), exact))
+
+
+def format_matches(matches: list[ScaleMatch], query_mask: int) -> str:
+    """Format identification results as a readable list."""
+    lines = []
+    for match in matches:
+        scale_name_formatted = match.scale_name.replace("_", " ").title()
+        line = f"{match.root} {scale_name_formatted}"
+        if match.exact:
+            line += " (exact match)"
+        else:
+            tonic = parse_note(match.root)
+            pitch_classes = mask_to_pitch_classes(match.mask, tonic.pitch_class)
+            names = dict(zip(pitch_classes, spell_scale(tonic, pitch_classes)))
+            extra_names = ", ".join(
+                names[pc] for pc in pitch_classes if not query_mask >> pc & 1
+            )
+            line += f" (+{match.extra_notes}: {extra_names})"
+        lines.append(line)
+    return "\n".join(lines)
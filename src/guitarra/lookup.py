@@ -0,0 +1,204 @@
+"""Name lookup: ranked completion and typo-tolerant resolution of names.
+
+A NameIndex holds the names of a catalog (scales, forms, notes) and their
+aliases in a prefix trie. Spellings are normalized first: lower case, with
+runs of spaces, hyphens and underscores read as one underscore, so
+"Natural Minor", "natural-minor" and "natural_minor" are the same key.
+
+- completion walks down the prefix and reads the names precomputed for that
+  subtree, already ranked (names before aliases, then catalog order)
+- resolution looks the key up exactly, then falls back to the closest name
+  within a small edit distance (insertions, deletions, substitutions and
+  swaps of adjacent letters), found with one dynamic-programming row per
+  trie node so shared prefixes are only computed once
+
+The index is built once per catalog; lookups cost the length of the key
+rather than the size of the catalog.
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+
+_SEPARATORS_RE = re.compile(r"[\s_-]+")
+
+
+def normalize_name(text: str) -> str:
+    """Normalize a spelling: lower case, separators read as one underscore."""
+    return _SEPARATORS_RE.sub("_", text.strip().lower())
+
+
+def max_typos(key: str) -> int:
+    """Edits tolerated when resolving a key: none for very short keys."""
+    if len(key) <= 2:
+        return 0
+    return 1 if len(key) <= 5 else 2
+
+
+class _Node:
+    """A trie node: children by character and the names spelled up to it."""
+
+    __slots__ = ("children", "names", "ranked")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        # Names spelled exactly by the path to this node
+        self.names: list[str] = []
+        # Names of this subtree, best ranked first
+        self.ranked: tuple[str, ...] = ()
+
+
+class NameIndex:
+    """Prefix trie over the names and aliases of a catalog."""
+
+    def __init__(self, names: Iterable[str], aliases: Mapping[str, str] | None = None):
+        """Build the index.
+
+        Args:
+            names: Canonical names, in catalog order
+            aliases: Other spellings and the name each stands for
+        """
+        self.names = tuple(names)
+        self._exact: dict[str, str] = {}
+        self._root = _Node()
+
+        # Rank of every spelling: names first, then aliases, in catalog order
+        spellings = [(name, name) for name in self.names]
+        spellings += [(alias, name) for alias, name in (aliases or {}).items()]
+        ranks: dict[str, int] = {}
+        for rank, (spelling, name) in enumerate(spellings):
+            key = normalize_name(spelling)
+            self._exact.setdefault(key, name)
+            node = self._root
+            for char in key:
+                node = node.children.setdefault(char, _Node())
+            if name not in node.names:
+                node.names.append(name)
+            ranks.setdefault(f"{key}\0{name}", rank)
+        self._rank_subtrees(self._root, "", ranks)
+
+    def _rank_subtrees(self, node: _Node, key: str, ranks: dict[str, int]) -> dict:
+        """Fill in the ranked names of every subtree; return {name: rank}."""
+        best = {name: ranks[f"{key}\0{name}"] for name in node.names}
+        for char, child in node.children.items():
+            for name, rank in self._rank_subtrees(child, key + char, ranks).items():
+                if rank < best.get(name, len(ranks)):
+                    best[name] = rank
+        node.ranked = tuple(sorted(best, key=best.__getitem__))
+        return best
+
+    def __contains__(self, text: str) -> bool:
+        """Check whether a spelling is a name or alias of the catalog."""
+        return normalize_name(text) in self._exact
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def complete(self, prefix: str, limit: int = 0) -> list[str]:
+        """List the names with a name or alias starting with `prefix`, best first.
+
+        Args:
+            prefix: Start of a spelling
+            limit: Most names returned (0 returns all)
+        """
+        node = self._root
+        for char in normalize_name(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return list(node.ranked[:limit] if limit else node.ranked)
+
+    def resolve(self, text: str, typos: int | None = None) -> str | None:
+        """Get the name a spelling stands for, tolerating a few typos.
+
+        Args:
+            text: Name or alias, possibly misspelled
+            typos: Edits tolerated (by default from the length, see max_typos)
+
+        Returns:
+            The name, or None if there is none or several equally close ones
+        """
+        if text in self._exact:
+            return self._exact[text]
+        key = normalize_name(text)
+        if key in self._exact:
+            return self._exact[key]
+        closest = self._closest(key, max_typos(key) if typos is None else typos)
+        if not closest:
+            return None
+        distance = min(closest.values())
+        found = [name for name, d in closest.items() if d == distance]
+        return found[0] if len(found) == 1 else None
+
+    def suggest(self, text: str, limit: int = 3) -> list[str]:
+        """Suggest names for a spelling that did not resolve.
+
+        Names completing the spelling are suggested first, then the closest
+        names within one edit more than resolution tolerates.
+        """
+        key = normalize_name(text)
+        found = self.complete(key, limit)
+        if found:
+            return found
+        closest = self._closest(key, max(max_typos(key), 1) + 1)
+        if not closest:
+            return []
+        # The closest names only, in catalog order
+        distance = min(closest.values())
+        return [name for name in self.names if closest.get(name, -1) == distance][
+            :limit
+        ]
+
+    def _closest(self, key: str, typos: int) -> dict[str, int]:
+        """Find the names within `typos` edits of a key, with their distance."""
+        found: dict[str, int] = {}
+        if typos <= 0:
+            return found
+        columns = len(key) + 1
+        first = list(range(columns))
+        # Columns where a node character and the one before it are a swapped
+        # pair of adjacent letters of the key
+        swaps: dict[tuple[str, str], set[int]] = {}
+        for i in range(2, columns):
+            swaps.setdefault((key[i - 1], key[i - 2]), set()).add(i)
+
+        # Depth-first over the trie: (node, its character, the character
+        # before it, the edit distance rows of its parent and grandparent)
+        stack = [
+            (child, char, "", first, first)
+            for char, child in self._root.children.items()
+        ]
+        while stack:
+            node, char, before, above, above2 = stack.pop()
+            swapped = swaps.get((before, char), ())
+            row = [above[0] + 1]
+            left = row[0]
+            for i in range(1, columns):
+                left += 1
+                if above[i] + 1 < left:
+                    left = above[i] + 1
+                diagonal = above[i - 1] + (key[i - 1] != char)
+                if diagonal < left:
+                    left = diagonal
+                # Swapped adjacent letters count as one edit
+                if i in swapped and above2[i - 2] + 1 < left:
+                    left = above2[i - 2] + 1
+                row.append(left)
+            distance = row[-1]
+            if node.names and distance <= typos:
+                for name in node.names:
+                    if distance < found.get(name, typos + 1):
+                        found[name] = distance
+            if min(row) <= typos:
+                stack.extend(
+                    (child, next_char, char, row, above)
+                    for next_char, child in node.children.items()
+                )
+        return found
+
+
+def describe_unknown(kind: str, text: str, index: NameIndex) -> str:
+    """Format the error for a spelling that did not resolve, with suggestions."""
+    suggestions = index.suggest(text)
+    if suggestions:
+        return f"Unknown {kind}: {text} (did you mean {', '.join(suggestions)}?)"
+    return f"Unknown {kind}: {text}"
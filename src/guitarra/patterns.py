@@ -0,0 +1,206 @@
+"""Metronome click patterns: accent maps, odd groupings and polyrhythms.
+
+A pattern describes one cycle of clicks. It is compiled once into flat arrays
+of click offsets and accent levels, which live playback and offline rendering
+then repeat, so a complex pattern costs no more per click than a plain beat.
+
+Pattern syntax::
+
+    X-x-x-x-    accent map: one character per click, X accent, x regular,
+                - subdivision (soft), . rest; spaces and | are ignored
+    2+2+3       grouping: an accent on the first group, a regular click on
+                every other group start, soft clicks in between
+    3:2         polyrhythm: 3 evenly spaced clicks against 2 beats
+
+Accent maps and groupings place one click per subdivision (``--subdivisions
+eighth`` makes ``2+2+3`` a bar of 7/8). A polyrhythm ``a:b`` always spans
+``b`` beats: the beats sound as regular clicks, the ``a`` cross rhythm as soft
+clicks, and the shared downbeat as an accent.
+"""
+
+import itertools
+from array import array
+from collections.abc import Iterable, Iterator
+from fractions import Fraction
+from functools import lru_cache
+
+# Accent levels, indexed by the values stored in level arrays
+LEVELS = ("accent", "regular", "subdivision")
+
+# Clicks per beat for each subdivision type
+SUBDIVISIONS = {"quarter": 1, "eighth": 2, "sixteenth": 4, "triplets": 3}
+
+# Accent map characters and their levels (None is a rest)
+ACCENT_MARKS = {"X": 0, "x": 1, "-": 2, ".": None}
+
+# Largest group size, polyrhythm side and accent map length accepted
+MAX_PATTERN_CLICKS = 64
+
+
+class ClickPattern:
+    """One compiled cycle of clicks, repeated for as long as it plays."""
+
+    def __init__(
+        self, offsets: Iterable[float], levels: Iterable[int], cycle_beats: float
+    ):
+        """Initialize from precomputed clicks.
+
+        Args:
+            offsets: Click offsets in beats from the start of the cycle,
+                in ascending order
+            levels: Index into LEVELS of each click
+            cycle_beats: Length of one cycle in beats
+        """
+        self.offsets = array("d", offsets)
+        self.levels = array("B", levels)
+        self.cycle_beats = cycle_beats
+        self._names = tuple(LEVELS[level] for level in self.levels)
+
+    def __len__(self) -> int:
+        """Get the number of clicks in one cycle."""
+        return len(self.offsets)
+
+    def level(self, index: int) -> str:
+        """Get the accent level of the `index`-th click since the start."""
+        return self._names[index % len(self._names)]
+
+    def schedule(self, bpm: float) -> Iterator[float]:
+        """Generate click times in seconds from the start, cycling forever.
+
+        Times are computed from the cycle number rather than accumulated, so
+        they never drift.
+        """
+        beat_s = 60.0 / bpm
+        cycle_s = self.cycle_beats * beat_s
+        times = array("d", (offset * beat_s for offset in self.offsets))
+        for cycle in itertools.count():
+            yield from map((cycle * cycle_s).__add__, times)
+
+    def events(
+        self, bpm: float, total_frames: int, sample_rate: int
+    ) -> Iterator[tuple[int, str]]:
+        """Generate (frame, accent level) for every click before `total_frames`."""
+        for time_s, level in zip(self.schedule(bpm), itertools.cycle(self._names)):
+            frame = round(time_s * sample_rate)
+            if frame >= total_frames:
+                return
+            yield frame, level
+
+
+def _check_size(value: int, what: str) -> None:
+    """Check a group size or polyrhythm side."""
+    if value < 1 or value > MAX_PATTERN_CLICKS:
+        raise ValueError(f"{what} must be between 1 and {MAX_PATTERN_CLICKS}")
+
+
+def _compile_polyrhythm(spec: str) -> ClickPattern:
+    """Compile ``a:b`` into the union of both pulses over ``b`` beats."""
+    parts = spec.split(":")
+    if len(parts) != 2 or not all(part.strip().isdigit() for part in parts):
+        raise ValueError("a polyrhythm is two numbers, e.g. 3:2")
+    cross, beats = (int(part) for part in parts)
+    _check_size(cross, "polyrhythm sides")
+    _check_size(beats, "polyrhythm sides")
+
+    # Exact positions within the cycle, so coinciding clicks merge into one
+    # at the strongest level
+    positions: dict[Fraction, int] = {}
+    for i in range(cross):
+        positions[Fraction(i, cross)] = 2
+    for i in range(beats):
+        positions[Fraction(i, beats)] = 1
+    positions[Fraction(0)] = 0
+
+    ordered = sorted(positions)
+    return ClickPattern(
+        (float(position * beats) for position in ordered),
+        (positions[position] for position in ordered),
+        beats,
+    )
+
+
+def _compile_grouping(spec: str) -> list[int | None]:
+    """Compile ``2+2+3`` into one accent level per click."""
+    parts = spec.split("+")
+    if not all(part.strip().isdigit() for part in parts):
+        raise ValueError("a grouping is numbers joined by +, e.g. 2+2+3")
+
+    marks: list[int | None] = []
+    for number, group in enumerate(int(part) for part in parts):
+        _check_size(group, "group sizes")
+        marks.append(0 if number == 0 else 1)
+        marks.extend([2] * (group - 1))
+    return marks
+
+
+def _compile_accent_map(spec: str) -> list[int | None]:
+    """Compile ``X-x-`` into one accent level (or rest) per click."""
+    marks = []
+    for char in spec:
+        if char in " |":
+            continue
+        if char not in ACCENT_MARKS:
+            raise ValueError(f"unknown accent mark {char!r}")
+        marks.append(ACCENT_MARKS[char])
+    return marks
+
+
+@lru_cache(maxsize=64)
+def compile_pattern(spec: str, subdivisions: str = "quarter") -> ClickPattern:
+    """Compile a pattern (see module docstring) into one cycle of clicks.
+
+    Args:
+        spec: Accent map, grouping or polyrhythm
+        subdivisions: Click length for accent maps and groupings
+
+    Raises:
+        ValueError: If the pattern is invalid
+    """
+    spec = spec.strip()
+    if subdivisions not in SUBDIVISIONS:
+        raise ValueError(f"Unknown subdivisions: {subdivisions}")
+
+    try:
+        if ":" in spec:
+            return _compile_polyrhythm(spec)
+        if spec[:1].isdigit():
+            marks = _compile_grouping(spec)
+        else:
+            marks = _compile_accent_map(spec)
+    except ValueError as e:
+        raise ValueError(f"Invalid pattern {spec!r}: {e}")
+
+    if len(marks) > MAX_PATTERN_CLICKS:
+        raise ValueError(
+            f"Invalid pattern {spec!r}: more than {MAX_PATTERN_CLICKS} clicks"
+        )
+    if all(mark is None for mark in marks):
+        raise ValueError(f"Invalid pattern {spec!r}: no clicks")
+
+    per_beat = SUBDIVISIONS[subdivisions]
+    clicks = [(i, mark) for i, mark in enumerate(marks) if mark is not None]
+    return ClickPattern(
+        (i / per_beat for i, _ in clicks),
+        (mark for _, mark in clicks),
+        len(marks) / per_beat,
+    )
+
+
+@lru_cache(maxsize=64)
+def standard_pattern(beats: int, subdivisions: str = "quarter") -> ClickPattern:
+    """Get the pattern of a plain measure: accent, regular beats, soft subdivisions.
+
+    Raises:
+        ValueError: If the subdivision type is unknown
+    """
+    per_beat = SUBDIVISIONS.get(subdivisions)
+    if per_beat is None:
+        raise ValueError(f"Unknown subdivisions: {subdivisions}")
+    return ClickPattern(
+        (i / per_beat for i in range(beats * per_beat)),
+        (
+            0 if i == 0 else 1 if i % per_beat == 0 else 2
+            for i in range(beats * per_beat)
+        ),
+        beats,
+    )
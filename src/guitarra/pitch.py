@@ -0,0 +1,267 @@
+"""Pitch core: note spellings, pitch classes and key-aware note names.
+
+Every spelling of a note resolves through one table built at import: the
+seven letters with every accidental from double flat to double sharp, in any
+case and in ASCII, Unicode or words ("Bb", "bb", "B♭", "B flat", "Cx",
+"E#", "Cb"). The table maps each spelling to an interned Note, so a lookup is
+one dict access and notes compare and hash as tuples.
+
+The first character is always the letter, so lower case flats are not
+ambiguous: "bb" is B flat and "b" is B.
+
+Names are spelled back for a key: scales of seven notes take one letter per
+degree (Bb, not A#, in F major), and other scales and chord roots use the
+sharps or flats of the key signature.
+"""
+
+from typing import NamedTuple
+
+LETTERS = "CDEFGAB"
+
+# Pitch class of each natural letter
+NATURALS = dict(zip(LETTERS, (0, 2, 4, 5, 7, 9, 11)))
+
+# Accidental written in note names, by alteration in semitones
+ACCIDENTALS = {-2: "bb", -1: "b", 0: "", 1: "#", 2: "##"}
+
+# Every accepted spelling of each alteration, in lower case without spaces
+ALTERATION_SPELLINGS = {
+    -2: ("bb", "\u266d\u266d", "\U0001d12b", "doubleflat"),
+    -1: ("b", "\u266d", "flat"),
+    0: ("", "\u266e", "natural"),
+    1: ("#", "\u266f", "sharp"),
+    2: ("##", "x", "\u266f\u266f", "\U0001d12a", "doublesharp"),
+}
+
+# Note spellings offered for roots: the chromatic names, then common flats
+NOTE_NAMES = (
+    "C",
+    "C#",
+    "D",
+    "D#",
+    "E",
+    "F",
+    "F#",
+    "G",
+    "G#",
+    "A",
+    "A#",
+    "B",
+    "Db",
+    "Eb",
+    "Gb",
+    "Ab",
+    "Bb",
+)
+
+# Tonic pitch classes of the major keys written with flats (F, Bb, Eb, Ab, Db)
+FLAT_KEYS = frozenset({5, 10, 3, 8, 1})
+
+# Semitones above a chord root and the letters the chord tone is above it
+_INTERVAL_STEPS = {
+    0: 0,
+    1: 1,
+    2: 1,
+    3: 2,
+    4: 2,
+    5: 3,
+    6: 4,
+    7: 4,
+    8: 4,
+    9: 5,
+    10: 6,
+    11: 6,
+    13: 1,
+    14: 1,
+    15: 1,
+    17: 3,
+    21: 5,
+}
+
+
+class Note(NamedTuple):
+    """A spelled note: letter and alteration, with its name and pitch class."""
+
+    name: str
+    letter: str
+    alteration: int
+    pitch_class: int
+
+    def __str__(self) -> str:
+        return self.name
+
+
+def _spelling_key(text: str) -> str:
+    """Normalize a spelling: lower case, spaces, hyphens and underscores dropped."""
+    return text.strip().lower().replace(" ", "").replace("-", "").replace("_", "")
+
+
+# Interned notes by (letter, alteration)
+NOTES = {
+    (letter, alteration): Note(
+        letter + accidental,
+        letter,
+        alteration,
+        (NATURALS[letter] + alteration) % 12,
+    )
+    for letter in LETTERS
+    for alteration, accidental in ACCIDENTALS.items()
+}
+
+# Every spelling to its note: canonical names, then normalized spellings
+SPELLINGS = {note.name: note for note in NOTES.values()}
+SPELLINGS.update(
+    (_spelling_key(letter + spelling), note)
+    for (letter, alteration), note in NOTES.items()
+    for spelling in ALTERATION_SPELLINGS[alteration]
+)
+
+# Notes of each pitch class spelled with sharps and with flats
+SHARP_NOTES = tuple(
+    NOTES[name[0], len(name) - 1] for name in ("C C# D D# E F F# G G# A A# B".split())
+)
+FLAT_NOTES = tuple(
+    NOTES[name[0], 1 - len(name)] for name in ("C Db D Eb E F Gb G Ab A Bb B".split())
+)
+SHARP_NAMES = tuple(note.name for note in SHARP_NOTES)
+FLAT_NAMES = tuple(note.name for note in FLAT_NOTES)
+
+# Tonic of the major and minor key on each pitch class, with the fewest
+# accidentals (F# and Eb minor on the six-accidental ties)
+MAJOR_TONICS = tuple(
+    FLAT_NOTES[pc] if pc in FLAT_KEYS else SHARP_NOTES[pc] for pc in range(12)
+)
+MINOR_TONICS = tuple(
+    FLAT_NOTES[pc] if (pc + 3) % 12 in FLAT_KEYS | {6} else SHARP_NOTES[pc]
+    for pc in range(12)
+)
+
+
+def find_note(text: str) -> Note | None:
+    """Get the note a spelling stands for, or None if it is not a note."""
+    note = SPELLINGS.get(text)
+    if note is None:
+        note = SPELLINGS.get(_spelling_key(text))
+    return note
+
+
+def parse_note(text: str) -> Note:
+    """Get the note a spelling stands for.
+
+    Raises:
+        ValueError: If the spelling is not a note
+    """
+    note = find_note(text)
+    if note is None:
+        raise ValueError(f"Invalid note: {text}")
+    return note
+
+
+def parse_root(text: str) -> Note:
+    """Get the root note of a scale or key.
+
+    Double sharps and flats are respelled without them (Cx is D), so roots
+    and the names spelled from them stay short.
+
+    Raises:
+        ValueError: If the spelling is not a note
+    """
+    note = find_note(text)
+    if note is None:
+        raise ValueError(f"Invalid root note: {text.upper()}")
+    if abs(note.alteration) > 1:
+        return enharmonic(note.pitch_class, note.alteration < 0)
+    return note
+
+
+def pitch_class(text: str) -> int:
+    """Get the pitch class (0-11, C = 0) of a note spelling.
+
+    Raises:
+        ValueError: If the spelling is not a note
+    """
+    return parse_note(text).pitch_class
+
+
+def enharmonic(pitch_class: int, flats: bool = False) -> Note:
+    """Get the plain spelling of a pitch class, with a sharp or a flat."""
+    return (FLAT_NOTES if flats else SHARP_NOTES)[pitch_class % 12]
+
+
+def key_tonic(pitch_class: int, minor: bool = False) -> Note:
+    """Get the usual spelling of the tonic of a key (Bb, not A#, for major)."""
+    return (MINOR_TONICS if minor else MAJOR_TONICS)[pitch_class % 12]
+
+
+def prefers_flats(tonic: Note, minor: bool = False) -> bool:
+    """Check whether a key is written with flats.
+
+    A flat or sharp tonic keeps its accidental; a natural one follows the key
+    signature of its major key (or relative major, for a minor key).
+    """
+    if tonic.alteration:
+        return tonic.alteration < 0
+    relative_major = (tonic.pitch_class + 3) % 12 if minor else tonic.pitch_class
+    return relative_major in FLAT_KEYS
+
+
+def _by_letters(tonic: Note, steps_and_classes) -> tuple[str, ...] | None:
+    """Spell notes a number of letters above the tonic.
+
+    Returns:
+        The names, or None if a note would need a double accidental
+    """
+    start = LETTERS.index(tonic.letter)
+    names = []
+    for steps, pc in steps_and_classes:
+        letter = LETTERS[(start + steps) % 7]
+        alteration = (pc - NATURALS[letter] + 6) % 12 - 6
+        if abs(alteration) > 1:
+            return None
+        names.append(NOTES[letter, alteration].name)
+    return tuple(names)
+
+
+def _by_signature(tonic: Note, pitch_classes, flats: bool) -> tuple[str, ...]:
+    """Spell notes with the sharps or flats of a key, the tonic as written."""
+    table = FLAT_NAMES if flats else SHARP_NAMES
+    return tuple(
+        tonic.name if pc == tonic.pitch_class else table[pc] for pc in pitch_classes
+    )
+
+
+def spell_scale(tonic: Note, pitch_classes: list[int]) -> tuple[str, ...]:
+    """Spell the pitch classes of a scale, starting on its tonic, for its key.
+
+    Seven-note scales take one letter per degree, unless that needs double
+    accidentals; other scales use the key signature, read from the relative
+    major when the scale has a minor third.
+    """
+    if len(pitch_classes) == 7:
+        names = _by_letters(tonic, enumerate(pitch_classes))
+        if names is not None:
+            return names
+    degrees = {(pc - tonic.pitch_class) % 12 for pc in pitch_classes}
+    minor = 3 in degrees and 4 not in degrees
+    return _by_signature(tonic, pitch_classes, prefers_flats(tonic, minor))
+
+
+def spell_chord(root: Note, intervals: tuple[int, ...]) -> tuple[str, ...]:
+    """Spell the notes of a chord from its root and semitone intervals.
+
+    Chord tones take their letter from the interval (the third of C7 is E,
+    its seventh Bb), falling back to the key signature of the root when that
+    needs double accidentals.
+    """
+    pitch_classes = [(root.pitch_class + interval) % 12 for interval in intervals]
+    if all(interval in _INTERVAL_STEPS for interval in intervals):
+        names = _by_letters(
+            root,
+            (
+                (_INTERVAL_STEPS[interval], pc)
+                for interval, pc in zip(intervals, pitch_classes)
+            ),
+        )
+        if names is not None:
+            return names
+    return _by_signature(root, pitch_classes, prefers_flats(root))
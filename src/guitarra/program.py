@@ -0,0 +1,254 @@
+"""Practice programs: sequences of tempo and subdivision segments.
+
+A program is a TOML file with optional defaults and a list of segments::
+
+    beats = 4
+    style = "practice"
+
+    [[segment]]
+    bars = 8
+    bpm = 80
+
+    [[segment]]          # ramp: 16 bars at each tempo, 85 -> 140 in steps of 5
+    bars = 16
+    bpm = 85
+    step = 5
+    until = 140
+
+    [[segment]]
+    bars = 8
+    bpm = 140
+    subdivisions = "triplets"
+
+``beats`` and ``subdivisions`` carry over to later segments until changed.
+The whole program is expanded once into a flat click timeline, so playback
+and rendering move from one segment to the next with no gap or restart.
+"""
+
+import math
+import os
+import tomllib
+from array import array
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
+
+from guitarra.clicktrack import (
+    DEFAULT_SAMPLE_RATE,
+    STYLE_VOLUMES,
+    build_clicks,
+    write_click_track,
+)
+from guitarra.patterns import LEVELS, SUBDIVISIONS, standard_pattern
+from guitarra.session import MetronomeSession, SessionStats
+
+
+class Segment(NamedTuple):
+    """A run of bars at a fixed tempo, meter and subdivision."""
+
+    bars: int
+    bpm: float
+    beats: int = 4
+    subdivisions: str = "quarter"
+
+    @property
+    def duration_s(self) -> float:
+        """Length of the segment in seconds."""
+        return self.bars * self.beats * 60.0 / self.bpm
+
+
+def _whole_number(value, name: str, number: int) -> int:
+    """Check a count read from a segment, naming the segment in the error."""
+    if type(value) is not int:
+        raise ValueError(f"Segment {number}: {name} must be a whole number")
+    return value
+
+
+def _number(value, name: str, number: int) -> float:
+    """Check a tempo read from a segment, naming the segment in the error."""
+    if type(value) not in (int, float):
+        raise ValueError(f"Segment {number}: {name} must be a number")
+    return value
+
+
+def _validate(segment: Segment, number: int) -> None:
+    """Check one expanded segment, naming it in the error message."""
+    if segment.bars < 1:
+        raise ValueError(f"Segment {number}: bars must be at least 1")
+    if segment.bpm < 30 or segment.bpm > 300:
+        raise ValueError(f"Segment {number}: BPM must be between 30 and 300")
+    if segment.beats < 1 or segment.beats > 16:
+        raise ValueError(
+            f"Segment {number}: beats per measure must be between 1 and 16"
+        )
+    if segment.subdivisions not in SUBDIVISIONS:
+        raise ValueError(
+            f"Segment {number}: unknown subdivisions: {segment.subdivisions}"
+        )
+
+
+def parse_program(data: dict) -> list[Segment]:
+    """Validate a program and expand its ramps into plain segments.
+
+    Args:
+        data: Parsed program (see module docstring)
+
+    Returns:
+        Segments in playing order
+
+    Raises:
+        ValueError: If the program or any segment is invalid
+    """
+    entries = data.get("segment")
+    if not entries:
+        raise ValueError("Program has no segments")
+    if not isinstance(entries, list):
+        raise ValueError("Program segments must be [[segment]] tables")
+
+    beats = data.get("beats", 4)
+    subdivisions = data.get("subdivisions", "quarter")
+    segments = []
+
+    for number, entry in enumerate(entries, start=1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Segment {number}: must be a table")
+        try:
+            bars = _whole_number(entry["bars"], "bars", number)
+            bpm = _number(entry["bpm"], "bpm", number)
+        except KeyError as e:
+            raise ValueError(f"Segment {number}: missing field: {e.args[0]}")
+        beats = _whole_number(entry.get("beats", beats), "beats", number)
+        subdivisions = entry.get("subdivisions", subdivisions)
+        if not isinstance(subdivisions, str):
+            raise ValueError(f"Segment {number}: subdivisions must be a name")
+
+        step = entry.get("step")
+        if step is None:
+            tempos = [bpm]
+        else:
+            step = _number(step, "step", number)
+            until = entry.get("until")
+            if until is None:
+                raise ValueError(f"Segment {number}: a ramp needs 'until'")
+            until = _number(until, "until", number)
+            if step == 0 or (until - bpm) * step < 0:
+                raise ValueError(
+                    f"Segment {number}: step must move from bpm towards until"
+                )
+            count = math.floor((until - bpm) / step + 1e-9) + 1
+            tempos = [bpm + i * step for i in range(count)]
+
+        for tempo in tempos:
+            segment = Segment(bars, tempo, beats, subdivisions)
+            _validate(segment, number)
+            segments.append(segment)
+
+    return segments
+
+
+def load_program(path: str | os.PathLike[str]) -> tuple[list[Segment], str]:
+    """Load a program file.
+
+    Returns:
+        Expanded segments and the click style
+
+    Raises:
+        ValueError: If the file is not valid TOML or the program is invalid
+    """
+    with open(path, "rb") as f:
+        try:
+            data = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"Invalid program file: {e}")
+
+    style = data.get("style", "practice")
+    if not isinstance(style, str) or style not in STYLE_VOLUMES:
+        raise ValueError(f"Unknown style: {style}")
+    return parse_program(data), style
+
+
+class Timeline:
+    """Every click of a program, precomputed as flat arrays."""
+
+    def __init__(self, segments: list[Segment]):
+        """Expand segments into click times (s) and accent levels.
+
+        Each segment starts exactly where the previous one ends.
+        """
+        self.times = array("d")
+        self.levels = array("B")
+        self.segment_starts = array("d")
+
+        offset = 0.0
+        for segment in segments:
+            per_beat = SUBDIVISIONS[segment.subdivisions]
+            measure = standard_pattern(segment.beats, segment.subdivisions)
+            pattern = measure.levels.tobytes()
+
+            spacing = 60.0 / (segment.bpm * per_beat)
+            self.segment_starts.append(offset)
+            self.times.extend(
+                map(
+                    offset.__add__,
+                    map(spacing.__mul__, range(len(pattern) * segment.bars)),
+                )
+            )
+            self.levels.frombytes(pattern * segment.bars)
+            offset += segment.duration_s
+
+        self.duration_s = offset
+
+    def __len__(self) -> int:
+        """Get the number of clicks."""
+        return len(self.times)
+
+    def level(self, index: int) -> str:
+        """Get the accent level of a click."""
+        return LEVELS[self.levels[index]]
+
+    def events(
+        self, sample_rate: int = DEFAULT_SAMPLE_RATE
+    ) -> Iterator[tuple[int, str]]:
+        """Generate (frame, accent level) for every click."""
+        for time_s, level in zip(self.times, self.levels):
+            yield round(time_s * sample_rate), LEVELS[level]
+
+    def render(
+        self,
+        path: str | os.PathLike[str],
+        style: str = "practice",
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+    ) -> int:
+        """Render the timeline to a WAV file.
+
+        Returns:
+            Number of frames written
+        """
+        total_frames = math.ceil(self.duration_s * sample_rate)
+        write_click_track(
+            path,
+            self.events(sample_rate),
+            total_frames,
+            build_clicks(style, sample_rate),
+            sample_rate,
+        )
+        return total_frames
+
+
+def play(
+    timeline: Timeline,
+    click: Callable[[str], None],
+    session: MetronomeSession | None = None,
+) -> SessionStats:
+    """Play a timeline live, calling `click` with the accent level of each click.
+
+    One scheduler runs the whole timeline against absolute deadlines, so
+    segment changes cost nothing.
+
+    Returns:
+        Timing statistics for the session
+    """
+    session = session or MetronomeSession()
+    return session.run(
+        schedule=timeline.times,
+        on_beat=lambda index: click(timeline.level(index)),
+    )
@@ -0,0 +1,272 @@
+"""Chord progression forms: the 12 bar blues, its variants, or any custom form.
+
+A form is written in Roman numerals, one bar per ``|``-separated field, with
+the chords of a bar separated by spaces::
+
+    I7 | IV7 | I7 | v7 I7 | IV7 | #ivdim7 | I7 | VI7 | ii7 | V7 | I7 VI7 | ii7 V7
+
+Upper case numerals are major chords and lower case numerals minor ones. A
+suffix sets the chord quality (7, maj7, 9, 13, dim7, ...), and ``b`` or ``#``
+before a numeral lowers or raises the degree. Forms are compiled once into
+(semitones, quality) pairs, and every key is read from shared key x semitone
+tables, so no per-key objects are built. Chord roots follow the key
+signature: flats in F or Bb, sharps in A or E.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from guitarra.grid import ChartGrid, serialize
+from guitarra.lookup import NameIndex, describe_unknown
+from guitarra.pitch import FLAT_NAMES, SHARP_NAMES, Note, key_tonic, prefers_flats
+
+# Chord root name for every key (row) and semitone above the key (column),
+# spelled with sharps (first table) and with flats (second table)
+TRANSPOSITION = tuple(
+    tuple(
+        tuple(names[(key + semitones) % 12] for semitones in range(12))
+        for key in range(12)
+    )
+    for names in (SHARP_NAMES, FLAT_NAMES)
+)
+
+# Chord qualities (suffix after the root) and their semitones above the root
+CHORD_QUALITIES = {
+    "": (0, 4, 7),
+    "m": (0, 3, 7),
+    "dim": (0, 3, 6),
+    "aug": (0, 4, 8),
+    "sus2": (0, 2, 7),
+    "sus4": (0, 5, 7),
+    "6": (0, 4, 7, 9),
+    "m6": (0, 3, 7, 9),
+    "7": (0, 4, 7, 10),
+    "m7": (0, 3, 7, 10),
+    "maj7": (0, 4, 7, 11),
+    "mMaj7": (0, 3, 7, 11),
+    "dim7": (0, 3, 6, 9),
+    "m7b5": (0, 3, 6, 10),
+    "7sus4": (0, 5, 7, 10),
+    "7b9": (0, 4, 7, 10, 13),
+    "7#9": (0, 4, 7, 10, 15),
+    "9": (0, 4, 7, 10, 14),
+    "m9": (0, 3, 7, 10, 14),
+    "maj9": (0, 4, 7, 11, 14),
+    "add9": (0, 4, 7, 14),
+    "11": (0, 4, 7, 10, 14, 17),
+    "m11": (0, 3, 7, 10, 14, 17),
+    "13": (0, 4, 7, 10, 14, 21),
+    "m13": (0, 3, 7, 10, 14, 21),
+}
+
+# Semitones above the key for each Roman numeral
+DEGREE_SEMITONES = {"I": 0, "II": 2, "III": 4, "IV": 5, "V": 7, "VI": 9, "VII": 11}
+
+# Semitones added by an accidental before a numeral
+_ACCIDENTALS = {"": 0, "b": -1, "#": 1}
+
+# Qualities that keep their own name on a lower case numeral
+_MINOR_FAMILY = ("dim", "dim7", "m7b5")
+
+_DEGREE_RE = re.compile(r"([b#]?)([IViv]+)(.*)")
+
+# Built-in forms: chart title (with a {root} placeholder) and degrees
+FORMS = {
+    "major": (
+        "12 Bar Blues in {root} major (I-IV-V):",
+        "I | I | I | I | IV | IV | I | I | V | IV | I | I",
+    ),
+    "minor": (
+        "12 Bar Blues in {root} minor (i-iv-V):",
+        "i | i | i | i | iv | iv | i | i | V | iv | i | i",
+    ),
+    "quick_change": (
+        "12 Bar Blues in {root}, quick change (I7-IV7-V7):",
+        "I7 | IV7 | I7 | I7 | IV7 | IV7 | I7 | I7 | V7 | IV7 | I7 | V7",
+    ),
+    "eight_bar": (
+        "8 Bar Blues in {root} (I7-IV7-V7):",
+        "I7 | V7 | IV7 | IV7 | I7 | V7 | I7 | V7",
+    ),
+    "sixteen_bar": (
+        "16 Bar Blues in {root} (I7-IV7-V7):",
+        "I7 | I7 | I7 | I7 | I7 | I7 | I7 | I7 | "
+        "IV7 | IV7 | I7 | I7 | V7 | IV7 | I7 | I7",
+    ),
+    "jazz": (
+        "Jazz Blues in {root}:",
+        "I7 | IV7 | I7 | v7 I7 | IV7 | #ivdim7 | I7 | VI7 | ii7 | V7 | I7 VI7 | ii7 V7",
+    ),
+}
+
+# Other spellings of form names
+FORM_ALIASES = {
+    "12 bar": "major",
+    "minor blues": "minor",
+    "quick": "quick_change",
+    "8 bar": "eight_bar",
+    "16 bar": "sixteen_bar",
+    "jazz blues": "jazz",
+}
+
+# Title of forms given on the command line
+CUSTOM_TITLE = "Progression in {root}:"
+
+
+class ProgressionForm(NamedTuple):
+    """A compiled progression form."""
+
+    name: str
+    title: str
+    degrees: tuple[str, ...]
+    chords: tuple[tuple[tuple[int, str], ...], ...]
+    # Chords of every bar in each of the 12 keys, read from TRANSPOSITION:
+    # spelled with sharps (first table) and with flats (second table)
+    keys: tuple[tuple[tuple[str, ...], ...], ...]
+    # Whether the tonic chord is minor, for the key signature
+    minor: bool = False
+
+    def in_key(self, key: int | Note) -> list[str]:
+        """Get the chords of every bar in a key.
+
+        The key is the pitch class of the tonic, spelled as usual for the
+        key (Bb, not A#), or a tonic note whose spelling picks sharps or
+        flats. Bars with several chords are joined with spaces.
+        """
+        if not isinstance(key, Note):
+            key = key_tonic(key, self.minor)
+        spelled = self.keys[prefers_flats(key, self.minor)][key.pitch_class]
+        return list(spelled)
+
+    def in_all_keys(self) -> list[list[str]]:
+        """Get the chords of every bar in all 12 keys, starting from C."""
+        return [self.in_key(key) for key in range(12)]
+
+    def format_title(self, root: str) -> str:
+        """Format the chart title for a root spelling."""
+        return self.title.format(root=root)
+
+
+def parse_chord_degree(token: str) -> tuple[int, str]:
+    """Parse one Roman-numeral chord such as ``bVII7`` into (semitones, quality).
+
+    Raises:
+        ValueError: If the numeral or quality is not recognized
+    """
+    match = _DEGREE_RE.fullmatch(token)
+    numeral = match.group(2) if match else ""
+    if not (numeral.isupper() or numeral.islower()) or (
+        numeral.upper() not in DEGREE_SEMITONES
+    ):
+        raise ValueError(f"Invalid chord degree: {token}")
+
+    accidental, _, quality = match.groups()
+    if numeral.islower() and quality not in _MINOR_FAMILY:
+        quality = "m" + quality
+    if quality not in CHORD_QUALITIES:
+        raise ValueError(f"Unknown chord quality in {token}")
+
+    semitones = DEGREE_SEMITONES[numeral.upper()] + _ACCIDENTALS[accidental]
+    return semitones % 12, quality
+
+
+def parse_form(
+    text: str, name: str = "custom", title: str = CUSTOM_TITLE
+) -> ProgressionForm:
+    """Compile a form written in Roman numerals (see module docstring).
+
+    Raises:
+        ValueError: If the form is empty or has an invalid chord
+    """
+    bars = [field.split() for field in text.split("|")]
+    if not any(bars) or not all(bars):
+        raise ValueError("Every bar of a progression needs at least one chord")
+
+    chords = tuple(tuple(map(parse_chord_degree, bar)) for bar in bars)
+    keys = tuple(
+        tuple(
+            tuple(
+                " ".join(row[semitones] + quality for semitones, quality in bar)
+                for bar in chords
+            )
+            for row in table
+        )
+        for table in TRANSPOSITION
+    )
+    tonic_quality = chords[0][0][1]
+    return ProgressionForm(
+        name=name,
+        title=title,
+        degrees=tuple(" ".join(bar) for bar in bars),
+        chords=chords,
+        keys=keys,
+        minor=tonic_quality.startswith("m") and not tonic_quality.startswith("maj"),
+    )
+
+
+# Built-in forms and aliases, kept apart from the user catalog
+BUILTIN_FORMS = dict(FORMS)
+BUILTIN_FORM_ALIASES = dict(FORM_ALIASES)
+
+
+@lru_cache(maxsize=1)
+def form_names() -> NameIndex:
+    """Get the lookup index of form names and aliases, built on first use.
+
+    The forms of the user catalog (see guitarra.catalog) are added first.
+    """
+    from guitarra.catalog import user_catalog
+
+    catalog = user_catalog()
+    FORMS.update(catalog.forms)
+    FORM_ALIASES.update(catalog.form_aliases)
+    return NameIndex(FORMS, FORM_ALIASES)
+
+
+def reset_forms() -> None:
+    """Go back to the built-in forms; the catalog is added again on next use."""
+    FORMS.clear()
+    FORMS.update(BUILTIN_FORMS)
+    FORM_ALIASES.clear()
+    FORM_ALIASES.update(BUILTIN_FORM_ALIASES)
+    form_names.cache_clear()
+    get_form.cache_clear()
+
+
+@lru_cache(maxsize=16)
+def get_form(name: str) -> ProgressionForm:
+    """Get a built-in or catalog form by name or alias, compiled on first use.
+
+    Small typos in the name are corrected.
+
+    Raises:
+        ValueError: If there is no form with that name
+    """
+    resolved = form_names().resolve(name)
+    if resolved is None:
+        raise ValueError(describe_unknown("form", name, form_names()))
+    title, text = FORMS[resolved]
+    return parse_form(text, resolved, title)
+
+
+def format_chart(
+    bars: list[str],
+    degrees: list[str] | tuple[str, ...] | None = None,
+    output_format: str = "plain",
+    title: str | None = None,
+) -> str:
+    """Format bars as a chart of four bars per row.
+
+    Args:
+        bars: Chords of each bar
+        degrees: Optional Roman numerals (or other notes, such as voicings)
+            of each bar, shown under the chords
+        output_format: Output format (see guitarra.grid.FORMATS)
+        title: Optional title written with the chart
+
+    Returns:
+        The chart, with a blank line between rows when degrees are shown
+    """
+    grid = ChartGrid(tuple(bars), tuple(degrees) if degrees else None, title)
+    return serialize(grid, output_format)
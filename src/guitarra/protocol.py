@@ -0,0 +1,196 @@
+"""Request dispatch shared by the daemon and batch modes.
+
+Requests are JSON objects with an ``op`` field; responses are JSON objects
+with ``ok`` and either ``output`` or ``error``. Scale, fretboard and blues
+objects are reused across requests, and rendered output goes through the
+shared render cache.
+"""
+
+import json
+from functools import lru_cache
+
+from guitarra.blues import TwelveBarBlues
+from guitarra.cache import render_cache
+from guitarra.grid import TEXT_FORMATS
+from guitarra.identify import format_matches, identify_scales, notes_to_mask
+from guitarra.progressions import get_form, parse_form
+from guitarra.scales import GuitarFretboard, Scale, validate_fret_range
+
+
+@lru_cache(maxsize=64)
+def _get_fretboard(tuning: str | None, capo: int) -> GuitarFretboard:
+    """Get a GuitarFretboard, reusing instances across requests."""
+    return GuitarFretboard(tuning, capo)
+
+
+def _field(request: dict, name: str):
+    """Get a required field of a request.
+
+    Raises:
+        ValueError: If the request has no such field
+    """
+    try:
+        return request[name]
+    except KeyError:
+        raise ValueError(f"Missing field: {name}") from None
+
+
+def _string(request: dict, name: str, required: bool = True) -> str | None:
+    """Get a string field of a request, None if it is optional and missing.
+
+    Raises:
+        ValueError: If a required field is missing or the value is not a string
+    """
+    value = _field(request, name) if required else request.get(name)
+    if not isinstance(value, str) and (required or value is not None):
+        raise ValueError(f"Field {name} must be a string")
+    return value
+
+
+def _integer(request: dict, name: str, default: int) -> int:
+    """Get an optional whole-number field of a request.
+
+    Raises:
+        ValueError: If the value is not a whole number
+    """
+    value = request.get(name, default)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"Field {name} must be a whole number")
+    return value
+
+
+@lru_cache(maxsize=256)
+def _get_scale(root: str, scale_name: str) -> Scale:
+    """Get a Scale, reusing instances across requests."""
+    return Scale(root, scale_name)
+
+
+@lru_cache(maxsize=64)
+def _get_blues(root: str) -> TwelveBarBlues:
+    """Get a TwelveBarBlues, reusing instances across requests."""
+    return TwelveBarBlues(root)
+
+
+def reset_objects() -> None:
+    """Drop the reused objects, which may come from an older catalog."""
+    _get_fretboard.cache_clear()
+    _get_scale.cache_clear()
+    _get_blues.cache_clear()
+
+
+def _scale(request: dict) -> dict:
+    """Render a scale diagram."""
+    start = _integer(request, "start", 0)
+    end = _integer(request, "end", 12)
+    validate_fret_range(start, end)
+    fretboard = _get_fretboard(
+        _string(request, "tuning", required=False), _integer(request, "capo", 0)
+    )
+    output = fretboard.display_scale(
+        _get_scale(_string(request, "root"), _string(request, "scale")),
+        start_fret=start,
+        end_fret=end,
+        show_degrees=bool(request.get("degrees", False)),
+        color=bool(request.get("color", True)),
+        output_format=_string(request, "format", required=False),
+    )
+    return {"output": output}
+
+
+def _blues(request: dict) -> dict:
+    """Render a blues chart in a built-in or custom form."""
+    root = _string(request, "root")
+    blues_gen = _get_blues(root)
+    custom = _string(request, "custom", required=False)
+    if custom:
+        form = parse_form(custom)
+    else:
+        minor = bool(request.get("minor", False))
+        name = _string(request, "form", required=False)
+        form = get_form(name or ("minor" if minor else "major"))
+    progression = blues_gen.get_progression(form)
+    title = blues_gen.format_title(form=form)
+    output_format = _string(request, "format", required=False) or "plain"
+    output = blues_gen.format_progression(
+        progression,
+        show_degrees=bool(request.get("degrees", False)),
+        form=form,
+        output_format=output_format,
+        # Text charts leave the title to the caller
+        title=None if output_format in TEXT_FORMATS else title,
+    )
+    return {"title": title, "output": output}
+
+
+def _identify(request: dict) -> dict:
+    """Look up scales containing a set of notes."""
+    notes = _field(request, "notes")
+    if not isinstance(notes, list) or not all(isinstance(n, str) for n in notes):
+        raise ValueError("Field notes must be a list of strings")
+    matches = identify_scales(notes, exact=bool(request.get("exact", False)))
+    return {
+        "output": format_matches(matches, notes_to_mask(notes)),
+        "matches": [[match.root, match.scale_name] for match in matches],
+    }
+
+
+def _ping(request: dict) -> dict:
+    """Check that the handler is alive."""
+    return {"output": "pong"}
+
+
+def _stats(request: dict) -> dict:
+    """Report render cache counters."""
+    return {"output": render_cache.stats()}
+
+
+HANDLERS = {
+    "scale": _scale,
+    "blues": _blues,
+    "identify": _identify,
+    "ping": _ping,
+    "stats": _stats,
+}
+
+
+def handle_request(request: dict) -> dict:
+    """Handle one request and build its response.
+
+    Errors are reported in the response rather than raised, so one bad request
+    never stops a server or batch stream. Every response carries the ``id`` of
+    its request, if it has one.
+    """
+    if not isinstance(request, dict):
+        return {"ok": False, "error": "Request must be a JSON object"}
+
+    op = request.get("op")
+    handler = HANDLERS.get(op) if isinstance(op, str) else None
+    if handler is None:
+        response = {"ok": False, "error": f"Unknown operation: {op}"}
+    else:
+        try:
+            response = handler(request)
+            response["ok"] = True
+        except (TypeError, ValueError) as e:
+            response = {"ok": False, "error": str(e)}
+        except Exception as e:
+            # Last resort: a handler bug still gets a reply to its request
+            error = f"Internal error: {type(e).__name__} {e}"
+            response = {"ok": False, "error": error}
+
+    if "id" in request:
+        response["id"] = request["id"]
+    return response
+
+
+def handle_line(line: str | bytes) -> dict:
+    """Parse one request line and build its response, never raising.
+
+    Lines that are not valid JSON (including bytes that are not UTF-8, and
+    nesting too deep to parse) get an error response.
+    """
+    try:
+        request = json.loads(line)
+    except (ValueError, RecursionError) as e:
+        return {"ok": False, "error": f"Invalid JSON: {e}"}
+    return handle_request(request)
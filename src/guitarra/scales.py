@@ -1,13 +1,145 @@
 """Guitar scale definitions and fretboard display functionality."""
 
-import typer
+from functools import lru_cache
+
+from guitarra.cache import render_cache
+from guitarra.grid import FretboardGrid, Label, serialize
+from guitarra.lookup import NameIndex, describe_unknown
+from guitarra.pitch import (
+    NOTE_NAMES,
+    SHARP_NAMES,
+    Note,
+    find_note,
+    key_tonic,
+    parse_root,
+    pitch_class,
+    spell_scale,
+)
+
+# Bit mask covering all 12 pitch classes
+FULL_MASK = 0xFFF
+
+# Other note spellings: words and Unicode accidentals
+NOTE_ALIASES = {
+    f"{name[0]}{suffix}": name
+    for name in NOTE_NAMES
+    if len(name) == 2
+    for suffix in ((" sharp", "\u266f") if name.endswith("#") else (" flat", "\u266d"))
+}
+
+
+@lru_cache(maxsize=1)
+def note_names() -> NameIndex:
+    """Get the completion index of note spellings, built on first use.
+
+    Notes are resolved through guitarra.pitch; this index only ranks the
+    spellings offered while typing.
+    """
+    return NameIndex(NOTE_NAMES, NOTE_ALIASES)
+
+
+def normalize_note(note: str) -> str | None:
+    """Get the chromatic (sharp) name of a note spelling, or None if invalid."""
+    found = find_note(note)
+    return None if found is None else SHARP_NAMES[found.pitch_class]
+
+
+def note_index(note: str) -> int:
+    """Get the pitch class (0-11, C = 0) of a note name.
+
+    Raises:
+        ValueError: If the note name is not recognized
+    """
+    return pitch_class(note)
+
+
+# Widest fret range shown (frets above the start fret)
+MAX_FRET_SPAN = 36
+
+# Highest fret a capo can be put on
+MAX_CAPO_FRET = 24
+
+# Widest range shown as one diagram; wider ones are split into pages
+SINGLE_PAGE_SPAN = 24
+
+# Frets per page of a split range
+PAGE_FRETS = 13
+
+
+def validate_fret_range(start: int, end: int, max_span: int = MAX_FRET_SPAN) -> None:
+    """Check that a fret range can be displayed.
+
+    Raises:
+        ValueError: If the range is negative, reversed or too wide
+    """
+    if start < 0 or end < 0:
+        raise ValueError("Fret positions must be non-negative")
+    if start > end:
+        raise ValueError("Start fret must be less than or equal to end fret")
+    if end - start > max_span:
+        raise ValueError(f"Fret range too large (max {max_span} frets)")
+
+
+def fret_pages(start: int, end: int, page_frets: int = 0) -> list[tuple[int, int]]:
+    """Split a fret range into the (start, end) ranges of its pages.
+
+    Args:
+        start: First fret
+        end: Last fret
+        page_frets: Frets per page; 0 splits only ranges wider than
+            SINGLE_PAGE_SPAN, into pages of PAGE_FRETS
+
+    Raises:
+        ValueError: If page_frets is negative
+    """
+    if page_frets < 0:
+        raise ValueError("Frets per page must be positive")
+    if not page_frets:
+        if end - start <= SINGLE_PAGE_SPAN:
+            return [(start, end)]
+        page_frets = PAGE_FRETS
+    return [
+        (first, min(first + page_frets - 1, end))
+        for first in range(start, end + 1, page_frets)
+    ]
+
+
+def intervals_to_mask(intervals: list[int]) -> int:
+    """Convert semitone intervals into a 12-bit pitch-class set.
+
+    Bit ``n`` is set when pitch class ``n`` (relative to the root) is present.
+    """
+    mask = 0
+    for interval in intervals:
+        mask |= 1 << (interval % 12)
+    return mask
+
+
+def rotate_mask(mask: int, semitones: int) -> int:
+    """Transpose a pitch-class set up by the given number of semitones."""
+    semitones %= 12
+    return ((mask << semitones) | (mask >> (12 - semitones))) & FULL_MASK
+
+
+def is_minor_mask(mask: int) -> bool:
+    """Check whether a pitch-class set rooted on C has a minor but no major third."""
+    return mask & 0b11000 == 0b01000
+
+
+def mask_to_pitch_classes(mask: int, start: int = 0) -> list[int]:
+    """List the pitch classes in a set, in ascending order from `start`."""
+    return [
+        (start + offset) % 12
+        for offset in range(12)
+        if mask >> ((start + offset) % 12) & 1
+    ]
 
 
 class Scale:
     """Base class for musical scales."""
 
     # Chromatic note progression
-    CHROMATIC = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+    CHROMATIC = list(SHARP_NAMES)
 
     # Scale interval patterns (semitones from root)
     SCALE_PATTERNS = {
@@ -26,68 +158,305 @@ class Scale:
         "melodic_minor": [0, 2, 3, 5, 7, 9, 11],
     }
 
+    # Other spellings of scale names
+    SCALE_ALIASES = {
+        "ionian": "major",
+        "natural minor": "minor",
+        "major pentatonic": "pentatonic_major",
+        "minor pentatonic": "pentatonic_minor",
+        "mixo": "mixolydian",
+        "harm min": "harmonic_minor",
+        "mel min": "melodic_minor",
+        "jazz minor": "melodic_minor",
+    }
+
+    # Pitch-class sets of each pattern, rooted on C
+    SCALE_MASKS = {
+        name: intervals_to_mask(pattern) for name, pattern in SCALE_PATTERNS.items()
+    }
+
+    # Lookup index of scale names and aliases, built on first use
+    _name_index: NameIndex | None = None
+
+    # Built-in patterns and aliases, saved when the user catalog is added
+    _builtins: tuple[dict, dict] | None = None
+
     def __init__(self, root: str, scale_name: str):
         """Initialize with root note and scale name.
 
         Args:
             root: Root note (e.g., 'A', 'C#', 'Bb')
-            scale_name: Name of the scale
+            scale_name: Name or alias of the scale (small typos are corrected)
         """
-        self.root = self._normalize_root(root)
-        self.scale_name = scale_name.lower()
-        self.root_index = self._get_root_index()
-
-        if self.scale_name not in self.SCALE_PATTERNS:
-            raise ValueError(f"Unknown scale: {scale_name}")
-
-    def _normalize_root(self, root: str) -> str:
-        """Normalize root note notation."""
-        root = root.upper()
-        # Convert flat notation to sharp
-        flat_to_sharp = {"DB": "C#", "EB": "D#", "GB": "F#", "AB": "G#", "BB": "A#"}
-        return flat_to_sharp.get(root, root)
-
-    def _get_root_index(self) -> int:
-        """Get chromatic index of root note."""
-        try:
-            return self.CHROMATIC.index(self.root)
-        except ValueError:
-            raise ValueError(f"Invalid root note: {self.root}")
+        self.note = parse_root(root)
+        self.root = self.note.name
+        self.root_index = self.note.pitch_class
+
+        index = self.name_index()
+        name = index.resolve(scale_name)
+        if name is None:
+            raise ValueError(describe_unknown("scale", scale_name, index))
+        self.scale_name = name
+
+        self.mask = rotate_mask(self.SCALE_MASKS[self.scale_name], self.root_index)
+        self._notes = _spell_scale(self.mask, self.note)
+
+    def __contains__(self, note: str | int) -> bool:
+        """Check whether a note name or pitch class belongs to the scale."""
+        if isinstance(note, str):
+            try:
+                note = note_index(note)
+            except ValueError:
+                return False
+        return bool(self.mask >> (note % 12) & 1)
 
     def get_scale_notes(self) -> list[str]:
         """Get all notes in the scale."""
-        pattern = self.SCALE_PATTERNS[self.scale_name]
-        return [
-            self.CHROMATIC[(self.root_index + interval) % 12] for interval in pattern
-        ]
+        return list(self._notes)
 
     def get_scale_degrees(self) -> list[int]:
         """Get scale degrees (1-based)."""
-        pattern = self.SCALE_PATTERNS[self.scale_name]
-        return [i + 1 for i in range(len(pattern))]
+        return list(range(1, len(self._notes) + 1))
+
+    def transpose(self, semitones: int) -> "Scale":
+        """Get the same scale moved up by the given number of semitones."""
+        minor = is_minor_mask(self.SCALE_MASKS[self.scale_name])
+        return Scale(
+            key_tonic(self.root_index + semitones, minor).name, self.scale_name
+        )
+
+    def intersection(self, other: "Scale") -> int:
+        """Get the pitch-class set shared with another scale."""
+        return self.mask & other.mask
+
+    def has_same_notes(self, other: "Scale") -> bool:
+        """Check whether another scale contains exactly the same pitch classes."""
+        return self.mask == other.mask
 
     @classmethod
     def get_available_scales(cls) -> list[str]:
-        """Get list of available scale names."""
+        """Get list of available scale names, user catalog included."""
+        cls.name_index()
         return list(cls.SCALE_PATTERNS.keys())
 
+    @classmethod
+    def name_index(cls) -> NameIndex:
+        """Get the lookup index of scale names and aliases.
+
+        The scales of the user catalog (see guitarra.catalog) are added when
+        the index is first built.
+        """
+        if cls._name_index is None:
+            cls._add_catalog()
+            cls._name_index = NameIndex(cls.SCALE_PATTERNS, cls.SCALE_ALIASES)
+        return cls._name_index
+
+    @classmethod
+    def _add_catalog(cls) -> None:
+        """Add the scales of the user catalog to the built-in ones."""
+        from guitarra.catalog import user_catalog
+
+        catalog = user_catalog()
+        if cls._builtins is None:
+            cls._builtins = (dict(cls.SCALE_PATTERNS), dict(cls.SCALE_ALIASES))
+        for name, (intervals, mask) in catalog.scales.items():
+            cls.SCALE_PATTERNS[name] = intervals
+            cls.SCALE_MASKS[name] = mask
+        cls.SCALE_ALIASES.update(catalog.scale_aliases)
+
+    @classmethod
+    def reset_catalog(cls) -> None:
+        """Go back to the built-in scales; the catalog is added again on next use."""
+        if cls._builtins is not None:
+            patterns, aliases = cls._builtins
+            cls.SCALE_PATTERNS.clear()
+            cls.SCALE_PATTERNS.update(patterns)
+            cls.SCALE_MASKS.clear()
+            cls.SCALE_MASKS.update(
+                (name, intervals_to_mask(pattern)) for name, pattern in patterns.items()
+            )
+            cls.SCALE_ALIASES.clear()
+            cls.SCALE_ALIASES.update(aliases)
+        cls._name_index = None
+
+
+@lru_cache(maxsize=512)
+def _spell_scale(mask: int, tonic: Note) -> tuple[str, ...]:
+    """Get the note names of a scale in its key, from the tonic up."""
+    return spell_scale(tonic, mask_to_pitch_classes(mask, tonic.pitch_class))
+
+
+@lru_cache(maxsize=512)
+def _scale_labels(
+    mask: int, tonic: Note, show_degrees: bool
+) -> tuple[Label | None, ...]:
+    """Get the label of each pitch class of a scale (None outside the scale)."""
+    labels: list[Label | None] = [None] * 12
+    pitch_classes = mask_to_pitch_classes(mask, tonic.pitch_class)
+    names = _spell_scale(mask, tonic)
+    for degree, (pc, name) in enumerate(zip(pitch_classes, names), start=1):
+        text = str(degree) if show_degrees else name
+        labels[pc] = Label(text, pc == tonic.pitch_class)
+    return tuple(labels)
+
 
 class GuitarFretboard:
-    """Guitar fretboard display and scale visualization."""
+    """Fretboard display and scale visualization, for any tuning and capo.
+
+    Guitars of any number of strings, basses and alternate tunings are all
+    tunings: open string notes, low to high.
+    """
 
     # Standard guitar tuning (low to high)
     STANDARD_TUNING = ["E", "A", "D", "G", "B", "E"]
 
-    def __init__(self):
-        """Initialize guitar fretboard."""
-        self.tuning = self.STANDARD_TUNING.copy()
+    # Number of frets covered by a freshly built pitch-class matrix
+    DEFAULT_MATRIX_FRETS = MAX_FRET_SPAN + 1
+
+    # Tunings by name; the tunings of the user catalog are added on first use
+    TUNINGS = {
+        "standard": STANDARD_TUNING,
+        "drop_d": ["D", "A", "D", "G", "B", "E"],
+        "drop_c": ["C", "G", "C", "F", "A", "D"],
+        "half_step_down": ["Eb", "Ab", "Db", "Gb", "Bb", "Eb"],
+        "dadgad": ["D", "A", "D", "G", "A", "D"],
+        "open_d": ["D", "A", "D", "F#", "A", "D"],
+        "open_e": ["E", "B", "E", "G#", "B", "E"],
+        "open_g": ["D", "G", "D", "G", "B", "D"],
+        "open_a": ["E", "A", "E", "A", "C#", "E"],
+        "baritone": ["B", "E", "A", "D", "F#", "B"],
+        "seven_string": ["B", "E", "A", "D", "G", "B", "E"],
+        "drop_a_seven_string": ["A", "E", "A", "D", "G", "B", "E"],
+        "eight_string": ["F#", "B", "E", "A", "D", "G", "B", "E"],
+        "bass": ["E", "A", "D", "G"],
+        "five_string_bass": ["B", "E", "A", "D", "G"],
+        "six_string_bass": ["B", "E", "A", "D", "G", "C"],
+        "drop_d_bass": ["D", "A", "D", "G"],
+    }
+
+    # Lookup index of tuning names, built on first use
+    _tuning_index: NameIndex | None = None
+
+    # Built-in tunings, saved when the user catalog is added
+    _builtin_tunings: dict[str, list[str]] | None = None
+
+    # Pitch-class matrices (strings x frets) shared by every fretboard per
+    # tuning and capo
+    _matrix_cache: dict[tuple, tuple[tuple[int, ...], ...]] = {}
+
+    def __init__(self, tuning: str | list[str] | None = None, capo: int = 0):
+        """Initialize the fretboard.
+
+        Args:
+            tuning: Tuning name (see TUNINGS), notes separated by spaces or
+                commas, or a list of open string notes, low to high
+                (standard tuning by default)
+            capo: Fret of the capo; frets are counted from the capo
+
+        Raises:
+            ValueError: If the tuning or capo is invalid
+        """
+        if tuning is None:
+            self.tuning = self.STANDARD_TUNING.copy()
+        elif isinstance(tuning, str):
+            self.tuning = self.get_tuning(tuning)
+        else:
+            self.tuning = list(tuning)
+        if not self.tuning:
+            raise ValueError("A tuning needs at least one string")
+        if not 0 <= capo <= MAX_CAPO_FRET:
+            raise ValueError(f"Capo must be on frets 0-{MAX_CAPO_FRET}")
+        self.capo = capo
         self.chromatic = Scale.CHROMATIC
+        self.matrix = self._get_matrix(self.DEFAULT_MATRIX_FRETS)
+
+    @classmethod
+    def get_tuning(cls, name: str) -> list[str]:
+        """Get the open string notes of a tuning, low to high.
+
+        Args:
+            name: Tuning name, or notes separated by spaces or commas
+
+        Raises:
+            ValueError: If there is no tuning with that name
+        """
+        notes = [find_note(note) for note in name.replace(",", " ").split()]
+        if len(notes) > 1 and all(notes):
+            return [note.name for note in notes]
+        index = cls.tuning_index()
+        resolved = index.resolve(name)
+        if resolved is None:
+            raise ValueError(describe_unknown("tuning", name, index))
+        return list(cls.TUNINGS[resolved])
+
+    @classmethod
+    def tuning_index(cls) -> NameIndex:
+        """Get the lookup index of tuning names, user catalog included."""
+        if cls._tuning_index is None:
+            from guitarra.catalog import user_catalog
+
+            if cls._builtin_tunings is None:
+                cls._builtin_tunings = dict(cls.TUNINGS)
+            cls.TUNINGS.update(user_catalog().tunings)
+            cls._tuning_index = NameIndex(cls.TUNINGS)
+        return cls._tuning_index
+
+    @classmethod
+    def reset_catalog(cls) -> None:
+        """Go back to the built-in tunings; the catalog is added again on next use."""
+        if cls._builtin_tunings is not None:
+            cls.TUNINGS.clear()
+            cls.TUNINGS.update(cls._builtin_tunings)
+        cls._tuning_index = None
+
+    def _get_matrix(self, frets: int) -> tuple[tuple[int, ...], ...]:
+        """Get the pitch-class matrix for this tuning covering at least `frets`.
+
+        The matrix is built once per tuning and capo and shared between
+        instances. It is only rebuilt (wider) when a render asks for frets
+        beyond its width.
+        """
+        key = (tuple(self.tuning), self.capo)
+        matrix = self._matrix_cache.get(key)
+        if matrix is None or len(matrix[0]) < frets:
+            open_indices = [note_index(note) + self.capo for note in self.tuning]
+            matrix = tuple(
+                tuple((open_index + fret) % 12 for fret in range(frets))
+                for open_index in open_indices
+            )
+            self._matrix_cache[key] = matrix
+        return matrix
 
     def _get_note_at_fret(self, string_index: int, fret: int) -> str:
         """Get note at specified string and fret."""
-        open_note = self.tuning[string_index]
-        open_index = self.chromatic.index(open_note)
-        return self.chromatic[(open_index + fret) % 12]
+        return self.chromatic[(self.matrix[string_index][0] + fret) % 12]
+
+    def scale_grid(
+        self,
+        scale: Scale,
+        start_fret: int = 0,
+        end_fret: int = 12,
+        show_degrees: bool = False,
+    ) -> FretboardGrid:
+        """Build the grid model of a scale diagram.
+
+        Rows are slices of the pitch-class matrix, so each fret indexes the
+        label of its pitch class (None outside the scale).
+        """
+        matrix = self._get_matrix(end_fret + 1)
+        capo = f", Capo {self.capo}" if self.capo else ""
+        scale_name_formatted = scale.scale_name.replace("_", " ").title()
+        strings = range(len(self.tuning) - 1, -1, -1)
+        return FretboardGrid(
+            title=(
+                f"{scale.root} {scale_name_formatted} Scale "
+                f"(Frets {start_fret}-{end_fret}{capo}):"
+            ),
+            strings=tuple(self.tuning[string] for string in strings),
+            start_fret=start_fret,
+            rows=tuple(matrix[string][start_fret : end_fret + 1] for string in strings),
+            labels=_scale_labels(scale.mask, scale.note, show_degrees),
+        )
 
     def display_scale(
         self,
@@ -95,80 +464,55 @@ class GuitarFretboard:
         start_fret: int = 0,
         end_fret: int = 12,
         show_degrees: bool = False,
+        color: bool = True,
+        output_format: str | None = None,
     ) -> str:
         """Display scale on guitar fretboard.
 
+        Renders are memoized in the shared render cache.
+
         Args:
             scale: Scale object to display
             start_fret: Starting fret position
             end_fret: Ending fret position
             show_degrees: Show scale degrees instead of note names
+            color: Highlight root notes with ANSI colors
+            output_format: Output format (see guitarra.grid.FORMATS); by
+                default ``ansi``, or ``plain`` without color
 
         Returns:
-            ASCII representation of the fretboard with scale notes
+            The fretboard with scale notes, ASCII by default
         """
-        scale_notes = scale.get_scale_notes()
-        scale_degrees = scale.get_scale_degrees()
-
-        # Create note to degree mapping
-        note_to_degree = dict(zip(scale_notes, scale_degrees))
-
-        lines = []
-
-        # Add header
-        scale_name_formatted = scale.scale_name.replace("_", " ").title()
-        lines.append(
-            f"{scale.root} {scale_name_formatted} Scale "
-            f"(Frets {start_fret}-{end_fret}):"
+        output_format = output_format or ("ansi" if color else "plain")
+        key = (
+            "scale",
+            scale.root,
+            scale.scale_name,
+            # Catalog scales can change their notes under the same name
+            scale.mask,
+            tuple(self.tuning),
+            self.capo,
+            start_fret,
+            end_fret,
+            show_degrees,
+            output_format,
         )
-        lines.append("")
-
-        # Build fretboard representation
-        for string_index in reversed(range(len(self.tuning))):
-            string_name = self.tuning[string_index]
-            line = f"{string_name}|"
-
-            for fret in range(start_fret, end_fret + 1):
-                note = self._get_note_at_fret(string_index, fret)
-
-                if note in scale_notes:
-                    if show_degrees:
-                        degree = note_to_degree[note]
-                        display_char = str(degree)
-                    else:
-                        display_char = note
-
-                    # Check if this is the root note and apply red color
-                    if note == scale.root:
-                        if len(display_char) == 1:
-                            colored_display = typer.style(
-                                f"-{display_char}-", fg=typer.colors.RED
-                            )
-                        else:
-                            colored_display = typer.style(
-                                f"{display_char}-", fg=typer.colors.RED
-                            )
-                        line += colored_display
-                    else:
-                        # Format to ensure consistent width
-                        if len(display_char) == 1:
-                            line += f"-{display_char}-"
-                        else:
-                            line += f"{display_char}-"
-                else:
-                    line += "---"
-
-            lines.append(line)
-
-        # Add fret numbers
-        fret_line = "  "
-        for fret in range(start_fret, end_fret + 1):
-            fret_str = str(fret)
-            if len(fret_str) == 1:
-                fret_line += f" {fret_str} "
-            else:
-                fret_line += f"{fret_str} "
-
-        lines.append(fret_line)
-
-        return "\n".join(lines)
+        return render_cache.get_or_render(
+            key,
+            lambda: self._render_scale(
+                scale, start_fret, end_fret, show_degrees, color, output_format
+            ),
+        )
+
+    def _render_scale(
+        self,
+        scale: Scale,
+        start_fret: int,
+        end_fret: int,
+        show_degrees: bool,
+        color: bool,
+        output_format: str | None = None,
+    ) -> str:
+        """Render a scale diagram without consulting the cache."""
+        grid = self.scale_grid(scale, start_fret, end_fret, show_degrees)
+        return serialize(grid, output_format or ("ansi" if color else "plain"))
@@ -0,0 +1,106 @@
+"""Warm daemon answering render requests over a Unix domain socket.
+
+The protocol is line-delimited JSON: each request line gets exactly one
+response line (see guitarra.protocol). Many clients can be connected at once.
+"""
+
+import asyncio
+import json
+import os
+import socket
+
+from guitarra.catalog import refresh_catalog
+from guitarra.protocol import handle_line
+
+# Longest request line accepted, in bytes
+LINE_LIMIT = 64 * 1024
+
+
+async def _discard_line(reader: asyncio.StreamReader) -> None:
+    """Skip the rest of an over-long line, up to and including its newline."""
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as e:
+            await reader.readexactly(e.consumed)
+
+
+async def _handle_client(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Answer requests from one client until it disconnects.
+
+    Invalid lines (not JSON, not UTF-8, or longer than LINE_LIMIT) get an
+    error response and the connection stays open.
+    """
+    try:
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                # Last line without a newline, or end of stream
+                line = e.partial
+                if not line:
+                    break
+            except asyncio.LimitOverrunError:
+                await _discard_line(reader)
+                line = None
+
+            if line is None:
+                response = {
+                    "ok": False,
+                    "error": f"Request line too long (max {LINE_LIMIT} bytes)",
+                }
+            else:
+                # Pick up catalog files edited while the daemon runs
+                refresh_catalog()
+                response = handle_line(line)
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+def is_serving(path: str) -> bool:
+    """Check whether a daemon is accepting connections on the socket at `path`."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+async def serve(path: str, ready: asyncio.Event | None = None) -> None:
+    """Serve requests on the Unix socket at `path` until cancelled.
+
+    A stale socket file left by a previous daemon is replaced, but a socket a
+    running daemon still answers on is left alone. The socket file is removed
+    on shutdown.
+
+    Args:
+        path: Socket path
+        ready: Optional event set once the socket is accepting connections
+
+    Raises:
+        FileExistsError: If a daemon is already serving on `path`
+    """
+    if os.path.exists(path):
+        if is_serving(path):
+            raise FileExistsError(f"A daemon is already serving on {path}")
+        os.unlink(path)
+
+    server = await asyncio.start_unix_server(
+        _handle_client, path=path, limit=LINE_LIMIT
+    )
+    try:
+        async with server:
+            if ready is not None:
+                ready.set()
+            await server.serve_forever()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
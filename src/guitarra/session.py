@@ -0,0 +1,251 @@
+"""Drift-free metronome session scheduler.
+
+The scheduler sleeps until absolute beat deadlines (start + n * period) on a
+monotonic clock, so lateness on one beat never shifts later beats. It blocks
+on an event rather than polling, waking once per beat, and records how late
+each wake-up was.
+
+The statistics describe the scheduler's own wake-ups, not the audio: sound
+from metronome_rs is timed by the audio engine, which the scheduler neither
+drives nor observes.
+"""
+
+import itertools
+import math
+import queue
+import signal
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+
+class SessionStats(NamedTuple):
+    """Wake-up timing statistics of a metronome session (times in milliseconds).
+
+    Jitter is how late the scheduler woke up for each beat, and drift the trend
+    of that lateness over the session.
+    """
+
+    beats: int
+    missed_beats: int
+    elapsed_s: float
+    mean_jitter_ms: float
+    stdev_jitter_ms: float
+    max_jitter_ms: float
+    drift_ms_per_min: float
+
+    def format(self) -> str:
+        """Format the statistics as a short report."""
+        return "\n".join(
+            [
+                f"Beats: {self.beats} ({self.missed_beats} missed)",
+                f"Elapsed: {self.elapsed_s:.1f}s",
+                f"Wake-up jitter: mean {self.mean_jitter_ms:.3f} ms, "
+                f"stdev {self.stdev_jitter_ms:.3f} ms, "
+                f"max {self.max_jitter_ms:.3f} ms",
+                f"Wake-up drift: {self.drift_ms_per_min:+.3f} ms/min",
+            ]
+        )
+
+
+class ClickPlayer:
+    """Sounds clicks on one long-lived worker thread, fed by a queue.
+
+    Calling the player only queues the click's frequency, looked up in a
+    table built once, so the scheduler does no other work per click. When
+    clicks arrive faster than they sound, the worker plays the newest and drops
+    the stale ones rather than falling behind.
+    """
+
+    def __init__(self, beep: Callable[[float], None], frequencies: dict[str, float]):
+        """Start the worker.
+
+        Args:
+            beep: Sounds one click at a frequency in Hz (blocking is fine)
+            frequencies: Frequency of each accent level
+        """
+        self._beep = beep
+        self._frequencies = frequencies
+        self._queue: queue.SimpleQueue[float | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._work, daemon=True)
+        self._thread.start()
+
+    def __call__(self, level: str) -> None:
+        """Queue one click of an accent level."""
+        self._queue.put(self._frequencies[level])
+
+    def close(self) -> None:
+        """Stop the worker once the queued click (if any) has sounded."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _work(self) -> None:
+        """Sound queued clicks until closed."""
+        closed = False
+        while not closed:
+            frequency = self._queue.get()
+            # Skip to the newest click when several are waiting
+            while frequency is not None and not self._queue.empty():
+                newer = self._queue.get()
+                if newer is None:
+                    closed = True
+                    break
+                frequency = newer
+            if frequency is None:
+                return
+            self._beep(frequency)
+
+
+class MetronomeSession:
+    """Beat scheduler for a running metronome."""
+
+    def __init__(
+        self,
+        bpm: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], bool] | None = None,
+    ):
+        """Initialize the session.
+
+        Args:
+            bpm: Beats per minute of a steady metronome (omit when running an
+                explicit schedule)
+            clock: Monotonic clock returning seconds
+            sleep: Waits up to the given seconds, returning True if the
+                session was stopped meanwhile (by default waits on the stop
+                event, so stop() wakes it at once)
+        """
+        if bpm is not None and bpm <= 0:
+            raise ValueError("BPM must be positive")
+        self.period = 60.0 / bpm if bpm else None
+        self.clock = clock
+        self._stop = threading.Event()
+        self.sleep = sleep or self._stop.wait
+
+        # Running sums for mean/stdev of lateness and its linear trend
+        self._beats = 0
+        self._missed = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._max = 0.0
+        self._sum_t = 0.0
+        self._sum_tt = 0.0
+        self._sum_tl = 0.0
+        self._elapsed = 0.0
+
+    def stop(self) -> None:
+        """Ask a running session to finish (safe from signal handlers)."""
+        self._stop.set()
+
+    def run(
+        self,
+        duration: float | None = None,
+        on_beat: Callable[[int], None] | None = None,
+        schedule: Iterable[float] | None = None,
+        start: float | None = None,
+    ) -> SessionStats:
+        """Run until stopped, interrupted with Ctrl+C, or `duration` elapses.
+
+        While running in the main thread, SIGINT stops the session instead of
+        raising KeyboardInterrupt, so the statistics are always returned.
+
+        Args:
+            duration: Optional length of the session in seconds
+            on_beat: Optional callback invoked on each beat, with the beat
+                number (steady metronome) or the index into `schedule`
+            schedule: Beat offsets in seconds from the start, in ascending
+                order; a session with a schedule ends after its last beat
+            start: Clock time that beat offsets count from (default: now),
+                for sessions aligned to a shared timeline
+
+        Returns:
+            Timing statistics for the session
+        """
+        if schedule is not None:
+            deadlines = enumerate(schedule)
+        elif self.period is not None:
+            deadlines = ((beat, beat * self.period) for beat in itertools.count(1))
+        else:
+            raise ValueError("Either a BPM or a schedule is required")
+
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(
+                signal.SIGINT, lambda signum, frame: self.stop()
+            )
+
+        try:
+            self._run(deadlines, duration, on_beat, start)
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
+        return self.stats()
+
+    def _run(
+        self,
+        deadlines: Iterable[tuple[int, float]],
+        duration: float | None,
+        on_beat: Callable[[int], None] | None,
+        start: float | None = None,
+    ) -> None:
+        """Wait on each beat deadline in turn and record its lateness."""
+        if start is None:
+            start = self.clock()
+        end = start + duration if duration else math.inf
+        resumed = -math.inf
+
+        for beat, offset in deadlines:
+            deadline = start + offset
+            if deadline > end:
+                self.sleep(max(end - self.clock(), 0))
+                break
+            # Skip deadlines that passed while handling the previous beat
+            # rather than bunching beats together
+            if deadline <= resumed:
+                self._missed += 1
+                continue
+            if self.sleep(max(deadline - self.clock(), 0)):
+                break
+
+            now = self.clock()
+            self._record(now - deadline, offset)
+            if on_beat is not None:
+                on_beat(beat)
+            resumed = self.clock()
+
+        self._elapsed = self.clock() - start
+
+    def _record(self, lateness: float, offset: float) -> None:
+        """Add one beat's lateness (s) at `offset` seconds into the session."""
+        self._beats += 1
+        self._sum += lateness
+        self._sum_sq += lateness * lateness
+        self._max = max(self._max, lateness)
+        self._sum_t += offset
+        self._sum_tt += offset * offset
+        self._sum_tl += offset * lateness
+
+    def stats(self) -> SessionStats:
+        """Get the statistics recorded so far."""
+        n = self._beats
+        mean = self._sum / n if n else 0.0
+        variance = max(self._sum_sq / n - mean * mean, 0.0) if n else 0.0
+
+        # Least-squares slope of lateness over time: seconds of lateness per second
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        slope = (
+            (n * self._sum_tl - self._sum_t * self._sum) / denominator
+            if n > 1 and denominator
+            else 0.0
+        )
+
+        return SessionStats(
+            beats=n,
+            missed_beats=self._missed,
+            elapsed_s=self._elapsed,
+            mean_jitter_ms=mean * 1e3,
+            stdev_jitter_ms=math.sqrt(variance) * 1e3,
+            max_jitter_ms=self._max * 1e3,
+            drift_ms_per_min=slope * 60e3,
+        )
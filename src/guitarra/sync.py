@@ -0,0 +1,431 @@
+"""Synchronized metronome across processes and machines over UDP.
+
+One process serves a beat timeline: tempo, meter, pattern and the time of the
+first beat on its own monotonic clock. Clients estimate the offset between
+their clock and the server's with NTP-style round trips, then schedule every
+click against the server's clock, so all members click together without
+streaming audio. Offsets are re-estimated while playing to follow clock drift.
+
+Messages are single JSON datagrams with an ``op`` field:
+
+    {"op": "time", "t0": ...}        -> {"op": "time", "t0", "t1", "t2"}
+    {"op": "join"}                   -> {"op": "timeline", "bpm", "beats",
+                                         "subdivisions", "pattern", "start"}
+    {"op": "report", "offset_ms", "delay_ms", "jitter_ms", ...}  (no reply)
+"""
+
+import json
+import math
+import socket
+import statistics
+import threading
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+from guitarra.patterns import ClickPattern, compile_pattern, standard_pattern
+from guitarra.session import MetronomeSession, SessionStats
+
+DEFAULT_SYNC_PORT = 47800
+
+# Round trips per offset estimate
+DEFAULT_SAMPLES = 16
+
+# Seconds to wait for each reply from the server
+DEFAULT_TIMEOUT = 0.5
+
+# Seconds between the server starting and its first beat, giving clients
+# time to join before the timeline begins
+START_LEAD_S = 1.0
+
+# Seconds between offset re-estimates while playing
+RESYNC_INTERVAL_S = 10.0
+
+# Largest datagram accepted
+MAX_DATAGRAM = 2048
+
+# Interface the server listens on unless told otherwise (this machine only)
+DEFAULT_HOST = "127.0.0.1"
+
+# Fields a client report may carry, and their types
+REPORT_FIELDS = {
+    "offset_ms": float,
+    "delay_ms": float,
+    "jitter_ms": float,
+    "beats": int,
+    "missed_beats": int,
+    "beat_jitter_ms": float,
+}
+
+
+class ClockEstimate(NamedTuple):
+    """Estimated offset of the server clock relative to the local clock."""
+
+    offset_s: float
+    delay_s: float
+    jitter_s: float
+    samples: int
+
+    def format(self) -> str:
+        """Format the estimate as a one-line report."""
+        return (
+            f"Clock offset {self.offset_s * 1e3:+.3f} ms "
+            f"(round trip {self.delay_s * 1e3:.3f} ms, "
+            f"jitter {self.jitter_s * 1e3:.3f} ms, {self.samples} samples)"
+        )
+
+
+def combine_samples(samples: list[tuple[float, float]]) -> ClockEstimate:
+    """Combine (offset, round-trip delay) samples into one estimate.
+
+    The offset is taken from the fastest round trips, which are least affected
+    by queueing. Jitter is the spread of the offsets of those round trips.
+    """
+    if not samples:
+        raise ValueError("No clock samples")
+    best = sorted(samples, key=lambda sample: sample[1])[: max(len(samples) // 4, 1)]
+    offsets = [offset for offset, _ in best]
+    return ClockEstimate(
+        offset_s=statistics.median(offsets),
+        delay_s=best[0][1],
+        jitter_s=statistics.pstdev(offsets),
+        samples=len(samples),
+    )
+
+
+def timeline_pattern(timeline: dict) -> ClickPattern:
+    """Get the compiled click pattern announced in a timeline."""
+    if timeline.get("pattern"):
+        return compile_pattern(timeline["pattern"], timeline["subdivisions"])
+    return standard_pattern(timeline["beats"], timeline["subdivisions"])
+
+
+def check_report(report: dict) -> dict | None:
+    """Get the known fields of a client report, or None if one is malformed.
+
+    Floats must be finite numbers and counts whole numbers; unknown fields
+    are dropped.
+    """
+    checked = {}
+    for name, kind in REPORT_FIELDS.items():
+        if name not in report:
+            continue
+        value = report[name]
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        if kind is int:
+            if not isinstance(value, int) or value < 0:
+                return None
+        elif not math.isfinite(value):
+            return None
+        checked[name] = kind(value)
+    return checked
+
+
+def parse_address(
+    address: str, default_port: int = DEFAULT_SYNC_PORT
+) -> tuple[str, int]:
+    """Split ``host[:port]`` into a (host, port) tuple.
+
+    Raises:
+        ValueError: If the port is not a number
+    """
+    host, _, port = address.rpartition(":")
+    if not host:
+        return address, default_port
+    if not port.isdigit():
+        raise ValueError(f"Invalid address: {address}")
+    return host, int(port)
+
+
+class SyncServer:
+    """Answers clock and timeline requests for a shared metronome."""
+
+    def __init__(
+        self,
+        timeline: dict,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_SYNC_PORT,
+        clock: Callable[[], float] = time.monotonic,
+        on_report: Callable[[tuple, dict], None] | None = None,
+    ):
+        """Bind the server socket.
+
+        Args:
+            timeline: Tempo, meter and pattern (see module docstring); the
+                start time is added when omitted
+            host: Interface to listen on (``0.0.0.0`` for every interface)
+            port: UDP port (0 picks a free port)
+            clock: Monotonic clock that timeline times refer to
+            on_report: Optional callback for client reports, with the client
+                address and the report (its known fields only, checked with
+                check_report)
+        """
+        self.clock = clock
+        self.timeline = {"op": "timeline", "start": clock() + START_LEAD_S}
+        self.timeline.update(timeline)
+        self.on_report = on_report
+        self.clients: set[tuple] = set()
+        # Datagrams ignored because they were malformed or failed to handle
+        self.dropped = 0
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind((host, port))
+        self._socket.settimeout(0.1)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Get the bound (host, port)."""
+        return self._socket.getsockname()
+
+    def start(self) -> None:
+        """Answer requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop answering requests and close the socket."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._socket.close()
+
+    def serve_forever(self) -> None:
+        """Answer requests until closed."""
+        while not self._stop.is_set():
+            try:
+                data, address = self._socket.recvfrom(MAX_DATAGRAM)
+            except TimeoutError:
+                continue
+            received = self.clock()
+            # One bad datagram (or a failing report callback) is dropped and
+            # never stops the server
+            try:
+                request = json.loads(data)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                self._handle(request, address, received)
+            except Exception:
+                self.dropped += 1
+
+    def _handle(self, request: dict, address: tuple, received: float) -> None:
+        """Reply to one request."""
+        op = request.get("op")
+        if op == "time":
+            reply = {"op": "time", "t0": request.get("t0"), "t1": received}
+            reply["t2"] = self.clock()
+        elif op == "join":
+            self.clients.add(address)
+            reply = self.timeline
+        elif op == "report":
+            report = check_report(request)
+            if report is None:
+                raise ValueError("Malformed report")
+            if self.on_report is not None:
+                self.on_report(address, report)
+            return
+        else:
+            return
+        self._socket.sendto(json.dumps(reply).encode(), address)
+
+
+class SyncClient:
+    """Follows a SyncServer's clock and timeline."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_SYNC_PORT,
+        clock: Callable[[], float] = time.monotonic,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """Open a socket to the server.
+
+        Args:
+            host: Server host name or address
+            port: Server UDP port
+            clock: Local monotonic clock
+            timeout: Seconds to wait for each reply
+        """
+        self.clock = clock
+        self.offset = 0.0
+        self.estimate: ClockEstimate | None = None
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect((host, port))
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._socket.close()
+
+    def server_time(self) -> float:
+        """Get the current time on the server's clock."""
+        return self.clock() + self.offset
+
+    def _request(self, request: dict, op: str) -> dict:
+        """Send a request and wait for the reply with the given op.
+
+        Raises:
+            ConnectionError: If the server does not answer
+        """
+        self._socket.send(json.dumps(request).encode())
+        while True:
+            try:
+                data = self._socket.recv(MAX_DATAGRAM)
+            except (TimeoutError, ConnectionRefusedError):
+                raise ConnectionError("No answer from the metronome server")
+            # Ignore malformed datagrams and late replies to earlier requests
+            try:
+                reply = json.loads(data)
+            except ValueError:
+                continue
+            if (
+                isinstance(reply, dict)
+                and reply.get("op") == op
+                and reply.get("t0") == request.get("t0")
+            ):
+                return reply
+
+    def sync(self, samples: int = DEFAULT_SAMPLES) -> ClockEstimate:
+        """Estimate the server clock offset and start following it.
+
+        Each round trip gives ``offset = ((t1 - t0) + (t2 - t3)) / 2`` and
+        ``delay = (t3 - t0) - (t2 - t1)``, with t0/t3 on the local clock and
+        t1/t2 on the server's.
+
+        Raises:
+            ConnectionError: If the server does not answer
+        """
+        measured = []
+        for _ in range(samples):
+            t0 = self.clock()
+            reply = self._request({"op": "time", "t0": t0}, "time")
+            t3 = self.clock()
+            t1, t2 = reply.get("t1"), reply.get("t2")
+            if not all(
+                isinstance(t, (int, float)) and not isinstance(t, bool)
+                for t in (t1, t2)
+            ):
+                raise ConnectionError("Malformed reply from the metronome server")
+            measured.append((((t1 - t0) + (t2 - t3)) / 2, (t3 - t0) - (t2 - t1)))
+
+        self.estimate = combine_samples(measured)
+        self.offset = self.estimate.offset_s
+        return self.estimate
+
+    def join(self) -> dict:
+        """Get the server's timeline.
+
+        Raises:
+            ConnectionError: If the server does not answer
+        """
+        return self._request({"op": "join"}, "timeline")
+
+    def report(self, **fields) -> None:
+        """Send the current clock estimate (and any extra fields) to the server."""
+        report = {"op": "report", **fields}
+        if self.estimate is not None:
+            report["offset_ms"] = self.estimate.offset_s * 1e3
+            report["delay_ms"] = self.estimate.delay_s * 1e3
+            report["jitter_ms"] = self.estimate.jitter_s * 1e3
+        try:
+            self._socket.send(json.dumps(report).encode())
+        except OSError:
+            pass
+
+
+def next_cycle_start(timeline: dict, pattern: ClickPattern, now: float) -> float:
+    """Get the first pattern cycle start of a timeline that is still ahead.
+
+    Late joiners come in at the next bar rather than mid-pattern.
+    """
+    cycle_s = pattern.cycle_beats * 60.0 / timeline["bpm"]
+    cycles = max(math.ceil((now - timeline["start"]) / cycle_s), 0)
+    return timeline["start"] + cycles * cycle_s
+
+
+def play_server(
+    server: SyncServer,
+    click: Callable[[str], None],
+    duration: float | None = None,
+) -> SessionStats:
+    """Play a server's own timeline locally while it answers clients.
+
+    Returns:
+        Timing statistics for the session
+    """
+    timeline = server.timeline
+    pattern = timeline_pattern(timeline)
+    session = MetronomeSession(clock=server.clock)
+    return session.run(
+        duration=duration,
+        on_beat=lambda index: click(pattern.level(index)),
+        schedule=pattern.schedule(timeline["bpm"]),
+        start=timeline["start"],
+    )
+
+
+def play_synced(
+    client: SyncClient,
+    click: Callable[[str], None],
+    duration: float | None = None,
+    resync_s: float = RESYNC_INTERVAL_S,
+    on_estimate: Callable[[ClockEstimate], None] | None = None,
+) -> SessionStats:
+    """Join a server's timeline and play it against the server's clock.
+
+    Args:
+        client: Client connected to the server
+        click: Called with the accent level of each click
+        duration: Optional length of the session in seconds
+        resync_s: Seconds between offset re-estimates while playing
+        on_estimate: Optional callback for each offset estimate
+
+    Returns:
+        Timing statistics for the session, measured on the server's clock
+
+    Raises:
+        ConnectionError: If the server does not answer
+    """
+    estimate = client.sync()
+    if on_estimate is not None:
+        on_estimate(estimate)
+    client.report()
+
+    timeline = client.join()
+    pattern = timeline_pattern(timeline)
+    start = next_cycle_start(timeline, pattern, client.server_time())
+
+    session = MetronomeSession(clock=client.server_time)
+    finished = threading.Event()
+
+    def resync() -> None:
+        while not finished.wait(resync_s):
+            try:
+                estimate = client.sync()
+            except ConnectionError:
+                continue
+            if on_estimate is not None:
+                on_estimate(estimate)
+            client.report()
+
+    thread = threading.Thread(target=resync, daemon=True)
+    thread.start()
+    try:
+        stats = session.run(
+            duration=duration,
+            on_beat=lambda index: click(pattern.level(index)),
+            schedule=pattern.schedule(timeline["bpm"]),
+            start=start,
+        )
+    finally:
+        finished.set()
+        thread.join()
+
+    client.report(
+        beats=stats.beats,
+        missed_beats=stats.missed_beats,
+        beat_jitter_ms=stats.mean_jitter_ms,
+    )
+    return stats
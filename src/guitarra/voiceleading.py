@@ -0,0 +1,161 @@
+"""Voice leading: one voicing per chord with the least finger movement.
+
+Every chord of a progression has a list of candidate voicings. Choosing one
+per chord so that the hand moves as little as possible is a shortest path
+through a layered graph (one layer per chord, one node per candidate), solved
+with the Viterbi recurrence in O(chords x candidates^2) instead of trying all
+candidates^chords combinations. Transition costs only depend on the pair of
+chords, so each distinct chord change is costed once however long the form.
+"""
+
+from collections.abc import Mapping, Sequence
+from itertools import pairwise
+from operator import add
+from typing import NamedTuple
+
+from guitarra.progressions import format_chart
+from guitarra.scales import GuitarFretboard
+from guitarra.voicings import (
+    DEFAULT_MAX_FRET,
+    DEFAULT_MAX_SPAN,
+    Voicing,
+    chord_voicings,
+)
+
+# Candidate voicings considered per chord, easiest first
+DEFAULT_CANDIDATES = 20
+
+# Weight of a voicing's playability score against finger movement
+PLAYABILITY_WEIGHT = 1.0
+
+
+class VoiceLeading(NamedTuple):
+    """The voicings chosen for each chord of a progression."""
+
+    chords: tuple[str, ...]
+    voicings: tuple[Voicing, ...]
+    # Total finger movement between consecutive voicings
+    movement: int
+
+
+def movement(a: Voicing, b: Voicing) -> int:
+    """Finger movement from one voicing to the next.
+
+    Fingers that stay on a string travel the fret distance, every finger
+    placed or lifted (and every string muted or unmuted) costs one, and the
+    hand shift between fretted positions is added on top.
+    """
+    return _movement(a.frets, a.position, b.frets, b.position)
+
+
+def _movement(
+    frets_a: tuple[int | None, ...],
+    position_a: int,
+    frets_b: tuple[int | None, ...],
+    position_b: int,
+) -> int:
+    """Finger movement between fret tuples with known hand positions."""
+    cost = 0
+    for fret_a, fret_b in zip(frets_a, frets_b):
+        if fret_a == fret_b:
+            continue
+        if fret_a and fret_b:
+            cost += abs(fret_a - fret_b)
+        else:
+            cost += 1
+    if position_a and position_b:
+        cost += abs(position_a - position_b)
+    return cost
+
+
+def lead_voices(
+    chords: Sequence[str],
+    candidates: Mapping[str, Sequence[Voicing]],
+    playability: float = PLAYABILITY_WEIGHT,
+) -> VoiceLeading:
+    """Choose a voicing for each chord, minimizing movement plus playability.
+
+    Args:
+        chords: Chord symbols in playing order
+        candidates: Candidate voicings of every chord symbol
+        playability: Weight of each chosen voicing's score
+
+    Raises:
+        ValueError: If a chord has no candidate voicing
+    """
+    if not chords:
+        return VoiceLeading((), (), 0)
+    for chord in chords:
+        if not candidates.get(chord):
+            raise ValueError(f"No playable voicing for {chord}")
+
+    # Cost of every change, one column per voicing of the next chord
+    shapes = {
+        chord: [(voicing.frets, voicing.position) for voicing in candidates[chord]]
+        for chord in set(chords)
+    }
+    columns: dict[tuple[str, str], list[list[int]]] = {}
+    for change in set(pairwise(chords)):
+        before, after = (shapes[chord] for chord in change)
+        columns[change] = [[_movement(*a, *b) for a in before] for b in after]
+
+    totals = [playability * voicing.score for voicing in candidates[chords[0]]]
+    back: list[list[int]] = []
+    for change in pairwise(chords):
+        step = []
+        new_totals = []
+        for column, voicing in zip(columns[change], candidates[change[1]]):
+            sums = list(map(add, totals, column))
+            best = min(sums)
+            step.append(sums.index(best))
+            new_totals.append(best + playability * voicing.score)
+        back.append(step)
+        totals = new_totals
+
+    index = totals.index(min(totals))
+    path = [index]
+    for step in reversed(back):
+        index = step[index]
+        path.append(index)
+    path.reverse()
+
+    voicings = tuple(candidates[chord][index] for chord, index in zip(chords, path))
+    return VoiceLeading(
+        chords=tuple(chords),
+        voicings=voicings,
+        movement=sum(movement(a, b) for a, b in pairwise(voicings)),
+    )
+
+
+def voice_progression(
+    bars: Sequence[str],
+    fretboard: GuitarFretboard | None = None,
+    candidates: int = DEFAULT_CANDIDATES,
+    max_span: int = DEFAULT_MAX_SPAN,
+    allow_open: bool = True,
+    max_fret: int = DEFAULT_MAX_FRET,
+) -> VoiceLeading:
+    """Voice every chord of a progression (bars may hold several chords).
+
+    Candidates are the easiest voicings of each chord, from the render cache.
+
+    Raises:
+        ValueError: If candidates is below 1, or a chord symbol is invalid or
+            has no playable voicing
+    """
+    if candidates < 1:
+        raise ValueError("Candidates per chord must be at least 1")
+    chords = [chord for bar in bars for chord in bar.split()]
+    options = {}
+    for chord in dict.fromkeys(chords):
+        ranked = chord_voicings(chord, fretboard, max_span, allow_open, max_fret)
+        options[chord] = ranked[:candidates]
+    return lead_voices(chords, options)
+
+
+def format_voice_leading(bars: Sequence[str], leading: VoiceLeading) -> str:
+    """Format the chosen voicings as a chart, under the chords of each bar."""
+    shapes = iter(voicing.format() for voicing in leading.voicings)
+    voiced = [" ".join(next(shapes) for _ in bar.split()) for bar in bars]
+    chart = format_chart(list(bars), voiced)
+    return f"Voicings (finger movement {leading.movement}):\n\n{chart}"
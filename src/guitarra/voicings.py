@@ -0,0 +1,276 @@
+"""Chord voicings: every playable fingering of a chord on a fretboard.
+
+Voicings are enumerated one hand position at a time. For each lowest fretted
+fret, every string can be muted, played open, or fretted on a chord tone
+within the hand span. The search walks from the lowest string up and prunes a
+branch as soon as it breaks a rule: the bass note must be the root, at most
+four fingers, at most one muted string between sounding strings, and enough
+strings left to cover every missing chord tone.
+
+Results are ranked by playability and memoized in the shared render cache, so
+with a disk cache attached each chord is only searched once.
+"""
+
+import json
+import re
+from typing import NamedTuple
+
+from guitarra.cache import render_cache
+from guitarra.pitch import parse_note, spell_chord
+from guitarra.progressions import CHORD_QUALITIES
+from guitarra.scales import GuitarFretboard, intervals_to_mask, note_index
+
+# Frets covered by the fretting hand
+DEFAULT_MAX_SPAN = 4
+
+# Highest fret searched
+DEFAULT_MAX_FRET = 24
+
+# Fingers available for fretting (a barre at the lowest fret counts once)
+MAX_FINGERS = 4
+
+# Muted strings allowed between sounding strings
+MAX_INNER_MUTES = 1
+
+_CHORD_RE = re.compile(r"([A-Ga-g][#b]?)(.*)")
+
+
+class Voicing(NamedTuple):
+    """One fingering: a fret per string (low to high, None = muted)."""
+
+    frets: tuple[int | None, ...]
+    score: float
+
+    def format(self) -> str:
+        """Format as tab shorthand, e.g. ``x02020`` or ``x-10-12-10-12-10``."""
+        marks = ["x" if fret is None else str(fret) for fret in self.frets]
+        if any(len(mark) > 1 for mark in marks):
+            return "-".join(marks)
+        return "".join(marks)
+
+    @property
+    def position(self) -> int:
+        """Lowest fretted fret (0 for all-open voicings)."""
+        return min((fret for fret in self.frets if fret), default=0)
+
+
+def parse_chord(symbol: str) -> tuple[int, str]:
+    """Parse a chord symbol such as ``Bbmaj7`` into (root pitch class, quality).
+
+    Raises:
+        ValueError: If the root or quality is not recognized
+    """
+    match = _CHORD_RE.fullmatch(symbol.strip())
+    if match is None:
+        raise ValueError(f"Invalid chord: {symbol}")
+    root, quality = match.groups()
+    if quality not in CHORD_QUALITIES:
+        raise ValueError(f"Unknown chord quality: {quality}")
+    return note_index(root), quality
+
+
+def _fingers(frets: tuple[int | None, ...], low: int) -> int:
+    """Count fretting fingers, barring the lowest fret where no open string sounds.
+
+    A barre cannot skip an open string, so notes at the lowest fret with an
+    open string between them need a finger each.
+    """
+    at_low = [i for i, fret in enumerate(frets) if fret == low and low]
+    others = sum(1 for fret in frets if fret and fret != low)
+    if not at_low:
+        return others
+    barred = 0 not in frets[at_low[0] : at_low[-1] + 1]
+    return others + (1 if barred else len(at_low))
+
+
+def _score(frets: tuple[int | None, ...], fingers: int, inner_mutes: int) -> float:
+    """Playability cost of a voicing: lower is easier.
+
+    Stretches beyond three frets, fingers, muted inner strings and high
+    positions cost; every sounding string earns a little, so fuller voicings
+    win over partial ones of the same shape. Open strings make high positions
+    cost more, since the hand has to reach back to them.
+    """
+    fretted = [fret for fret in frets if fret]
+    position = min(fretted, default=0)
+    stretch = max(max(fretted, default=0) - position - 2, 0)
+    sounding = sum(fret is not None for fret in frets)
+    reach = 0.3 if 0 in frets else 0.1
+    return round(
+        stretch
+        + 0.5 * fingers
+        + 2.0 * inner_mutes
+        + reach * position
+        - 0.75 * sounding,
+        3,
+    )
+
+
+def find_voicings(
+    root: int,
+    quality: str,
+    tuning: tuple[str, ...] = tuple(GuitarFretboard.STANDARD_TUNING),
+    max_span: int = DEFAULT_MAX_SPAN,
+    allow_open: bool = True,
+    max_fret: int = DEFAULT_MAX_FRET,
+) -> list[Voicing]:
+    """Enumerate every playable voicing of a chord, easiest first.
+
+    Chords of four or more notes may leave out the fifth; every other chord
+    tone must sound, with the root in the bass.
+
+    Args:
+        root: Pitch class of the chord root
+        quality: Chord quality (a key of CHORD_QUALITIES)
+        tuning: Open string notes, low to high
+        max_span: Frets covered by the fretting hand
+        allow_open: Allow open strings
+        max_fret: Highest fret searched
+    """
+    intervals = CHORD_QUALITIES[quality]
+    chord_mask = intervals_to_mask([root + interval for interval in intervals])
+    required = chord_mask
+    if len(intervals) >= 4 and 7 in intervals:
+        required &= ~(1 << (root + 7) % 12)
+    required_count = bin(required).count("1")
+
+    open_pcs = [note_index(note) for note in tuning]
+    strings = len(tuning)
+    # Chord-tone frets of each string, and the pitch class at each
+    tone_frets = [
+        [
+            (fret, (open_pc + fret) % 12)
+            for fret in range(1, max_fret + 1)
+            if chord_mask >> ((open_pc + fret) % 12) & 1
+        ]
+        for open_pc in open_pcs
+    ]
+    open_tones = [
+        allow_open and bool(chord_mask >> open_pc & 1) for open_pc in open_pcs
+    ]
+
+    found: dict[tuple[int | None, ...], Voicing] = {}
+    frets: list[int | None] = [None] * strings
+
+    def search(
+        string: int,
+        low: int,
+        covered: int,
+        bass: bool,
+        fingers: int,
+        at_low: bool,
+        gap: int,
+        inner_mutes: int,
+    ) -> None:
+        # Every missing chord tone needs a string of its own
+        if bin(required & ~covered).count("1") > strings - string:
+            return
+        if string == strings:
+            if low and not at_low:
+                return
+            voicing = tuple(frets)
+            used = _fingers(voicing, low)
+            if used <= MAX_FINGERS:
+                found[voicing] = Voicing(voicing, _score(voicing, used, inner_mutes))
+            return
+
+        # Muted
+        frets[string] = None
+        search(
+            string + 1, low, covered, bass, fingers, at_low,
+            gap + 1 if bass else 0, inner_mutes,
+        )  # fmt: skip
+
+        candidates = [(0, open_pcs[string])] if open_tones[string] else []
+        if low:
+            candidates += [
+                tone for tone in tone_frets[string] if low <= tone[0] < low + max_span
+            ]
+        for fret, pitch_class in candidates:
+            if not bass and pitch_class != root:
+                continue
+            new_inner = inner_mutes + gap
+            if new_inner > MAX_INNER_MUTES:
+                continue
+            new_fingers = fingers + (1 if fret > low else 0)
+            new_at_low = at_low or fret == low
+            if new_fingers + (1 if new_at_low else 0) > MAX_FINGERS:
+                continue
+            frets[string] = fret
+            search(
+                string + 1, low, covered | 1 << pitch_class, True, new_fingers,
+                new_at_low, 0, new_inner,
+            )  # fmt: skip
+        frets[string] = None
+
+    # One pass per hand position (lowest fretted fret), plus open-only shapes
+    positions = range(0 if allow_open else 1, max_fret + 1)
+    for low in positions:
+        search(0, low, 0, False, 0, False, 0, 0)
+
+    return [
+        voicing
+        for voicing in sorted(found.values(), key=lambda v: (v.score, v.position))
+        if sum(fret is not None for fret in voicing.frets) >= max(3, required_count)
+    ]
+
+
+def chord_voicings(
+    symbol: str,
+    fretboard: GuitarFretboard | None = None,
+    max_span: int = DEFAULT_MAX_SPAN,
+    allow_open: bool = True,
+    max_fret: int = DEFAULT_MAX_FRET,
+) -> list[Voicing]:
+    """Get the ranked voicings of a chord symbol, through the render cache.
+
+    Raises:
+        ValueError: If the chord symbol is invalid or the span is below 1 fret
+    """
+    if max_span < 1:
+        raise ValueError("Hand span must be at least 1 fret")
+    root, quality = parse_chord(symbol)
+    tuning = tuple((fretboard or GuitarFretboard()).tuning)
+    key = ("voicings", root, quality, tuning, max_span, allow_open, max_fret)
+    encoded = render_cache.get_or_render(
+        key,
+        lambda: json.dumps(
+            [
+                [list(voicing.frets), voicing.score]
+                for voicing in find_voicings(
+                    root, quality, tuning, max_span, allow_open, max_fret
+                )
+            ]
+        ),
+    )
+    return [Voicing(tuple(frets), score) for frets, score in json.loads(encoded)]
+
+
+def chord_notes(symbol: str) -> list[str]:
+    """List the notes of a chord symbol, root first, spelled from the root."""
+    _, quality = parse_chord(symbol)
+    root = parse_note(_CHORD_RE.fullmatch(symbol.strip()).group(1))
+    return list(spell_chord(root, CHORD_QUALITIES[quality]))
+
+
+def format_voicings(symbol: str, voicings: list[Voicing], limit: int = 0) -> str:
+    """Format ranked voicings, one per line with its position.
+
+    Args:
+        symbol: Chord symbol shown in the header
+        voicings: Voicings, easiest first
+        limit: Number of voicings shown (0 shows all)
+
+    Raises:
+        ValueError: If the limit is negative
+    """
+    if limit < 0:
+        raise ValueError("Voicing limit must not be negative")
+    shown = voicings[:limit] if limit else voicings
+    lines = [
+        f"{symbol} ({' '.join(chord_notes(symbol))}): {len(voicings)} voicings",
+    ]
+    for rank, voicing in enumerate(shown, start=1):
+        position = f"fret {voicing.position}" if voicing.position else "open"
+        lines.append(f"{rank:>4}. {voicing.format():<20} {position}")
+    return "\n".join(lines)
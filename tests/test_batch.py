@@ -0,0 +1,105 @@
+"""Tests for streaming batch mode."""
+
+import io
+import json
+
+from typer.testing import CliRunner
+
+from guitarra.batch import run_batch
+from guitarra.cli import app
+
+
+class TestRunBatch:
+    """Test run_batch function."""
+
+    def test_one_response_per_request(self):
+        """Test that each request line gets a response line in order."""
+        # Arrange
+        lines = [
+            json.dumps({"op": "scale", "root": "C", "scale": "major", "id": 1}),
+            "",
+            json.dumps({"op": "blues", "root": "E", "id": 2}),
+            json.dumps({"op": "identify", "notes": ["A", "C", "E"], "id": 3}),
+        ]
+        output = io.StringIO()
+
+        # Act
+        count = run_batch(lines, output)
+
+        # Assert
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert count == 3
+        assert [response["id"] for response in responses] == [1, 2, 3]
+        assert all(response["ok"] for response in responses)
+
+    def test_bad_lines_do_not_stop_the_stream(self):
+        """Test that invalid lines are answered with errors."""
+        # Arrange
+        lines = ["not json", '{"op": "blues"}', '{"op": "ping"}']
+        output = io.StringIO()
+
+        # Act
+        run_batch(lines, output)
+
+        # Assert
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert responses[0]["error"].startswith("Invalid JSON")
+        assert responses[1]["error"] == "Missing field: root"
+        assert responses[2] == {"ok": True, "output": "pong"}
+
+    def test_mistyped_request_between_valid_ones(self):
+        """Test a request that breaks its handler is answered like any error."""
+        # Arrange
+        lines = [
+            '{"op": "ping", "id": 1}',
+            '{"op": "scale", "root": 5, "scale": "major", "id": 2}',
+            "[" * 100_000,
+            '{"op": "ping", "id": 3}',
+        ]
+        output = io.StringIO()
+
+        # Act
+        count = run_batch(lines, output)
+
+        # Assert
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert count == 4
+        assert responses[1] == {
+            "ok": False,
+            "error": "Field root must be a string",
+            "id": 2,
+        }
+        assert responses[2]["error"].startswith("Invalid JSON")
+        assert responses[3] == {"ok": True, "output": "pong", "id": 3}
+
+    def test_input_is_consumed_lazily(self):
+        """Test that responses are written before all input is read."""
+        # Arrange
+        output = io.StringIO()
+        seen = []
+
+        def requests():
+            for root in "CDE":
+                seen.append(len(output.getvalue().splitlines()))
+                yield json.dumps({"op": "blues", "root": root})
+
+        # Act
+        run_batch(requests(), output)
+
+        # Assert
+        assert seen == [0, 1, 2]
+
+
+class TestBatchCommand:
+    """Test batch command."""
+
+    def test_batch_command(self):
+        """Test reading requests from stdin."""
+        runner = CliRunner()
+        stdin = '{"op": "scale", "root": "A", "scale": "blues", "color": false}\n'
+
+        result = runner.invoke(app, ["batch"], input=stdin)
+
+        assert result.exit_code == 0
+        response = json.loads(result.stdout)
+        assert response["output"].startswith("A Blues Scale (Frets 0-12):")
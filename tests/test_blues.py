@@ -70,7 +70,7 @@ class TestTwelveBarBlues:
         assert progression == expected
 
     def test_flat_note_conversion(self):
-        """Test conversion of flat notes to sharp notation."""
+        """Test flat roots keep flat chord names."""
         # Arrange
         blues = TwelveBarBlues("Bb")
 
@@ -79,18 +79,18 @@ class TestTwelveBarBlues:
 
         # Assert
         expected = [
-            "A#",
-            "A#",
-            "A#",
-            "A#",
-            "D#",
-            "D#",
-            "A#",
-            "A#",
+            "Bb",
+            "Bb",
+            "Bb",
+            "Bb",
+            "Eb",
+            "Eb",
+            "Bb",
+            "Bb",
             "F",
-            "D#",
-            "A#",
-            "A#",
+            "Eb",
+            "Bb",
+            "Bb",
         ]
         assert progression == expected
 
@@ -173,3 +173,16 @@ class TestTwelveBarBlues:
             "|    V |   iv |    i |    i |",
         ]
         assert formatted == "\n".join(expected_lines)
+
+    def test_scale_mask(self):
+        """Test blues scale pitch-class set for the root."""
+        # Arrange
+        blues = TwelveBarBlues("A")
+
+        # Act
+        mask = blues.get_scale_mask()
+
+        # Assert
+        # A, C, D, D#, E, G
+        expected = sum(1 << pitch_class for pitch_class in (9, 0, 2, 3, 4, 7))
+        assert mask == expected
@@ -0,0 +1,136 @@
+"""Tests for the render cache."""
+
+import pytest
+
+from guitarra.blues import TwelveBarBlues
+from guitarra.cache import (
+    DEFAULT_CACHE_SIZE,
+    RenderCache,
+    cache_size_from_env,
+    render_cache,
+)
+from guitarra.scales import GuitarFretboard, Scale
+
+
+class TestRenderCache:
+    """Test RenderCache class."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that repeated keys are served from the cache."""
+        # Arrange
+        cache = RenderCache(maxsize=4)
+        calls = []
+
+        def render():
+            calls.append(1)
+            return "diagram"
+
+        # Act
+        first = cache.get_or_render("key", render)
+        second = cache.get_or_render("key", render)
+
+        # Assert
+        assert first == second == "diagram"
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction order and eviction counter."""
+        # Arrange
+        cache = RenderCache(maxsize=2)
+        cache.get_or_render("a", lambda: "A")
+        cache.get_or_render("b", lambda: "B")
+        cache.get_or_render("a", lambda: "A")  # "b" is now least recent
+
+        # Act
+        cache.get_or_render("c", lambda: "C")
+
+        # Assert
+        assert cache.evictions == 1
+        assert len(cache) == 2
+        assert cache.get_or_render("b", lambda: "new") == "new"
+
+    def test_resize_evicts_and_zero_disables(self):
+        """Test shrinking the cache and disabling it."""
+        # Arrange
+        cache = RenderCache(maxsize=3)
+        for key in "abc":
+            cache.get_or_render(key, lambda: key)
+
+        # Act
+        cache.resize(0)
+        cache.get_or_render("d", lambda: "D")
+
+        # Assert
+        assert len(cache) == 0
+        assert cache.evictions == 3
+
+    def test_negative_size_rejected(self):
+        """Test error handling for negative cache size."""
+        # Arrange & Act & Assert
+        with pytest.raises(ValueError, match="non-negative"):
+            RenderCache(maxsize=-1)
+
+    @pytest.mark.parametrize("value, expected", [("32", 32), ("0", 0)])
+    def test_size_from_env(self, monkeypatch, value, expected):
+        """Test the size is read from the environment."""
+        monkeypatch.setenv("GUITARRA_RENDER_CACHE_SIZE", value)
+        assert cache_size_from_env() == expected
+
+    @pytest.mark.parametrize("value", ["big", "-1", ""])
+    def test_invalid_size_from_env(self, monkeypatch, value):
+        """Test invalid sizes fall back to the default with a warning."""
+        monkeypatch.setenv("GUITARRA_RENDER_CACHE_SIZE", value)
+        with pytest.warns(UserWarning, match="GUITARRA_RENDER_CACHE_SIZE"):
+            assert cache_size_from_env() == DEFAULT_CACHE_SIZE
+
+
+class TestRendererCaching:
+    """Test that renderers go through the shared cache."""
+
+    def setup_method(self):
+        """Start each test from an empty cache."""
+        render_cache.clear()
+
+    def test_display_scale_is_cached(self):
+        """Test repeated scale renders hit the cache."""
+        # Arrange
+        fretboard = GuitarFretboard()
+
+        # Act
+        first = fretboard.display_scale(Scale("A", "blues"), 0, 12)
+        second = GuitarFretboard().display_scale(Scale("A", "blues"), 0, 12)
+
+        # Assert
+        assert first == second
+        assert render_cache.hits == 1
+
+    def test_color_mode_is_part_of_key(self):
+        """Test colored and plain renders are cached separately."""
+        # Arrange
+        fretboard = GuitarFretboard()
+        scale = Scale("C", "major")
+
+        # Act
+        colored = fretboard.display_scale(scale, 0, 5)
+        plain = fretboard.display_scale(scale, 0, 5, color=False)
+
+        # Assert
+        assert "\x1b[" in colored
+        assert "\x1b[" not in plain
+        assert render_cache.misses == 2
+
+    def test_format_progression_is_cached(self):
+        """Test repeated blues charts hit the cache."""
+        # Arrange
+        blues = TwelveBarBlues("E")
+
+        # Act
+        blues.format_progression(blues.get_minor_progression(), show_degrees=True)
+        blues.format_progression(blues.get_minor_progression(), show_degrees=True)
+        blues.format_progression(blues.get_major_progression(), show_degrees=True)
+
+        # Assert
+        assert render_cache.hits == 1
+        assert render_cache.misses == 2
@@ -0,0 +1,262 @@
+"""Tests for user catalogs of scales, tunings and forms."""
+
+import json
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra import catalog as catalog_module
+from guitarra.catalog import (
+    CACHE_FILE,
+    compile_catalog,
+    load_catalog,
+    refresh_catalog,
+    reload_catalog,
+)
+from guitarra.cli import app
+from guitarra.identify import identify_scales
+from guitarra.progressions import get_form
+from guitarra.protocol import handle_request
+from guitarra.scales import GuitarFretboard, Scale
+
+CATALOG = """
+[scales]
+hirajoshi = [0, 2, 3, 7, 8]
+
+[scales.in_sen]
+intervals = [0, 1, 5, 7, 10]
+aliases = ["insen"]
+
+[tunings]
+all_fourths = ["E", "A", "D", "G", "C", "F"]
+
+[forms.minor_swing]
+title = "Minor Swing in {root}:"
+degrees = "i6 | iv6 | i6 | V7 | i6 | iv6 | V7 | i6"
+aliases = ["gypsy"]
+
+[forms]
+two_five = "ii7 | V7 | Imaj7 | Imaj7"
+"""
+
+
+@pytest.fixture
+def user_catalog(tmp_path, monkeypatch):
+    """A catalog directory with one file, loaded as the user catalog."""
+    directory = tmp_path / "catalog"
+    directory.mkdir()
+    (directory / "shop.toml").write_text(CATALOG)
+    monkeypatch.setenv("GUITARRA_CATALOG_DIR", str(directory))
+    monkeypatch.setenv("GUITARRA_CACHE_DIR", str(tmp_path / "cache"))
+    reload_catalog()
+    yield directory
+    monkeypatch.undo()
+    reload_catalog()
+
+
+def _fail_compile(sources):
+    raise AssertionError("catalog was compiled again")
+
+
+class TestUserCatalog:
+    """Test catalog entries are added to the built-in ones."""
+
+    def test_scales(self, user_catalog):
+        """Test user scales, with aliases, work like built-in ones."""
+        assert Scale("C", "hirajoshi").get_scale_notes() == ["C", "D", "Eb", "G", "Ab"]
+        assert Scale("E", "insen").scale_name == "in_sen"
+        assert "hirajoshi" in Scale.get_available_scales()
+        assert "major" in Scale.get_available_scales()
+        found = identify_scales(["C", "D", "Eb", "G", "Ab"], exact=True)
+        assert ("C", "hirajoshi") in {(m.root, m.scale_name) for m in found}
+
+    def test_tunings(self, user_catalog):
+        """Test user tunings by name."""
+        fretboard = GuitarFretboard("all fourths")
+        assert fretboard.tuning == ["E", "A", "D", "G", "C", "F"]
+        assert fretboard.matrix[5][:3] == (5, 6, 7)
+        assert GuitarFretboard.get_tuning("standard") == GuitarFretboard.STANDARD_TUNING
+
+    def test_forms(self, user_catalog):
+        """Test user forms, titled explicitly or after their name."""
+        form = get_form("gypsy")
+        assert form.name == "minor_swing"
+        assert form.in_key(2)[:4] == ["Dm6", "Gm6", "Dm6", "A7"]
+        assert get_form("two_five").format_title("C") == "Two Five in C:"
+
+    def test_reload_restores_builtins(self, user_catalog):
+        """Test dropping the catalog leaves only the built-in entries."""
+        for path in user_catalog.iterdir():
+            path.unlink()
+        reload_catalog()
+
+        assert "hirajoshi" not in Scale.get_available_scales()
+        with pytest.raises(ValueError, match="Unknown tuning"):
+            GuitarFretboard.get_tuning("all_fourths")
+        with pytest.raises(ValueError, match="Unknown form"):
+            get_form("minor_swing")
+
+    def test_reload_reaches_daemon_requests(self, user_catalog):
+        """Test requests use the reloaded catalog, not objects built before it."""
+        # Arrange
+        request = {"op": "scale", "root": "C", "scale": "hirajoshi"}
+        request |= {"tuning": "all_fourths", "color": False}
+        before = handle_request(request)["output"]
+        (user_catalog / "shop.toml").write_text(
+            CATALOG.replace("[0, 2, 3, 7, 8]", "[0, 4, 7]").replace(
+                '"C", "F"]', '"B", "E"]'
+            )
+        )
+
+        # Act
+        reload_catalog()
+        after = handle_request(request)["output"]
+
+        # Assert
+        assert after != before
+        assert "Eb" in before and "Eb" not in after
+        assert after.splitlines()[2].startswith("E|")
+        assert before.splitlines()[2].startswith("F|")
+
+    def test_edited_scale_with_cache_dir(self, user_catalog, tmp_path):
+        """Test an edited catalog scale is not served from the disk cache."""
+        # Arrange
+        args = ["scale", "C", "hirajoshi", "-o", "plain"]
+        args += ["--cache-dir", str(tmp_path / "renders")]
+        before = CliRunner().invoke(app, args).stdout
+        (user_catalog / "shop.toml").write_text(
+            CATALOG.replace("[0, 2, 3, 7, 8]", "[0, 4, 7]")
+        )
+        reload_catalog()
+
+        # Act
+        after = CliRunner().invoke(app, args).stdout
+
+        # Assert
+        assert "Eb" in before
+        assert "Eb" not in after and "-E-" in after
+
+    def test_refresh_after_edit(self, user_catalog):
+        """Test a changed catalog file is dropped and loaded again on use."""
+        # Arrange
+        assert "hirajoshi" in Scale.get_available_scales()
+        assert not refresh_catalog()
+        with open(user_catalog / "shop.toml", "a") as f:
+            f.write("\n[scales.kumoi]\nintervals = [0, 2, 3, 7, 9]\n")
+
+        # Act
+        refreshed = refresh_catalog()
+
+        # Assert
+        assert refreshed
+        assert Scale("C", "kumoi").get_scale_notes() == ["C", "D", "Eb", "G", "A"]
+        assert not refresh_catalog()
+
+    def test_no_catalog_directory(self, tmp_path):
+        """Test a missing directory is an empty catalog."""
+        assert load_catalog(tmp_path / "missing", tmp_path / CACHE_FILE).scales == {}
+
+    def test_cli(self, user_catalog):
+        """Test catalog scales from the command line."""
+        result = CliRunner().invoke(app, ["scale", "A", "hirajoshi", "-o", "plain"])
+
+        assert result.exit_code == 0
+        assert result.output.startswith("A Hirajoshi Scale")
+
+
+class TestCompiledCache:
+    """Test the compiled catalog cache and its invalidation."""
+
+    def test_cache_is_reused(self, tmp_path, monkeypatch):
+        """Test an unchanged catalog is read from the cache, not compiled."""
+        # Arrange
+        (tmp_path / "shop.toml").write_text(CATALOG)
+        cache = tmp_path / "cache" / CACHE_FILE
+        first = load_catalog(tmp_path, cache)
+
+        # Act
+        monkeypatch.setattr(catalog_module, "compile_catalog", _fail_compile)
+        second = load_catalog(tmp_path, cache)
+
+        # Assert
+        assert json.loads(cache.read_text())["stamps"][0][0] == "shop.toml"
+        assert second == first
+
+    def test_touched_file_reuses_cache_by_hash(self, tmp_path, monkeypatch):
+        """Test a new modification time with the same content is not compiled."""
+        # Arrange
+        path = tmp_path / "shop.toml"
+        path.write_text(CATALOG)
+        cache = tmp_path / CACHE_FILE
+        first = load_catalog(tmp_path, cache)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        # Act
+        monkeypatch.setattr(catalog_module, "compile_catalog", _fail_compile)
+        second = load_catalog(tmp_path, cache)
+
+        # Assert
+        assert second == first
+        stamps = json.loads(cache.read_text())["stamps"]
+        assert stamps[0][1] == path.stat().st_mtime_ns
+
+    def test_changed_file_is_compiled(self, tmp_path):
+        """Test edited content replaces the cached catalog."""
+        # Arrange
+        path = tmp_path / "shop.toml"
+        path.write_text(CATALOG)
+        cache = tmp_path / CACHE_FILE
+        load_catalog(tmp_path, cache)
+
+        # Act
+        path.write_text("[scales]\nyo = [0, 2, 5, 7, 9]\n")
+        catalog = load_catalog(tmp_path, cache)
+
+        # Assert
+        assert list(catalog.scales) == ["yo"]
+        assert catalog.scales["yo"][1] == 0b1010100101
+
+    def test_unwritable_cache(self, tmp_path):
+        """Test the catalog still loads when the cache cannot be written."""
+        (tmp_path / "shop.toml").write_text(CATALOG)
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+
+        catalog = load_catalog(tmp_path, blocker / CACHE_FILE)
+
+        assert "hirajoshi" in catalog.scales
+
+
+class TestCompileCatalog:
+    """Test compile_catalog function."""
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [
+            ("[scales]\nbad = [0, 4, 2]", "scale bad needs rising semitones"),
+            ("[scales]\nbad = [1, 4]", "scale bad needs rising semitones"),
+            ("[tunings]\nbad = ['E', 'H']", "tuning bad: Invalid note: H"),
+            ("[forms]\nbad = 'I | XI'", "form bad: Invalid chord degree: XI"),
+            ("[forms.bad]\ndegrees = 'I'\ntitle = '{key}'", "form bad: 'key'"),
+            ("[scales\n", "Invalid catalog file shop.toml"),
+            ("scales = [1, 2]", r"shop.toml: \[scales\] must be a table"),
+            ("tunings = 'EADGBE'", r"shop.toml: \[tunings\] must be a table"),
+            ("forms = 1", r"shop.toml: \[forms\] must be a table"),
+        ],
+    )
+    def test_invalid_entries(self, text, message):
+        """Test errors name the file and entry."""
+        with pytest.raises(ValueError, match=message):
+            compile_catalog([("shop.toml", text.encode())])
+
+    def test_later_files_replace_earlier_ones(self):
+        """Test a name defined twice keeps the last definition."""
+        catalog = compile_catalog(
+            [
+                ("a.toml", b"[scales]\nmine = [0, 7]"),
+                ("b.toml", b"[scales]\nMine = [0, 5, 7]"),
+            ]
+        )
+        assert catalog.scales == {"mine": ([0, 5, 7], 0b10100001)}
@@ -0,0 +1,124 @@
+"""Tests for offline click-track rendering."""
+
+import wave
+from array import array
+
+from typer.testing import CliRunner
+
+from guitarra.cli import app
+from guitarra.clicktrack import (
+    build_clicks,
+    metronome_events,
+    render_metronome,
+    write_click_track,
+)
+
+
+def _read_samples(path) -> array:
+    """Read all samples of a mono 16-bit WAV file."""
+    with wave.open(str(path), "rb") as wav:
+        samples = array("h", wav.readframes(wav.getnframes()))
+    return samples
+
+
+class TestMetronomeEvents:
+    """Test metronome_events function."""
+
+    def test_accents_in_four_four_with_eighths(self):
+        """Test accent levels follow measure, beat and subdivision."""
+        # Arrange & Act
+        events = list(metronome_events(120, 4, "eighth", 44100 * 2, 44100))
+
+        # Assert
+        assert len(events) == 8
+        assert [frame for frame, _ in events[:3]] == [0, 11025, 22050]
+        assert [level for _, level in events[:3]] == [
+            "accent",
+            "subdivision",
+            "regular",
+        ]
+
+    def test_positions_do_not_drift(self):
+        """Test that frame positions are exact after many clicks."""
+        # Arrange & Act
+        events = list(metronome_events(90, 3, "triplets", 44100 * 600, 44100))
+
+        # Assert
+        frame, _ = events[-1]
+        assert frame == round((len(events) - 1) * 44100 * 60 / (90 * 3))
+
+
+class TestWriteClickTrack:
+    """Test write_click_track function."""
+
+    def test_clicks_span_chunk_boundaries(self, tmp_path):
+        """Test that chunked writing matches a single-chunk render."""
+        # Arrange
+        clicks = build_clicks("performance", 8000)
+        events = [(0, "accent"), (900, "regular"), (1990, "subdivision")]
+        chunked = tmp_path / "chunked.wav"
+        whole = tmp_path / "whole.wav"
+
+        # Act
+        write_click_track(chunked, events, 3000, clicks, 8000, chunk_frames=1000)
+        write_click_track(whole, events, 3000, clicks, 8000, chunk_frames=3000)
+
+        # Assert
+        assert _read_samples(chunked) == _read_samples(whole)
+
+    def test_click_placed_at_frame(self, tmp_path):
+        """Test that a click starts exactly at its frame."""
+        # Arrange
+        clicks = build_clicks("simple", 8000)
+        path = tmp_path / "click.wav"
+
+        # Act
+        write_click_track(path, [(500, "regular")], 2000, clicks, 8000)
+
+        # Assert
+        samples = _read_samples(path)
+        regular = clicks["regular"]
+        assert not any(samples[:500])
+        assert samples[500 : 500 + len(regular)] == regular
+
+
+class TestRenderMetronome:
+    """Test render_metronome function and --render option."""
+
+    def test_render_length(self, tmp_path):
+        """Test that the rendered file has the requested duration."""
+        # Arrange
+        path = tmp_path / "click.wav"
+
+        # Act
+        frames = render_metronome(path, 100, 4, 3, sample_rate=8000)
+
+        # Assert
+        with wave.open(str(path), "rb") as wav:
+            assert wav.getnframes() == frames == 24000
+            assert wav.getframerate() == 8000
+
+    def test_render_option(self, tmp_path):
+        """Test rendering from the CLI without an audio device."""
+        runner = CliRunner()
+        path = tmp_path / "click.wav"
+
+        result = runner.invoke(
+            app,
+            ["metronome", "120", "-d", "2", "-s", "eighth", "--render", str(path)],
+        )
+
+        assert result.exit_code == 0
+        assert "Rendered 2s click track" in result.stdout
+        assert path.exists()
+
+    def test_render_requires_duration(self, tmp_path):
+        """Test error when rendering an infinite metronome."""
+        runner = CliRunner()
+
+        result = runner.invoke(
+            app, ["metronome", "120", "--render", str(tmp_path / "x.wav")]
+        )
+
+        assert result.exit_code == 0
+        assert "Duration is required when rendering" in result.stderr
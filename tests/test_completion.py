@@ -0,0 +1,151 @@
+"""Tests for static shell completion scripts."""
+
+import shutil
+import subprocess
+
+import pytest
+import typer
+from typer.main import get_command
+from typer.testing import CliRunner
+
+from guitarra.cli import app
+from guitarra.completion import (
+    DYNAMIC,
+    SHELLS,
+    command_tree,
+    generate_script,
+)
+from guitarra.scales import Scale
+
+requires_bash = pytest.mark.skipif(shutil.which("bash") is None, reason="no bash")
+
+
+@pytest.fixture(scope="module")
+def bash_script(tmp_path_factory):
+    """The generated bash script, written to a file."""
+    path = tmp_path_factory.mktemp("completion") / "guitar.bash"
+    path.write_text(generate_script(get_command(app), "bash"))
+    return path
+
+
+def _complete(script, line: str) -> list[str]:
+    """Complete a command line in bash, the cursor at its end."""
+    program = (
+        f"source {script}; COMP_WORDS=({line}); "
+        f"[[ '{line}' == *' ' ]] && COMP_WORDS+=(''); "
+        "COMP_CWORD=$((${#COMP_WORDS[@]} - 1)); "
+        '_guitar; printf "%s\\n" "${COMPREPLY[@]}"'
+    )
+    result = subprocess.run(
+        ["bash", "--norc", "-c", program], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+class TestCommandTree:
+    """Test command_tree function."""
+
+    def test_commands_and_kinds(self):
+        """Test commands, subcommands and the value kind of parameters."""
+        # Act
+        tree = {command.path: command for command in command_tree(get_command(app))}
+
+        # Assert
+        assert ("completion", "generate") in tree
+        assert ("scale",) in tree
+        assert tree[("scale",)].arguments == ("notes", "scales")
+        assert tree[("identify",)].variadic
+        options = {name: o.kind for o in tree[("blues",)].options for name in o.names}
+        assert options["--form"] == "forms"
+        assert options["--minor"] is None
+        assert options["--cache-dir"] == "file"
+
+    def test_dynamic_completion(self):
+        """Test completion functions without a table ask the CLI."""
+        # Arrange
+        other = typer.Typer()
+
+        @other.command()
+        def tune(
+            name: str = typer.Argument(autocompletion=lambda incomplete: ["drop_d"]),
+        ):
+            pass
+
+        # Act
+        tree = command_tree(get_command(other))
+        scripts = [generate_script(get_command(other), shell) for shell in SHELLS]
+
+        # Assert
+        assert tree[0].arguments == (DYNAMIC,)
+        assert all("_GUITAR_COMPLETE" in script for script in scripts)
+
+
+class TestGenerateScript:
+    """Test generate_script function."""
+
+    @pytest.mark.parametrize("shell", SHELLS)
+    def test_candidates_are_embedded(self, shell):
+        """Test scales, notes and forms are in the script, with no Python call."""
+        # Act
+        script = generate_script(get_command(app), shell)
+
+        # Assert
+        for name in Scale.get_available_scales():
+            assert name in script
+        assert "C#" in script
+        assert "quick_change" in script
+        assert "_GUITAR_COMPLETE" not in script
+
+    def test_unknown_shell(self):
+        """Test an unsupported shell is rejected."""
+        with pytest.raises(ValueError, match="Unknown shell: tcsh"):
+            generate_script(get_command(app), "tcsh")
+
+    @requires_bash
+    def test_bash_syntax(self, bash_script):
+        """Test the bash script parses."""
+        subprocess.run(["bash", "-n", str(bash_script)], check=True)
+
+    @requires_bash
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("guitar sc", ["scale"]),
+            ("guitar scale c", ["C", "C#"]),
+            ("guitar scale C pent", ["pentatonic_major", "pentatonic_minor"]),
+            ("guitar scale C major --f", ["--format"]),
+            ("guitar scale C major -o ", ["ansi", "plain", "json", "svg", "html"]),
+            ("guitar blues -f jazz B", ["B", "Bb"]),
+            ("guitar identify C E G", ["G", "G#", "Gb"]),
+            ("guitar fingering A blues --system ", ["box", "3nps", "caged"]),
+            ("guitar metronome 90 -st p", ["performance", "practice"]),
+            ("guitar completion generate ", ["bash", "zsh", "fish"]),
+            ("guitar chord ", []),
+        ],
+    )
+    def test_bash_completes(self, bash_script, line, expected):
+        """Test bash completes commands, options and values from the tables."""
+        assert _complete(bash_script, line) == expected
+
+
+class TestCompletionCommand:
+    """Test the completion generate command."""
+
+    def test_generate(self):
+        """Test the script is printed."""
+        # Act
+        result = CliRunner().invoke(app, ["completion", "generate", "zsh"])
+
+        # Assert
+        assert result.exit_code == 0
+        assert result.output.startswith("#compdef guitar")
+        assert "compdef _guitar guitar" in result.output
+
+    def test_unknown_shell(self):
+        """Test the supported shells are listed for an unknown shell."""
+        # Act
+        result = CliRunner().invoke(app, ["completion", "generate", "tcsh"])
+
+        # Assert
+        assert "Error: Unknown shell: tcsh" in result.output
+        assert "Supported shells: bash, zsh, fish" in result.output
@@ -0,0 +1,147 @@
+"""Tests for the persistent render cache."""
+
+from typer.testing import CliRunner
+
+from guitarra.cache import RenderCache
+from guitarra.cli import app
+from guitarra.diskcache import DiskRenderCache, disk_render_cache
+
+
+class TestDiskRenderCache:
+    """Test DiskRenderCache class."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that flushed renders are readable by a new instance."""
+        # Arrange
+        cache = DiskRenderCache(tmp_path)
+        cache.put("a", "first diagram")
+        cache.put("b", "second \x1b[31mdiagram\x1b[0m")
+
+        # Act
+        cache.flush()
+        cache.close()
+        reopened = DiskRenderCache(tmp_path)
+
+        # Assert
+        assert reopened.get("a") == "first diagram"
+        assert reopened.get("b") == "second \x1b[31mdiagram\x1b[0m"
+        assert reopened.get("missing") is None
+
+    def test_flush_merges_existing_entries(self, tmp_path):
+        """Test that a flush keeps renders stored by earlier runs."""
+        # Arrange
+        first = DiskRenderCache(tmp_path)
+        first.put("a", "A")
+        first.flush()
+        first.close()
+
+        # Act
+        second = DiskRenderCache(tmp_path)
+        second.put("b", "B")
+        second.flush()
+
+        # Assert
+        assert second.get("a") == "A"
+        assert second.get("b") == "B"
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """Test that an unreadable cache file behaves as empty."""
+        # Arrange
+        cache = DiskRenderCache(tmp_path)
+        cache.path.write_bytes(b"not a cache file")
+
+        # Act & Assert
+        assert cache.get("a") is None
+        cache.put("a", "A")
+        cache.flush()
+        assert DiskRenderCache(tmp_path).get("a") == "A"
+
+    def test_stale_version_files_removed(self, tmp_path):
+        """Test that cache files from other versions are cleaned up."""
+        # Arrange
+        stale = tmp_path / "renders-0.0.1.bin"
+        stale.write_bytes(b"old")
+        cache = DiskRenderCache(tmp_path)
+        cache.put("a", "A")
+
+        # Act
+        cache.flush()
+
+        # Assert
+        assert not stale.exists()
+        assert cache.path.exists()
+
+    def test_memory_cache_falls_back_to_disk(self, tmp_path):
+        """Test that a memory miss is served from disk without rendering."""
+        # Arrange
+        with disk_render_cache(tmp_path, RenderCache()) as disk:
+            disk.put(repr(("key",)), "stored")
+        memory = RenderCache()
+        calls = []
+
+        def render():
+            calls.append(1)
+            return "fresh"
+
+        # Act
+        with disk_render_cache(tmp_path, memory):
+            value = memory.get_or_render(("key",), render)
+
+        # Assert
+        assert value == "stored"
+        assert calls == []
+        assert memory.disk is None
+
+
+class TestCacheDirOption:
+    """Test --cache-dir CLI option."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    def test_scale_populates_cache_dir(self, tmp_path):
+        """Test that scale renders are persisted and reused."""
+        first = self.runner.invoke(
+            app, ["scale", "A", "blues", "--cache-dir", str(tmp_path)]
+        )
+        second = self.runner.invoke(
+            app, ["scale", "A", "blues", "--cache-dir", str(tmp_path)]
+        )
+
+        assert first.exit_code == 0
+        assert first.stdout == second.stdout
+        assert list(tmp_path.glob("renders-*.bin"))
+
+    def test_wide_scale_writes_cache_once(self, tmp_path, monkeypatch):
+        """Test every page of a wide diagram shares one disk cache."""
+        # Arrange
+        opened = []
+        original = DiskRenderCache.__init__
+
+        def init(cache, directory):
+            opened.append(directory)
+            original(cache, directory)
+
+        monkeypatch.setattr(DiskRenderCache, "__init__", init)
+
+        # Act
+        result = self.runner.invoke(
+            app,
+            ["scale", "A", "major", "--end", "36", "--cache-dir", str(tmp_path)],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        assert result.stdout.count("A Major Scale") == 3
+        assert len(opened) == 1
+
+    def test_blues_reads_cache_dir_from_env(self, tmp_path):
+        """Test GUITARRA_CACHE_DIR environment variable."""
+        result = self.runner.invoke(
+            app, ["blues", "A"], env={"GUITARRA_CACHE_DIR": str(tmp_path)}
+        )
+
+        assert result.exit_code == 0
+        assert "|    A |    A |    A |    A |" in result.stdout
+        assert list(tmp_path.glob("renders-*.bin"))
@@ -0,0 +1,75 @@
+"""Tests for the practice-book exporter."""
+
+import zipfile
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra.cli import app
+from guitarra.export import build_jobs, export_book, parse_window
+from guitarra.progressions import FORMS
+from guitarra.scales import Scale
+
+
+class TestExportBook:
+    """Test export_book function."""
+
+    def test_job_count(self):
+        """Test that every root, scale and window is covered plus blues forms."""
+        # Arrange & Act
+        jobs = build_jobs([(0, 12), (5, 9)])
+
+        # Assert
+        assert len(jobs) == 12 * len(Scale.SCALE_PATTERNS) * 2 + 12 * len(FORMS)
+
+    def test_export_to_directory(self, tmp_path):
+        """Test writing one file per diagram."""
+        # Arrange & Act
+        result = export_book(tmp_path, windows=[(5, 9)], workers=1)
+
+        # Assert
+        assert result.count == 12 * len(Scale.SCALE_PATTERNS) + 12 * len(FORMS)
+        diagram = (tmp_path / "scales" / "A" / "blues_5-9.txt").read_text()
+        assert diagram.startswith("A Blues Scale (Frets 5-9):")
+        assert "\x1b[" not in diagram
+        chart = (tmp_path / "blues" / "E_minor.txt").read_text()
+        assert chart.startswith("12 Bar Blues in E minor (i-iv-V):")
+
+    def test_archive_is_deterministic(self, tmp_path):
+        """Test that worker count does not change the archive."""
+        # Arrange
+        serial = tmp_path / "serial.zip"
+        parallel = tmp_path / "parallel.zip"
+
+        # Act
+        export_book(serial, windows=[(0, 5)], workers=1)
+        export_book(parallel, windows=[(0, 5)], workers=2, chunk_size=16)
+
+        # Assert
+        assert serial.read_bytes() == parallel.read_bytes()
+        with zipfile.ZipFile(serial) as zf:
+            assert zf.namelist()[0] == "scales/C/major_0-5.txt"
+
+    def test_parse_window(self):
+        """Test fret window parsing."""
+        assert parse_window("5-9") == (5, 9)
+        with pytest.raises(ValueError, match="Invalid fret window"):
+            parse_window("5")
+        with pytest.raises(ValueError, match="Start fret"):
+            parse_window("9-5")
+
+
+class TestExportCommand:
+    """Test export command."""
+
+    def test_export_command_reports_throughput(self, tmp_path):
+        """Test export command output."""
+        runner = CliRunner()
+
+        result = runner.invoke(
+            app, ["export", str(tmp_path / "book.zip"), "-w", "0-4", "-j", "1"]
+        )
+
+        assert result.exit_code == 0
+        assert "diagrams/sec" in result.stdout
+        assert (tmp_path / "book.zip").exists()
@@ -0,0 +1,146 @@
+"""Tests for scale fingerings."""
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra.cache import render_cache
+from guitarra.cli import app
+from guitarra.fingerings import SYSTEMS, find_fingerings, scale_fingerings
+from guitarra.scales import GuitarFretboard, Scale, note_index
+
+STANDARD = tuple(GuitarFretboard.STANDARD_TUNING)
+
+
+def _pitches(fingering):
+    """Pitches of a fingering in playing order, E2 = 4."""
+    opens = [4, 9, 14, 19, 23, 28]
+    return [
+        opens[string] + fret
+        for string, frets in enumerate(fingering.frets)
+        for fret in frets
+    ]
+
+
+class TestFindFingerings:
+    """Test find_fingerings function."""
+
+    @pytest.mark.parametrize("system", SYSTEMS)
+    @pytest.mark.parametrize("scale_name", ["major", "pentatonic_minor", "blues"])
+    def test_fingerings_play_the_scale(self, system, scale_name):
+        """Test consecutive scale tones, one finger per note, no open strings."""
+        # Arrange
+        mask = Scale.SCALE_MASKS[scale_name]
+
+        # Act
+        fingerings = find_fingerings(mask, STANDARD, system)
+
+        # Assert
+        assert fingerings
+        for fingering in fingerings:
+            pitches = _pitches(fingering)
+            tones = [
+                p for p in range(pitches[0], pitches[-1] + 1) if mask >> p % 12 & 1
+            ]
+            assert pitches == tones
+            assert fingering.span[0] >= 1
+            for fingers in fingering.fingers:
+                assert list(fingers) == sorted(set(fingers))
+
+    def test_three_notes_per_string(self):
+        """Test that 3nps has one position per degree with three notes each."""
+        fingerings = find_fingerings(Scale.SCALE_MASKS["major"], STANDARD, "3nps")
+        assert len(fingerings) == 7
+        assert all(len(frets) == 3 for f in fingerings for frets in f.frets)
+
+    def test_boxes_stay_in_position(self):
+        """Test that box fingerings fit under one hand, with stretches."""
+        fingerings = find_fingerings(Scale.SCALE_MASKS["pentatonic_minor"], STANDARD)
+        assert len(fingerings) == 5
+        assert all(high - low <= 5 for low, high in (f.span for f in fingerings))
+
+    def test_box_on_the_first_tone(self):
+        """Test a box starting on the lowest tone of the search range."""
+        # Arrange: no scale tone on frets 0-1 of the low E string
+        mask = sum(1 << pc for pc in (0, 3, 6, 9))
+
+        # Act
+        fingerings = find_fingerings(mask, STANDARD)
+
+        # Assert
+        assert fingerings[0].frets[0] == (2, 5)
+        assert fingerings[0].fingers[0] == (1, 4)
+
+    def test_caged_shapes(self):
+        """Test the five CAGED shapes, in CAGED order up the neck."""
+        # Arrange & Act
+        fingerings = find_fingerings(Scale.SCALE_MASKS["major"], STANDARD, "caged")
+
+        # Assert
+        names = "".join(f.name.removesuffix(" shape") for f in fingerings)
+        assert names in "CAGEDCAGED"
+        assert len(names) == 5
+
+    def test_unknown_system(self):
+        """Test error for an unknown fingering system."""
+        with pytest.raises(ValueError, match="Unknown fingering system: foo"):
+            find_fingerings(Scale.SCALE_MASKS["major"], STANDARD, "foo")
+
+
+class TestScaleFingerings:
+    """Test scale_fingerings function."""
+
+    def test_transposed_by_offset(self):
+        """Test that every key uses the shapes of C moved along the neck."""
+
+        def shape(fingering):
+            low = fingering.span[0]
+            return tuple(tuple(fret - low for fret in s) for s in fingering.frets)
+
+        # Arrange
+        c_major = scale_fingerings(Scale("C", "major"), "3nps")
+
+        # Act
+        a_major = scale_fingerings(Scale("A", "major"), "3nps")
+
+        # Assert
+        assert {shape(f) for f in a_major} == {shape(f) for f in c_major}
+        for fingering in a_major:
+            assert 1 <= fingering.span[0] <= 12
+            for fret in fingering.frets[0]:
+                assert note_index("E") + fret in Scale("A", "major")
+
+    def test_searched_once_per_pattern(self):
+        """Test that other keys of a scale hit the cached shapes."""
+        # Arrange
+        scale_fingerings(Scale("C", "dorian"), "box")
+        hits = render_cache.hits
+
+        # Act
+        for root in ("D", "Eb", "F#"):
+            scale_fingerings(Scale(root, "dorian"), "box")
+
+        # Assert
+        assert render_cache.hits - hits == 3
+
+
+class TestFingeringCommand:
+    """Test the fingering command."""
+
+    def test_one_position(self):
+        """Test showing a single CAGED shape."""
+        runner = CliRunner()
+
+        result = runner.invoke(
+            app, ["fingering", "C", "major", "-y", "caged", "-p", "3"]
+        )
+
+        assert result.exit_code == 0
+        assert result.stdout.startswith("C Major Scale, E shape (Frets ")
+
+    def test_position_out_of_range(self):
+        """Test error for a position the scale does not have."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["fingering", "A", "pentatonic_minor", "-p", "6"])
+
+        assert "No position 6 (this scale has 5)" in result.stderr
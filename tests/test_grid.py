@@ -0,0 +1,143 @@
+"""Tests for grid models and their output formats."""
+
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra.cli import app
+from guitarra.grid import (
+    FORMATS,
+    ChartGrid,
+    Serializer,
+    register_format,
+    serialize,
+)
+from guitarra.protocol import handle_request
+from guitarra.scales import GuitarFretboard, Scale
+
+
+@pytest.fixture
+def grid():
+    """A minor pentatonic over frets 5-8."""
+    return GuitarFretboard().scale_grid(Scale("A", "pentatonic_minor"), 5, 8)
+
+
+class TestFretboardFormats:
+    """Test serializers of fretboard grids."""
+
+    def test_text_matches_display_scale(self, grid):
+        """Test that ansi and plain output are the classic diagrams."""
+        fretboard = GuitarFretboard()
+        scale = Scale("A", "pentatonic_minor")
+
+        assert serialize(grid, "ansi") == fretboard.display_scale(scale, 5, 8)
+        assert serialize(grid, "plain") == fretboard.display_scale(
+            scale, 5, 8, color=False
+        )
+        assert "\x1b" not in serialize(grid, "plain")
+
+    def test_json(self, grid):
+        """Test every labelled position, strings numbered from the top."""
+        # Arrange & Act
+        data = json.loads(serialize(grid, "json"))
+
+        # Assert
+        assert data["type"] == "fretboard"
+        assert (data["start_fret"], data["end_fret"]) == (5, 8)
+        assert len(data["notes"]) == 12
+        assert {"string": 1, "fret": 5, "label": "A", "root": True} in data["notes"]
+        assert {"string": 6, "fret": 8, "label": "C", "root": False} in data["notes"]
+
+    def test_svg_is_well_formed(self, grid):
+        """Test one dot per labelled position, roots in red."""
+        # Arrange & Act
+        svg = ET.fromstring(serialize(grid, "svg"))
+
+        # Assert
+        circles = svg.findall("{http://www.w3.org/2000/svg}circle")
+        assert len(circles) == 12
+        assert sum(c.get("fill") == "#c0392b" for c in circles) == 3
+
+    def test_html(self, grid):
+        """Test a table row per string plus the fret numbers."""
+        html = serialize(grid, "html")
+
+        assert html.count("<tr>") == 7
+        assert html.count('class="root"') == 3
+
+
+class TestChartFormats:
+    """Test serializers of chord charts."""
+
+    def test_json_with_degrees(self):
+        """Test chords and degrees of each bar."""
+        # Arrange
+        chart = ChartGrid(("A7", "D7 E7"), ("I7", "IV7 V7"), "Two bars")
+
+        # Act
+        data = json.loads(serialize(chart, "json"))
+
+        # Assert
+        assert data["title"] == "Two bars"
+        assert data["bars"][1] == {"chords": ["D7", "E7"], "notes": "IV7 V7"}
+
+    def test_svg_is_well_formed(self):
+        """Test a box per bar."""
+        chart = ChartGrid(tuple("AADE"))
+
+        svg = ET.fromstring(serialize(chart, "svg"))
+
+        assert len(svg.findall("{http://www.w3.org/2000/svg}rect")) == 4
+
+
+class TestFormatRegistry:
+    """Test output format lookup and registration."""
+
+    def test_unknown_format(self, grid):
+        """Test error for an unknown format."""
+        with pytest.raises(ValueError, match="Unknown output format: pdf"):
+            serialize(grid, "pdf")
+
+    def test_register_format(self, grid, monkeypatch):
+        """Test plugging in another serializer."""
+        monkeypatch.setitem(FORMATS, "count", FORMATS["json"])
+        register_format(
+            "count",
+            Serializer(lambda g: str(len(g.rows)), lambda g: str(len(g.bars))),
+        )
+
+        assert serialize(grid, "count") == "6"
+
+
+class TestFormatOption:
+    """Test the --format option and the format request field."""
+
+    def test_scale_json(self):
+        """Test machine-readable scale output."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["scale", "C", "major", "-o", "json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["title"] == "C Major Scale (Frets 0-12):"
+
+    def test_blues_html_carries_title(self):
+        """Test that non-text charts include the title."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["blues", "E", "-o", "html"])
+
+        assert result.exit_code == 0
+        assert result.stdout.startswith('<table class="chart">')
+        assert "<caption>12 Bar Blues in E major (I-IV-V):</caption>" in result.stdout
+
+    def test_batch_request_format(self):
+        """Test the format field of scale requests."""
+        response = handle_request(
+            {"op": "scale", "root": "G", "scale": "blues", "format": "json"}
+        )
+
+        assert response["ok"]
+        assert json.loads(response["output"])["type"] == "fretboard"
@@ -0,0 +1,105 @@
+"""Tests for reverse scale identification."""
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra.cli import app
+from guitarra.identify import identify_mask, identify_scales, scale_index
+from guitarra.scales import Scale
+
+
+class TestIdentifyScales:
+    """Test identify_scales function."""
+
+    def test_index_covers_every_root_and_scale(self):
+        """Test that the index holds every root x scale combination."""
+        # Arrange & Act & Assert
+        assert len(scale_index()) == 12 * len(Scale.SCALE_PATTERNS)
+
+    def test_exact_match_major(self):
+        """Test exact matches for the C major collection."""
+        # Arrange & Act
+        matches = identify_scales(list("CDEFGAB"), exact=True)
+
+        # Assert
+        found = {(match.root, match.scale_name) for match in matches}
+        assert ("C", "major") in found
+        assert ("A", "minor") in found
+        assert ("D", "dorian") in found
+        assert all(match.exact for match in matches)
+        # Root on the first given note ranks first
+        assert (matches[0].root, matches[0].scale_name) == ("C", "major")
+
+    def test_containing_match_ranked_by_fit(self):
+        """Test that smaller supersets and the first note's root rank first."""
+        # Arrange & Act
+        matches = identify_scales(["C", "E", "G", "Bb"])
+
+        # Assert
+        assert (matches[0].root, matches[0].scale_name) == ("C", "mixolydian")
+        extras = [match.extra_notes for match in matches]
+        assert extras == sorted(extras)
+        for match in matches:
+            assert all(note in Scale(match.root, match.scale_name) for note in "CEG")
+
+    def test_flat_and_sharp_spellings_agree(self):
+        """Test that enharmonic spellings give the same result."""
+        # Arrange & Act & Assert
+        assert identify_scales(["Bb", "D", "F"]) == identify_scales(["A#", "D", "F"])
+
+    def test_no_match(self):
+        """Test that a chromatic cluster matches nothing exactly."""
+        # Arrange & Act & Assert
+        assert identify_scales(["C", "C#", "D", "D#"], exact=True) == []
+
+    def test_lookup_is_memoized(self):
+        """Test that repeated queries hit the cache."""
+        # Arrange
+        identify_mask.cache_clear()
+
+        # Act
+        identify_scales(["A", "C", "E"])
+        identify_scales(["A", "C", "E"])
+
+        # Assert
+        assert identify_mask.cache_info().hits == 1
+
+    def test_invalid_note(self):
+        """Test error handling for invalid notes."""
+        # Arrange & Act & Assert
+        with pytest.raises(ValueError, match="Invalid note"):
+            identify_scales(["C", "H"])
+
+
+class TestIdentifyCommand:
+    """Test identify command."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    def test_identify_command(self):
+        """Test identify command output."""
+        result = self.runner.invoke(app, ["identify", "C", "E", "G", "Bb"])
+
+        assert result.exit_code == 0
+        assert "Scales containing C E G Bb:" in result.stdout
+        assert "C Mixolydian (+3: D, F, A)" in result.stdout
+
+    def test_identify_command_exact(self):
+        """Test identify command with exact matching."""
+        result = self.runner.invoke(
+            app, ["identify", "A", "C", "D", "E", "G", "--exact"]
+        )
+
+        assert result.exit_code == 0
+        assert "A Pentatonic Minor (exact match)" in result.stdout
+        assert "C Pentatonic Major (exact match)" in result.stdout
+        assert "+" not in result.stdout
+
+    def test_identify_command_invalid_note(self):
+        """Test identify command with an invalid note."""
+        result = self.runner.invoke(app, ["identify", "C", "X"])
+
+        assert result.exit_code == 0
+        assert "Error: Invalid note: X" in result.stderr
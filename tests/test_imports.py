@@ -0,0 +1,34 @@
+"""Tests for import-time dependencies."""
+
+import subprocess
+import sys
+
+
+def _loaded_modules(statement: str, modules: list[str]) -> list[str]:
+    """Run `statement` in a fresh interpreter and report which modules loaded."""
+    code = (
+        f"import sys; {statement}; "
+        f"print(','.join(m for m in {modules!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+class TestImports:
+    """Test that heavy modules are only loaded where needed."""
+
+    def test_library_does_not_import_cli_dependencies(self):
+        """Test that scales and blues are usable without typer or audio."""
+        loaded = _loaded_modules(
+            "import guitarra.scales, guitarra.blues", ["typer", "metronome_rs"]
+        )
+
+        assert loaded == []
+
+    def test_cli_does_not_import_metronome(self):
+        """Test that the CLI defers loading the audio module."""
+        loaded = _loaded_modules("import guitarra.cli", ["metronome_rs"])
+
+        assert loaded == []
@@ -0,0 +1,122 @@
+"""Tests for the name lookup index."""
+
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra.cli import (
+    app,
+    complete_form_name,
+    complete_root_note,
+    complete_scale_name,
+)
+from guitarra.lookup import NameIndex, describe_unknown, normalize_name
+
+NAMES = ["major", "minor", "mixolydian", "melodic_minor", "harmonic_minor"]
+ALIASES = {"natural minor": "minor", "mixo": "mixolydian", "harm min": "harmonic_minor"}
+
+
+@pytest.fixture
+def index():
+    """An index over a few scale names and aliases."""
+    return NameIndex(NAMES, ALIASES)
+
+
+class TestNormalizeName:
+    """Test normalize_name function."""
+
+    @pytest.mark.parametrize(
+        "text", ["Natural Minor", "natural-minor", " natural__minor ", "NATURAL minor"]
+    )
+    def test_separators_and_case(self, text):
+        """Test case and separators are ignored."""
+        assert normalize_name(text) == "natural_minor"
+
+
+class TestNameIndex:
+    """Test NameIndex class."""
+
+    def test_complete_ranks_names_before_aliases(self, index):
+        """Test names matching the prefix come first, in catalog order."""
+        assert index.complete("m") == ["major", "minor", "mixolydian", "melodic_minor"]
+        assert index.complete("h") == ["harmonic_minor"]
+        assert index.complete("nat") == ["minor"]
+        assert index.complete("m", limit=2) == ["major", "minor"]
+        assert index.complete("x") == []
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("minor", "minor"),
+            ("Natural Minor", "minor"),
+            ("harm-min", "harmonic_minor"),
+            ("mixolidian", "mixolydian"),
+            ("mixolyidan", "mixolydian"),
+            ("melodic minr", "melodic_minor"),
+            ("minr", "minor"),
+        ],
+    )
+    def test_resolve(self, index, text, expected):
+        """Test names, aliases and small typos resolve."""
+        assert index.resolve(text) == expected
+
+    def test_resolve_rejects_ambiguous_and_distant(self, index):
+        """Test no guess between equally close names, or far from any name."""
+        assert index.resolve("mijor") is None  # one edit from major and minor
+        assert index.resolve("lydian") is None
+        assert index.resolve("mi") is None  # too short to correct
+        assert index.resolve("minr", typos=0) is None
+
+    def test_suggest(self, index):
+        """Test suggestions from a prefix, or from close names."""
+        assert index.suggest("mel") == ["melodic_minor"]
+        assert index.suggest("mijor") == ["major", "minor"]
+        assert index.suggest("chromatic") == []
+
+    def test_describe_unknown(self, index):
+        """Test error messages carry the suggestions."""
+        assert describe_unknown("scale", "mijor", index) == (
+            "Unknown scale: mijor (did you mean major, minor?)"
+        )
+        assert describe_unknown("scale", "zzz", index) == "Unknown scale: zzz"
+
+    def test_large_catalog(self):
+        """Test lookups stay fast with hundreds of names."""
+        # Arrange
+        names = [f"{mode}_{degree}" for mode in NAMES for degree in range(100)]
+        index = NameIndex(names)
+
+        # Act
+        start = time.perf_counter()
+        for _ in range(100):
+            resolved = index.resolve("mixolydain_42")
+            completed = index.complete("harmonic_minor_9")
+        elapsed = time.perf_counter() - start
+
+        # Assert
+        assert resolved == "mixolydian_42"
+        assert completed[0] == "harmonic_minor_9"
+        assert len(completed) == 11
+        assert elapsed < 0.5
+
+
+class TestCli:
+    """Test completion and error suggestions in the CLI."""
+
+    def test_completion(self):
+        """Test completion callbacks match names and aliases."""
+        assert complete_root_note("b") == ["B", "Bb"]
+        assert complete_scale_name("natural") == ["minor"]
+        assert complete_form_name("8") == ["eight_bar"]
+
+    def test_unknown_scale_suggestions(self):
+        """Test the error suggests scales and the scale runs on typos."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["scale", "C", "penta"])
+        fixed = runner.invoke(app, ["scale", "C", "mixolidian"])
+
+        assert "did you mean pentatonic_major, pentatonic_minor?" in result.stderr
+        assert "Available scales:" in result.stderr
+        assert fixed.stdout.startswith("C Mixolydian Scale")
@@ -1,10 +1,12 @@
 """Tests for metronome functionality."""
 
+import json
 from unittest.mock import patch
 
 from typer.testing import CliRunner
 
 from guitarra.cli import app
+from guitarra.session import SessionStats
 
 
 class TestMetronomeCommand:
@@ -17,7 +19,9 @@ class TestMetronomeCommand:
     def test_metronome_basic_usage(self):
         """Test basic metronome usage with valid BPM."""
         with patch("metronome_rs.py_start_practice_metronome") as mock_start:
-            with patch("time.sleep", side_effect=KeyboardInterrupt):
+            with patch(
+                "guitarra.session.MetronomeSession.run", side_effect=KeyboardInterrupt
+            ):
                 with patch("metronome_rs.py_stop_global_metronome") as mock_stop:
                     result = self.runner.invoke(app, ["metronome", "120"])
 
@@ -29,7 +33,9 @@ class TestMetronomeCommand:
     def test_metronome_with_custom_beats(self):
         """Test metronome with custom beats per measure."""
         with patch("metronome_rs.py_start_practice_metronome") as mock_start:
-            with patch("time.sleep", side_effect=KeyboardInterrupt):
+            with patch(
+                "guitarra.session.MetronomeSession.run", side_effect=KeyboardInterrupt
+            ):
                 with patch("metronome_rs.py_stop_global_metronome"):
                     result = self.runner.invoke(
                         app, ["metronome", "100", "--beats", "3"]
@@ -50,7 +56,9 @@ class TestMetronomeCommand:
     def test_metronome_with_eighth_notes(self):
         """Test metronome with eighth note subdivisions."""
         with patch("metronome_rs.py_start_metronome_with_eighth_notes") as mock_eighth:
-            with patch("time.sleep", side_effect=KeyboardInterrupt):
+            with patch(
+                "guitarra.session.MetronomeSession.run", side_effect=KeyboardInterrupt
+            ):
                 with patch("metronome_rs.py_stop_global_metronome"):
                     result = self.runner.invoke(
                         app, ["metronome", "120", "--subdivisions", "eighth"]
@@ -63,7 +71,9 @@ class TestMetronomeCommand:
     def test_metronome_with_performance_style(self):
         """Test metronome with performance style."""
         with patch("metronome_rs.py_start_performance_metronome") as mock_perf:
-            with patch("time.sleep", side_effect=KeyboardInterrupt):
+            with patch(
+                "guitarra.session.MetronomeSession.run", side_effect=KeyboardInterrupt
+            ):
                 with patch("metronome_rs.py_stop_global_metronome"):
                     result = self.runner.invoke(
                         app, ["metronome", "140", "--style", "performance"]
@@ -75,7 +85,9 @@ class TestMetronomeCommand:
     def test_metronome_simple_style(self):
         """Test metronome with simple style."""
         with patch("metronome_rs.py_start_simple_metronome") as mock_simple:
-            with patch("time.sleep", side_effect=KeyboardInterrupt):
+            with patch(
+                "guitarra.session.MetronomeSession.run", side_effect=KeyboardInterrupt
+            ):
                 with patch("metronome_rs.py_stop_global_metronome"):
                     result = self.runner.invoke(
                         app, ["metronome", "90", "--style", "simple"]
@@ -84,6 +96,39 @@ class TestMetronomeCommand:
                     assert result.exit_code == 0
                     mock_simple.assert_called_once_with(90)
 
+    def test_metronome_prints_session_stats_as_json(self):
+        """Test session statistics are printed as JSON on exit."""
+        stats = SessionStats(
+            beats=8,
+            missed_beats=0,
+            elapsed_s=4.0,
+            mean_jitter_ms=0.2,
+            stdev_jitter_ms=0.1,
+            max_jitter_ms=0.5,
+            drift_ms_per_min=0.0,
+        )
+        with patch("metronome_rs.py_start_practice_metronome"):
+            with patch("guitarra.session.MetronomeSession.run", return_value=stats):
+                with patch("metronome_rs.py_stop_global_metronome") as mock_stop:
+                    result = self.runner.invoke(
+                        app, ["metronome", "120", "--stats-json"]
+                    )
+
+                    assert result.exit_code == 0
+                    mock_stop.assert_called_once()
+                    last_line = result.stdout.strip().splitlines()[-1]
+                    assert json.loads(last_line)["beats"] == 8
+
+    def test_metronome_stats_json_rejects_duration(self):
+        """Test --stats-json is refused for timed playback, which has no session."""
+        with patch("metronome_rs.py_play_metronome_for_duration") as mock_play:
+            result = self.runner.invoke(
+                app, ["metronome", "120", "--duration", "5", "--stats-json"]
+            )
+
+        assert "--stats-json cannot be combined with --duration" in result.output
+        mock_play.assert_not_called()
+
     def test_metronome_invalid_bpm_low(self):
         """Test metronome with BPM too low."""
         result = self.runner.invoke(app, ["metronome", "20"])
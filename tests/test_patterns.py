@@ -0,0 +1,139 @@
+"""Tests for metronome click patterns."""
+
+import itertools
+import wave
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra.cli import app
+from guitarra.patterns import compile_pattern, standard_pattern
+
+
+class TestCompilePattern:
+    """Test compile_pattern function."""
+
+    def test_accent_map(self):
+        """Test one click per mark, with rests left out."""
+        # Arrange & Act
+        pattern = compile_pattern("X-x. | x-x-", "eighth")
+
+        # Assert
+        assert list(pattern.offsets) == [0.0, 0.5, 1.0, 2.0, 2.5, 3.0, 3.5]
+        assert [pattern.level(i) for i in range(4)] == [
+            "accent",
+            "subdivision",
+            "regular",
+            "regular",
+        ]
+        assert pattern.cycle_beats == 4
+
+    def test_odd_grouping(self):
+        """Test 7/8 as 2+2+3 accents each group start."""
+        # Arrange & Act
+        pattern = compile_pattern("2+2+3", "eighth")
+
+        # Assert
+        assert list(pattern.levels) == [0, 2, 1, 2, 1, 2, 2]
+        assert pattern.cycle_beats == 3.5
+
+    @pytest.mark.parametrize("spec, clicks", [("3:2", 4), ("4:3", 6), ("5:4", 8)])
+    def test_polyrhythm_merges_shared_downbeat(self, spec, clicks):
+        """Test that both pulses sound, sharing one accented downbeat."""
+        # Arrange & Act
+        pattern = compile_pattern(spec)
+
+        # Assert
+        assert len(pattern) == clicks
+        assert pattern.level(0) == "accent"
+        assert list(pattern.offsets) == sorted(pattern.offsets)
+
+    def test_polyrhythm_positions(self):
+        """Test 3:2 places the cross rhythm at thirds of two beats."""
+        # Arrange & Act
+        pattern = compile_pattern("3:2")
+
+        # Assert
+        assert list(pattern.offsets) == pytest.approx([0, 2 / 3, 1, 4 / 3])
+        assert list(pattern.levels) == [0, 2, 1, 2]
+        assert pattern.cycle_beats == 2
+
+    @pytest.mark.parametrize("spec", ["", "...", "X?x", "2+a", "3:2:1", "0:2"])
+    def test_invalid_patterns(self, spec):
+        """Test that malformed patterns are rejected."""
+        with pytest.raises(ValueError, match="Invalid pattern"):
+            compile_pattern(spec)
+
+    def test_compiled_once(self):
+        """Test that compiling the same pattern reuses the schedule."""
+        assert compile_pattern("2+2+3", "eighth") is compile_pattern("2+2+3", "eighth")
+
+
+class TestClickPattern:
+    """Test ClickPattern playback and rendering schedules."""
+
+    def test_schedule_repeats_cycles(self):
+        """Test click times continue across cycles without drift."""
+        # Arrange
+        pattern = compile_pattern("3:2")
+
+        # Act
+        times = list(itertools.islice(pattern.schedule(60), 4001))
+
+        # Assert
+        assert times[4] == 2.0
+        assert times[4000] == 2000.0
+
+    def test_standard_pattern_events(self):
+        """Test the plain measure pattern places evenly spaced clicks."""
+        # Arrange
+        pattern = standard_pattern(3, "triplets")
+
+        # Act
+        events = list(pattern.events(90, 44100 * 10, 44100))
+
+        # Assert
+        assert len(events) == 45
+        assert [frame for frame, _ in events] == [i * 9800 for i in range(45)]
+        assert [level for _, level in events[:4]] == [
+            "accent",
+            "subdivision",
+            "subdivision",
+            "regular",
+        ]
+
+    def test_standard_pattern_unknown_subdivisions(self):
+        """Test unknown subdivisions are an error, not quarter notes."""
+        with pytest.raises(ValueError, match="Unknown subdivisions: fifths"):
+            standard_pattern(4, "fifths")
+
+
+class TestPatternOption:
+    """Test the metronome --pattern option."""
+
+    def test_render_pattern(self, tmp_path):
+        """Test rendering a grouping without an audio device."""
+        runner = CliRunner()
+        path = tmp_path / "seven.wav"
+
+        result = runner.invoke(
+            app,
+            ["metronome", "120", "-d", "2", "-s", "eighth", "-p", "2+2+3"]
+            + ["--render", str(path)],
+        )
+
+        assert result.exit_code == 0
+        assert "pattern 2+2+3" in result.stdout
+        with wave.open(str(path), "rb") as wav:
+            assert wav.getnframes() == 2 * 44100
+
+    def test_invalid_pattern(self, tmp_path):
+        """Test error message for an invalid pattern."""
+        runner = CliRunner()
+
+        result = runner.invoke(
+            app, ["metronome", "120", "-p", "X?", "--render", str(tmp_path / "x")]
+        )
+
+        assert result.exit_code == 0
+        assert "Invalid pattern" in result.stderr
@@ -0,0 +1,143 @@
+"""Tests for the pitch core: note spellings and key-aware names."""
+
+import pytest
+
+from guitarra.pitch import (
+    SPELLINGS,
+    find_note,
+    key_tonic,
+    parse_note,
+    parse_root,
+    pitch_class,
+    prefers_flats,
+    spell_chord,
+    spell_scale,
+)
+from guitarra.scales import Scale
+from guitarra.voicings import chord_notes
+
+
+class TestParseNote:
+    """Test note spellings."""
+
+    @pytest.mark.parametrize(
+        "text, name, expected",
+        [
+            ("Bb", "Bb", 10),
+            ("bb", "Bb", 10),
+            ("b", "B", 11),
+            ("BB", "Bb", 10),
+            ("B\u266d", "Bb", 10),
+            ("B flat", "Bb", 10),
+            ("c sharp", "C#", 1),
+            ("E#", "E#", 5),
+            ("Cb", "Cb", 11),
+            ("Fb", "Fb", 4),
+            ("C##", "C##", 2),
+            ("Cx", "C##", 2),
+            ("Dbb", "Dbb", 0),
+            ("bbb", "Bbb", 9),
+        ],
+    )
+    def test_spellings(self, text, name, expected):
+        """Test accidentals, case, Unicode and words."""
+        note = parse_note(text)
+        assert note.name == name
+        assert note.pitch_class == expected
+        assert pitch_class(text) == expected
+
+    def test_notes_are_interned(self):
+        """Test every spelling of a note gives the same object."""
+        assert parse_note("bb") is parse_note("B flat") is SPELLINGS["Bb"]
+
+    @pytest.mark.parametrize("text", ["H", "", "C###", "Cbbb", "#C"])
+    def test_invalid(self, text):
+        """Test spellings that are not notes."""
+        assert find_note(text) is None
+        with pytest.raises(ValueError, match="Invalid note"):
+            parse_note(text)
+
+    def test_root_without_double_accidentals(self):
+        """Test roots are respelled without double sharps or flats."""
+        assert parse_root("Cx").name == "D"
+        assert parse_root("Ebb").name == "D"
+        assert parse_root("Cb").name == "Cb"
+        with pytest.raises(ValueError, match="Invalid root note: H"):
+            parse_root("h")
+
+
+class TestKeys:
+    """Test key signatures and key-aware spelling."""
+
+    def test_key_tonics(self):
+        """Test the usual spelling of each tonic."""
+        assert [key_tonic(pc).name for pc in (1, 3, 6, 8, 10)] == [
+            "Db",
+            "Eb",
+            "F#",
+            "Ab",
+            "Bb",
+        ]
+        assert [key_tonic(pc, minor=True).name for pc in (1, 3, 6, 8, 10)] == [
+            "C#",
+            "Eb",
+            "F#",
+            "G#",
+            "Bb",
+        ]
+
+    @pytest.mark.parametrize(
+        "tonic, minor, expected",
+        [
+            ("F", False, True),
+            ("D", True, True),
+            ("E", True, False),
+            ("A#", False, False),
+        ],
+    )
+    def test_prefers_flats(self, tonic, minor, expected):
+        """Test natural tonics follow the key signature, others their accidental."""
+        assert prefers_flats(parse_note(tonic), minor) is expected
+
+    @pytest.mark.parametrize(
+        "root, scale_name, expected",
+        [
+            ("F", "major", ["F", "G", "A", "Bb", "C", "D", "E"]),
+            ("Gb", "major", ["Gb", "Ab", "Bb", "Cb", "Db", "Eb", "F"]),
+            ("F#", "major", ["F#", "G#", "A#", "B", "C#", "D#", "E#"]),
+            ("C", "minor", ["C", "D", "Eb", "F", "G", "Ab", "Bb"]),
+            ("C", "blues", ["C", "Eb", "F", "Gb", "G", "Bb"]),
+            ("A#", "major", ["A#", "C", "D", "D#", "F", "G", "A"]),
+        ],
+    )
+    def test_scale_spelling(self, root, scale_name, expected):
+        """Test one letter per degree, with the key signature as fallback."""
+        assert Scale(root, scale_name).get_scale_notes() == expected
+
+    def test_spell_scale_starts_on_tonic(self):
+        """Test the tonic keeps its spelling with the key signature."""
+        tonic = parse_note("Cb")
+        assert spell_scale(tonic, [11, 1, 3, 6, 8]) == ("Cb", "Db", "Eb", "Gb", "Ab")
+
+    @pytest.mark.parametrize(
+        "symbol, expected",
+        [
+            ("C7", ["C", "E", "G", "Bb"]),
+            ("Bbmaj7", ["Bb", "D", "F", "A"]),
+            ("C7#9", ["C", "E", "G", "Bb", "D#"]),
+            ("Cdim7", ["C", "Eb", "Gb", "A"]),
+        ],
+    )
+    def test_chord_spelling(self, symbol, expected):
+        """Test chord tones take their letter from the interval."""
+        assert chord_notes(symbol) == expected
+
+    def test_spell_chord_falls_back_to_signature(self):
+        """Test chords needing double sharps use the sharps of the root."""
+        assert spell_chord(parse_note("G#"), (0, 4, 7, 10, 15)) == (
+            "G#",
+            "C",
+            "D#",
+            "F#",
+            "B",
+        )
@@ -0,0 +1,195 @@
+"""Tests for practice programs."""
+
+import wave
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra.cli import app
+from guitarra.program import Segment, Timeline, load_program, parse_program, play
+
+PROGRAM = """
+beats = 4
+
+[[segment]]
+bars = 2
+bpm = 80
+
+[[segment]]
+bars = 4
+bpm = 85
+step = 5
+until = 100
+
+[[segment]]
+bars = 1
+bpm = 120
+subdivisions = "triplets"
+"""
+
+
+class TestParseProgram:
+    """Test program parsing and expansion."""
+
+    def test_ramp_expansion(self, tmp_path):
+        """Test that ramps expand into one segment per tempo."""
+        # Arrange
+        path = tmp_path / "program.toml"
+        path.write_text(PROGRAM)
+
+        # Act
+        segments, style = load_program(path)
+
+        # Assert
+        assert style == "practice"
+        assert [segment.bpm for segment in segments] == [80, 85, 90, 95, 100, 120]
+        assert segments[-1] == Segment(1, 120, 4, "triplets")
+
+    def test_settings_carry_over(self):
+        """Test that beats and subdivisions persist until changed."""
+        # Arrange & Act
+        segments = parse_program(
+            {
+                "segment": [
+                    {"bars": 1, "bpm": 90, "beats": 3, "subdivisions": "eighth"},
+                    {"bars": 1, "bpm": 100},
+                ]
+            }
+        )
+
+        # Assert
+        assert segments[1] == Segment(1, 100, 3, "eighth")
+
+    @pytest.mark.parametrize(
+        ("segment", "message"),
+        [
+            ({"bars": 1}, "Segment 1: missing field: bpm"),
+            ({"bars": 1, "bpm": 400}, "Segment 1: BPM must be between 30 and 300"),
+            ({"bars": 0, "bpm": 100}, "Segment 1: bars must be at least 1"),
+            ({"bars": 1, "bpm": 100, "step": 5}, "Segment 1: a ramp needs 'until'"),
+            (
+                {"bars": 1, "bpm": 100, "step": 5, "until": 90},
+                "Segment 1: step must move from bpm towards until",
+            ),
+            (
+                {"bars": 1, "bpm": 100, "subdivisions": "fifths"},
+                "Segment 1: unknown subdivisions: fifths",
+            ),
+            ({"bars": "8", "bpm": 100}, "Segment 1: bars must be a whole number"),
+            ({"bars": 8.5, "bpm": 100}, "Segment 1: bars must be a whole number"),
+            ({"bars": True, "bpm": 100}, "Segment 1: bars must be a whole number"),
+            ({"bars": 1, "bpm": "fast"}, "Segment 1: bpm must be a number"),
+            ({"bars": 1, "bpm": 100, "beats": 3.5}, "beats must be a whole number"),
+            (
+                {"bars": 1, "bpm": 100, "step": 5, "until": "x"},
+                "Segment 1: until must be a number",
+            ),
+            (
+                {"bars": 1, "bpm": 100, "step": "5", "until": 120},
+                "Segment 1: step must be a number",
+            ),
+            (
+                {"bars": 1, "bpm": 100, "subdivisions": ["eighth"]},
+                "Segment 1: subdivisions must be a name",
+            ),
+        ],
+    )
+    def test_invalid_segments(self, segment, message):
+        """Test validation errors name the segment."""
+        with pytest.raises(ValueError, match=message):
+            parse_program({"segment": [segment]})
+
+    @pytest.mark.parametrize(
+        ("data", "message"),
+        [
+            ({"segment": 3}, "Program segments must be \\[\\[segment\\]\\] tables"),
+            ({"segment": {"bars": 1}}, "Program segments must be"),
+            ({"segment": [{"bars": 1, "bpm": 90}, 3]}, "Segment 2: must be a table"),
+            ({"beats": "4", "segment": [{"bars": 1, "bpm": 90}]}, "Segment 1: beats"),
+        ],
+    )
+    def test_invalid_structure(self, data, message):
+        """Test programs whose values have the wrong TOML types."""
+        with pytest.raises(ValueError, match=message):
+            parse_program(data)
+
+    def test_empty_program(self):
+        """Test error for a program without segments."""
+        with pytest.raises(ValueError, match="Program has no segments"):
+            parse_program({})
+
+
+class TestTimeline:
+    """Test Timeline class."""
+
+    def test_segments_join_without_gap(self):
+        """Test that each segment starts where the previous one ends."""
+        # Arrange
+        segments = [Segment(1, 120, 4), Segment(1, 60, 2, "eighth")]
+
+        # Act
+        timeline = Timeline(segments)
+
+        # Assert
+        assert list(timeline.segment_starts) == [0.0, 2.0]
+        assert list(timeline.times) == [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5]
+        assert timeline.level(0) == "accent"
+        assert timeline.level(1) == "regular"
+        assert timeline.level(5) == "subdivision"
+        assert timeline.duration_s == 4.0
+
+    def test_render(self, tmp_path):
+        """Test rendering a timeline to WAV."""
+        # Arrange
+        timeline = Timeline([Segment(1, 240, 4)])
+        path = tmp_path / "program.wav"
+
+        # Act
+        frames = timeline.render(path, sample_rate=8000)
+
+        # Assert
+        with wave.open(str(path), "rb") as wav:
+            assert wav.getnframes() == frames == 8000
+
+    def test_play_calls_click_per_level(self):
+        """Test live playback with a single scheduler."""
+        # Arrange
+        timeline = Timeline([Segment(1, 300, 2), Segment(1, 300, 2, "eighth")])
+        clicks = []
+
+        # Act
+        stats = play(timeline, clicks.append)
+
+        # Assert
+        assert clicks == ["accent", "regular", "accent", "subdivision"] + [
+            "regular",
+            "subdivision",
+        ]
+        assert stats.beats + stats.missed_beats == 6
+
+
+class TestProgramCommand:
+    """Test program command."""
+
+    def test_render_program(self, tmp_path):
+        """Test rendering a program from the CLI."""
+        runner = CliRunner()
+        path = tmp_path / "program.toml"
+        path.write_text(PROGRAM)
+        output = tmp_path / "program.wav"
+
+        result = runner.invoke(app, ["program", str(path), "--render", str(output)])
+
+        assert result.exit_code == 0
+        assert "Program: 6 segments, 19 bars, 84 clicks" in result.stdout
+        assert output.exists()
+
+    def test_wrong_types_are_errors(self, tmp_path):
+        """Test valid TOML with wrong value types reports an error, not a crash."""
+        path = tmp_path / "program.toml"
+        path.write_text('[[segment]]\nbars = "8"\nbpm = 90\n')
+
+        result = CliRunner().invoke(app, ["program", str(path)])
+
+        assert result.exit_code == 0
+        assert "Error: Segment 1: bars must be a whole number" in result.output
@@ -0,0 +1,164 @@
+"""Tests for chord progression forms."""
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra.blues import TwelveBarBlues
+from guitarra.cli import app
+from guitarra.pitch import key_tonic
+from guitarra.progressions import (
+    FORMS,
+    format_chart,
+    get_form,
+    parse_chord_degree,
+    parse_form,
+)
+
+
+class TestParseForm:
+    """Test parsing Roman-numeral forms."""
+
+    @pytest.mark.parametrize(
+        "token, expected",
+        [
+            ("I", (0, "")),
+            ("iv", (5, "m")),
+            ("V7", (7, "7")),
+            ("ii7", (2, "m7")),
+            ("bVII9", (10, "9")),
+            ("#ivdim7", (6, "dim7")),
+            ("viim7b5", (11, "m7b5")),
+            ("IVmaj7", (5, "maj7")),
+        ],
+    )
+    def test_chord_degrees(self, token, expected):
+        """Test numerals, accidentals and chord qualities."""
+        assert parse_chord_degree(token) == expected
+
+    @pytest.mark.parametrize("token", ["X7", "Iv", "I7foo", ""])
+    def test_invalid_chord_degrees(self, token):
+        """Test that unknown numerals and qualities are rejected."""
+        with pytest.raises(ValueError):
+            parse_chord_degree(token)
+
+    def test_bars_with_several_chords(self):
+        """Test custom forms with two chords in a bar."""
+        # Arrange & Act
+        form = parse_form("I7 | IV7 | ii7 V7")
+
+        # Assert
+        assert form.degrees == ("I7", "IV7", "ii7 V7")
+        assert form.in_key(7) == ["G7", "C7", "Am7 D7"]
+
+    def test_empty_bar(self):
+        """Test error for a bar without chords."""
+        with pytest.raises(ValueError, match="at least one chord"):
+            parse_form("I | | V")
+
+
+class TestForms:
+    """Test built-in forms."""
+
+    @pytest.mark.parametrize(
+        "name, bars", [("quick_change", 12), ("eight_bar", 8), ("sixteen_bar", 16)]
+    )
+    def test_form_lengths(self, name, bars):
+        """Test bar count of each form."""
+        assert len(get_form(name).in_key(0)) == bars
+
+    def test_jazz_blues_in_f(self):
+        """Test jazz blues chords with extended qualities."""
+        # Arrange & Act
+        chords = get_form("jazz").in_key(5)
+
+        # Assert
+        assert chords[3] == "Cm7 F7"
+        assert chords[5] == "Bdim7"
+        assert chords[-2:] == ["F7 D7", "Gm7 C7"]
+
+    def test_all_keys_match_per_key_objects(self):
+        """Test the transposition table against per-key construction."""
+        for name in FORMS:
+            form = get_form(name)
+            for key, chords in enumerate(form.in_all_keys()):
+                root = key_tonic(key, form.minor).name
+                assert TwelveBarBlues(root).get_progression(name) == chords
+
+    def test_unknown_form(self):
+        """Test error for an unknown form name."""
+        with pytest.raises(ValueError, match="Unknown form"):
+            get_form("polka")
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [("8 bar", "eight_bar"), ("Quick Change", "quick_change"), ("jaz", "jazz")],
+    )
+    def test_form_aliases_and_typos(self, name, expected):
+        """Test aliases and misspelled form names."""
+        assert get_form(name).name == expected
+        assert TwelveBarBlues("A").get_progression(name) == get_form(expected).in_key(9)
+
+
+class TestFormatChart:
+    """Test format_chart function."""
+
+    def test_eight_bars_with_degrees(self):
+        """Test that charts are not limited to 12 bars."""
+        # Arrange
+        form = get_form("eight_bar")
+
+        # Act
+        chart = format_chart(form.in_key(9), form.degrees)
+
+        # Assert
+        assert chart.split("\n") == [
+            "|   A7 |   E7 |   D7 |   D7 |",
+            "|   I7 |   V7 |  IV7 |  IV7 |",
+            "",
+            "|   A7 |   E7 |   A7 |   E7 |",
+            "|   I7 |   V7 |   I7 |   V7 |",
+        ]
+
+    def test_partial_last_row_and_wide_cells(self):
+        """Test that cells widen to fit and short rows are kept."""
+        # Act
+        chart = format_chart(["C", "F", "G7", "C", "Dm7 G7"])
+
+        # Assert
+        assert chart.split("\n") == [
+            "|      C |      F |     G7 |      C |",
+            "| Dm7 G7 |",
+        ]
+
+
+class TestBluesFormOption:
+    """Test the blues --form and --custom options."""
+
+    def test_form_option(self):
+        """Test rendering a built-in form."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["blues", "Bb", "--form", "jazz", "-d"])
+
+        assert result.exit_code == 0
+        assert "Jazz Blues in Bb:" in result.stdout
+        assert "#ivdim7" in result.stdout
+
+    def test_custom_option(self):
+        """Test rendering a custom form."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["blues", "C", "--custom", "I | vi | ii7 | V7"])
+
+        assert result.exit_code == 0
+        assert "Progression in C:" in result.stdout
+        assert "|    C |   Am |  Dm7 |   G7 |" in result.stdout
+
+    def test_unknown_form(self):
+        """Test error message listing the valid forms."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["blues", "C", "--form", "polka"])
+
+        assert "Unknown form: polka" in result.stderr
+        assert "Valid forms: major, minor" in result.stderr
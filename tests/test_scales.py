@@ -1,8 +1,10 @@
 """Tests for guitar scale functionality."""
 
 import pytest
+from typer.testing import CliRunner
 
-from guitarra.scales import GuitarFretboard, Scale
+from guitarra.cli import app
+from guitarra.scales import GuitarFretboard, Scale, fret_pages, rotate_mask
 
 
 class TestScale:
@@ -57,13 +59,14 @@ class TestScale:
         assert notes == expected
 
     def test_flat_note_normalization(self):
-        """Test flat note conversion to sharp."""
+        """Test flat roots are spelled with flats."""
         # Arrange & Act
         scale = Scale("Bb", "major")
 
         # Assert
-        assert scale.root == "A#"
-        expected = ["A#", "C", "D", "D#", "F", "G", "A"]
+        assert scale.root == "Bb"
+        assert scale.root_index == 10
+        expected = ["Bb", "C", "D", "Eb", "F", "G", "A"]
         assert scale.get_scale_notes() == expected
 
     def test_invalid_root_note(self):
@@ -78,6 +81,42 @@ class TestScale:
         with pytest.raises(ValueError, match="Unknown scale"):
             Scale("C", "invalid_scale")
 
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("Natural Minor", "minor"),
+            ("mixo", "mixolydian"),
+            ("harm min", "harmonic_minor"),
+            ("mixolidian", "mixolydian"),
+            ("pentatonic-minr", "pentatonic_minor"),
+        ],
+    )
+    def test_scale_aliases_and_typos(self, name, expected):
+        """Test aliases and misspelled names resolve to the scale."""
+        assert Scale("A", name).scale_name == expected
+
+    def test_unknown_scale_suggestions(self):
+        """Test the error suggests the scales a name could mean."""
+        with pytest.raises(ValueError, match=r"did you mean pentatonic_major, pent"):
+            Scale("C", "penta")
+
+    @pytest.mark.parametrize(
+        "root, expected",
+        [
+            ("C#", "C#"),
+            ("c#", "C#"),
+            ("Db", "Db"),
+            ("db", "Db"),
+            ("C sharp", "C#"),
+            ("D\u266d", "Db"),
+        ],
+    )
+    def test_note_spellings(self, root, expected):
+        """Test sharps, flats, words and Unicode accidentals."""
+        scale = Scale(root, "major")
+        assert scale.root == expected
+        assert scale.root_index == 1
+
     def test_get_available_scales(self):
         """Test getting available scale names."""
         # Arrange & Act
@@ -102,6 +141,51 @@ class TestScale:
         expected = [1, 2, 3, 4, 5, 6, 7]
         assert degrees == expected
 
+    def test_scale_mask(self):
+        """Test 12-bit pitch-class set of a scale."""
+        # Arrange & Act
+        scale = Scale("C", "pentatonic_major")
+
+        # Assert
+        assert scale.mask == 0b001010010101  # C, D, E, G, A
+
+    def test_membership(self):
+        """Test note membership by name and pitch class."""
+        # Arrange
+        scale = Scale("F", "major")
+
+        # Act & Assert
+        assert "Bb" in scale
+        assert "A#" in scale
+        assert 10 in scale
+        assert "B" not in scale
+        assert "X" not in scale
+
+    def test_transpose(self):
+        """Test transposition keeps the scale shape."""
+        # Arrange
+        scale = Scale("C", "major")
+
+        # Act
+        transposed = scale.transpose(7)
+
+        # Assert
+        assert transposed.root == "G"
+        assert transposed.get_scale_notes() == Scale("G", "major").get_scale_notes()
+        assert rotate_mask(scale.mask, 7) == transposed.mask
+
+    def test_relative_scales_share_notes(self):
+        """Test set equality and intersection between scales."""
+        # Arrange
+        c_major = Scale("C", "major")
+        a_minor = Scale("A", "minor")
+        g_major = Scale("G", "major")
+
+        # Act & Assert
+        assert c_major.has_same_notes(a_minor)
+        assert not c_major.has_same_notes(g_major)
+        assert c_major.intersection(g_major) == c_major.mask & ~(1 << 5)
+
 
 class TestGuitarFretboard:
     """Test cases for GuitarFretboard class."""
@@ -176,3 +260,119 @@ class TestGuitarFretboard:
         # Assert
         assert "E Blues Scale" in display
         assert "Frets 0-12" in display
+
+    def test_pitch_matrix_shared_per_tuning(self):
+        """Test that fretboards with the same tuning share one pitch matrix."""
+        # Arrange & Act
+        first = GuitarFretboard()
+        second = GuitarFretboard()
+
+        # Assert
+        assert first.matrix is second.matrix
+        assert first.matrix[0][:5] == (4, 5, 6, 7, 8)  # E, F, F#, G, G#
+
+    def test_display_scale_beyond_matrix_width(self):
+        """Test that frets past the prebuilt matrix width still render."""
+        # Arrange
+        scale = Scale("E", "major")
+        fretboard = GuitarFretboard()
+
+        # Act
+        display = fretboard.display_scale(scale, 24, 30)
+
+        # Assert
+        lines = display.split("\n")
+        assert lines[-1] == "  24 25 26 27 28 29 30 "
+        assert lines[2].startswith("E|")
+        assert "---" in lines[2]
+
+
+class TestInstruments:
+    """Test tunings, capos and wide fret ranges."""
+
+    @pytest.mark.parametrize(
+        "tuning, expected",
+        [
+            ("drop d", ["D", "A", "D", "G", "B", "E"]),
+            ("seven_string", ["B", "E", "A", "D", "G", "B", "E"]),
+            ("eight_string", ["F#", "B", "E", "A", "D", "G", "B", "E"]),
+            ("bass", ["E", "A", "D", "G"]),
+            ("C G D A e", ["C", "G", "D", "A", "E"]),
+            ("Eb,Ab,Db,Gb", ["Eb", "Ab", "Db", "Gb"]),
+        ],
+    )
+    def test_tunings(self, tuning, expected):
+        """Test tunings by name or as notes, low to high."""
+        assert GuitarFretboard(tuning).tuning == expected
+
+    def test_unknown_tuning(self):
+        """Test unknown tunings, and close misspellings of known ones."""
+        assert GuitarFretboard("barritone").tuning[0] == "B"
+        with pytest.raises(ValueError, match="Unknown tuning: banjo"):
+            GuitarFretboard("banjo")
+
+    def test_capo(self):
+        """Test a capo shifts every string and shares the matrix per capo."""
+        # Arrange & Act
+        capo = GuitarFretboard(capo=2)
+
+        # Assert
+        assert capo.matrix[0][:3] == (6, 7, 8)  # F#, G, G#
+        assert capo.matrix is GuitarFretboard(capo=2).matrix
+        assert capo.matrix is not GuitarFretboard().matrix
+        assert "Frets 0-5, Capo 2" in capo.display_scale(Scale("A", "major"), 0, 5)
+        with pytest.raises(ValueError, match="Capo must be on frets"):
+            GuitarFretboard(capo=-1)
+        with pytest.raises(ValueError, match="Capo must be on frets 0-24"):
+            GuitarFretboard(capo=25)
+
+    def test_eight_string_names_align(self):
+        """Test two-letter string names pad the others and the footer."""
+        # Arrange
+        fretboard = GuitarFretboard("eight_string")
+
+        # Act
+        display = fretboard.display_scale(Scale("E", "minor"), 0, 3, color=False)
+
+        # Assert
+        lines = display.split("\n")
+        assert [line[:3] for line in lines[2:10]] == [
+            "E |",
+            "B |",
+            "G |",
+            "D |",
+            "A |",
+            "E |",
+            "B |",
+            "F#|",
+        ]
+        assert lines[-1] == "    0  1  2  3 "
+
+    def test_bass_diagram(self):
+        """Test a four-string diagram."""
+        display = GuitarFretboard("bass").display_scale(Scale("G", "major"), 0, 3)
+        assert len(display.split("\n")) == 2 + 4 + 1
+
+    @pytest.mark.parametrize(
+        "start, end, page_frets, expected",
+        [
+            (0, 24, 0, [(0, 24)]),
+            (0, 36, 0, [(0, 12), (13, 25), (26, 36)]),
+            (5, 12, 4, [(5, 8), (9, 12)]),
+        ],
+    )
+    def test_fret_pages(self, start, end, page_frets, expected):
+        """Test only wide ranges are split unless a page size is given."""
+        assert fret_pages(start, end, page_frets) == expected
+
+    def test_cli_pages_wide_ranges(self):
+        """Test the CLI writes a wide range as separate diagrams."""
+        result = CliRunner().invoke(
+            app,
+            ["scale", "E", "minor", "-t", "seven_string", "-e", "36", "-o", "plain"],
+        )
+
+        assert result.exit_code == 0
+        assert result.output.count("E Minor Scale") == 3
+        assert "(Frets 26-36):" in result.output
+        assert "\n\nE Minor Scale (Frets 13-25):" in result.output
@@ -0,0 +1,264 @@
+"""Tests for the request protocol and the warm daemon."""
+
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from guitarra import server
+from guitarra.catalog import reload_catalog
+from guitarra.client import send_request
+from guitarra.protocol import HANDLERS, handle_request
+
+
+class TestHandleRequest:
+    """Test handle_request function."""
+
+    def test_scale_request(self):
+        """Test rendering a scale diagram."""
+        response = handle_request(
+            {"op": "scale", "root": "A", "scale": "blues", "color": False}
+        )
+
+        assert response["ok"]
+        assert response["output"].startswith("A Blues Scale (Frets 0-12):")
+
+    def test_blues_request(self):
+        """Test rendering a blues chart."""
+        response = handle_request({"op": "blues", "root": "A", "minor": True})
+
+        assert response["ok"]
+        assert response["title"] == "12 Bar Blues in A minor (i-iv-V):"
+        assert response["output"].startswith("|   Am |")
+
+    def test_identify_request(self):
+        """Test scale identification."""
+        response = handle_request(
+            {"op": "identify", "notes": ["C", "E", "G", "Bb"], "id": 7}
+        )
+
+        assert response["ok"]
+        assert response["id"] == 7
+        assert response["matches"][0] == ["C", "mixolydian"]
+
+    def test_invalid_requests(self):
+        """Test that errors are reported in the response."""
+        unknown = handle_request({"op": "nope"})
+        missing = handle_request({"op": "scale", "root": "C"})
+        bad_root = handle_request({"op": "scale", "root": "X", "scale": "major"})
+        too_wide = handle_request(
+            {"op": "scale", "root": "C", "scale": "major", "end": 40}
+        )
+
+        assert unknown == {"ok": False, "error": "Unknown operation: nope"}
+        assert missing["error"] == "Missing field: scale"
+        assert bad_root["error"] == "Invalid root note: X"
+        assert too_wide["error"] == "Fret range too large (max 36 frets)"
+
+    def test_errors_keep_request_id(self):
+        """Test error responses carry the id of their request."""
+        unknown = handle_request({"op": "nope", "id": 1})
+        missing = handle_request({"op": "scale", "root": "C", "id": 2})
+        not_object = handle_request(["op", "scale"])
+
+        assert unknown["id"] == 1
+        assert missing == {"ok": False, "error": "Missing field: scale", "id": 2}
+        assert not_object == {"ok": False, "error": "Request must be a JSON object"}
+
+    @pytest.mark.parametrize(
+        "request_fields, message",
+        [
+            ({"op": "scale", "root": 5, "scale": "major"}, "Field root must be"),
+            ({"op": "scale", "root": "C", "scale": ["major"]}, "Field scale must be"),
+            ({"op": "scale", "root": "C", "scale": "major", "start": 1e400}, "start"),
+            ({"op": "scale", "root": "C", "scale": "major", "end": "12"}, "end"),
+            ({"op": "scale", "root": "C", "scale": "major", "capo": 2.5}, "capo"),
+            ({"op": "scale", "root": "C", "scale": "major", "tuning": 6}, "tuning"),
+            ({"op": "blues", "root": "A", "form": 1}, "Field form must be"),
+            ({"op": "blues", "root": "A", "custom": ["I"]}, "Field custom must be"),
+            ({"op": "identify", "notes": "C E G"}, "Field notes must be"),
+            ({"op": "identify", "notes": ["C", 4]}, "Field notes must be"),
+        ],
+    )
+    def test_mistyped_fields(self, request_fields, message):
+        """Test wrongly typed fields are reported as errors of their request."""
+        response = handle_request(request_fields | {"id": 9})
+
+        assert not response["ok"]
+        assert message in response["error"]
+        assert response["id"] == 9
+
+    def test_handler_key_errors_are_not_missing_fields(self, monkeypatch):
+        """Test a KeyError inside a handler is not reported as a missing field."""
+
+        def broken(request):
+            return {}["lookup"]
+
+        monkeypatch.setitem(HANDLERS, "broken", broken)
+        response = handle_request({"op": "broken", "id": 3})
+
+        assert not response["ok"]
+        assert "Missing field" not in response["error"]
+        assert response["id"] == 3
+
+
+@pytest.fixture
+def daemon():
+    """Run the daemon on a temporary socket in a background thread."""
+    path = os.path.join(tempfile.mkdtemp(), "g.sock")
+    loop = asyncio.new_event_loop()
+    started = asyncio.Event()
+    task = loop.create_task(server.serve(path, started))
+
+    def run():
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(started.wait(), loop).result(timeout=5)
+    yield path
+    loop.call_soon_threadsafe(task.cancel)
+    thread.join(timeout=5)
+    loop.close()
+
+
+class TestDaemon:
+    """Test the Unix socket daemon."""
+
+    def test_round_trip(self, daemon):
+        """Test a request over the socket."""
+        response = send_request({"op": "ping"}, path=daemon)
+
+        assert response == {"ok": True, "output": "pong"}
+
+    def test_concurrent_clients(self, daemon):
+        """Test that several clients are served at once."""
+        results = []
+
+        def client(root):
+            response = send_request(
+                {"op": "blues", "root": root}, path=daemon, timeout=5
+            )
+            results.append(response["output"].split("|")[1].strip())
+
+        threads = [threading.Thread(target=client, args=(root,)) for root in "CDEFGAB"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(results) == sorted("CDEFGAB")
+
+    def test_invalid_lines_keep_connection(self, daemon):
+        """Test bad lines get error responses and later requests still work."""
+        lines = [
+            b"\xff\xfe\n",
+            b"[" * (server.LINE_LIMIT + 10) + b"\n",
+            b"[" * (server.LINE_LIMIT - 10) + b"\n",
+            b'{"op": "ping", "id": 1}\n',
+        ]
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(5)
+            sock.connect(daemon)
+            sock.sendall(b"".join(lines))
+            with sock.makefile("rb") as stream:
+                responses = [json.loads(stream.readline()) for _ in lines]
+
+        assert responses[0]["error"].startswith("Invalid JSON")
+        assert responses[1]["error"].startswith("Request line too long")
+        assert responses[2]["error"].startswith("Invalid JSON")
+        assert responses[3] == {"ok": True, "output": "pong", "id": 1}
+
+    def test_mistyped_field_keeps_connection(self, daemon):
+        """Test a mistyped request is answered and the connection stays open."""
+        requests = [
+            {"op": "scale", "root": 5, "scale": "major", "id": 1},
+            {"op": "scale", "root": "C", "scale": "major", "start": 1e400, "id": 2},
+            {"op": "ping", "id": 3},
+        ]
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(5)
+            sock.connect(daemon)
+            sock.sendall(b"".join(json.dumps(r).encode() + b"\n" for r in requests))
+            with sock.makefile("rb") as stream:
+                responses = [json.loads(stream.readline()) for _ in requests]
+
+        assert [r["id"] for r in responses] == [1, 2, 3]
+        assert [r["ok"] for r in responses] == [False, False, True]
+
+    def test_picks_up_catalog_edits(self, daemon, tmp_path, monkeypatch):
+        """Test a scale added to the catalog while the daemon runs is served."""
+        # Arrange
+        directory = tmp_path / "catalog"
+        directory.mkdir()
+        (directory / "shop.toml").write_text("[scales]\nhirajoshi = [0, 2, 3, 7, 8]\n")
+        monkeypatch.setenv("GUITARRA_CATALOG_DIR", str(directory))
+        monkeypatch.setenv("GUITARRA_CACHE_DIR", str(tmp_path / "cache"))
+        reload_catalog()
+        request = {"op": "scale", "root": "C", "scale": "kumoi", "color": False}
+        before = send_request(request, path=daemon)
+
+        # Act
+        with open(directory / "shop.toml", "a") as f:
+            f.write("kumoi = [0, 2, 3, 7, 9]\n")
+        after = send_request(request, path=daemon)
+        monkeypatch.undo()
+        reload_catalog()
+
+        # Assert
+        assert before["error"] == "Unknown scale: kumoi"
+        assert after["ok"]
+        assert after["output"].startswith("C Kumoi Scale")
+
+    def test_refuses_live_socket(self, daemon):
+        """Test a second daemon does not take over a live socket."""
+        with pytest.raises(FileExistsError, match="already serving"):
+            asyncio.run(server.serve(daemon))
+
+        assert send_request({"op": "ping"}, path=daemon)["ok"]
+
+    def test_replaces_stale_socket(self):
+        """Test a socket file nobody answers on is replaced."""
+        path = os.path.join(tempfile.mkdtemp(), "g.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(path)
+        assert not server.is_serving(path)
+
+        async def run():
+            started = asyncio.Event()
+            task = asyncio.ensure_future(server.serve(path, started))
+            await started.wait()
+            assert server.is_serving(path)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+    def test_no_daemon(self):
+        """Test that a missing socket means no daemon."""
+        assert send_request({"op": "ping"}, path="/nonexistent/g.sock") is None
+
+    def test_socket_removed_on_shutdown(self):
+        """Test that the socket file is cleaned up when the server stops."""
+        path = os.path.join(tempfile.mkdtemp(), "g.sock")
+
+        async def run():
+            started = asyncio.Event()
+            task = asyncio.ensure_future(server.serve(path, started))
+            await started.wait()
+            assert os.path.exists(path)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        assert not os.path.exists(path)
@@ -0,0 +1,187 @@
+"""Tests for the metronome session scheduler."""
+
+import threading
+
+import pytest
+
+from guitarra.session import ClickPlayer, MetronomeSession
+
+
+class FakeClock:
+    """Clock that only moves when the session sleeps, plus `latency` per wake-up."""
+
+    def __init__(self, latency: float = 0.0):
+        self.now = 100.0
+        self.latency = latency
+        self.session: MetronomeSession | None = None
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> bool:
+        self.now += seconds + self.latency
+        return self.session is not None and self.session._stop.is_set()
+
+
+def fake_session(
+    bpm: float | None, latency: float = 0.0
+) -> tuple[MetronomeSession, FakeClock]:
+    """Create a session driven by a fake clock."""
+    clock = FakeClock(latency)
+    session = MetronomeSession(bpm, clock=clock, sleep=clock.sleep)
+    clock.session = session
+    return session, clock
+
+
+class TestMetronomeSession:
+    """Test MetronomeSession class."""
+
+    def test_beats_follow_absolute_deadlines(self):
+        """Test every deadline in the duration is a beat, on time."""
+        # Arrange
+        session, _ = fake_session(bpm=6000)  # 10 ms per beat
+        beats = []
+
+        # Act
+        stats = session.run(duration=0.1, on_beat=beats.append)
+
+        # Assert
+        assert beats == list(range(1, 11))
+        assert stats.beats == 10
+        assert stats.missed_beats == 0
+        assert stats.max_jitter_ms == pytest.approx(0)
+        assert stats.elapsed_s == pytest.approx(0.1)
+
+    def test_lateness_is_measured_not_accumulated(self):
+        """Test late wake-ups show as jitter without shifting later beats."""
+        # Arrange
+        session, _ = fake_session(bpm=6000, latency=0.002)
+
+        # Act
+        stats = session.run(duration=0.1)
+
+        # Assert
+        assert stats.beats == 10
+        assert stats.mean_jitter_ms == pytest.approx(2)
+        assert stats.stdev_jitter_ms == pytest.approx(0, abs=1e-6)
+        assert stats.drift_ms_per_min == pytest.approx(0, abs=1e-6)
+
+    def test_late_beats_are_skipped_not_bunched(self):
+        """Test that a stalled callback skips missed deadlines."""
+        # Arrange
+        session, clock = fake_session(bpm=6000)
+
+        def on_beat(beat):
+            if beat == 1:
+                clock.now += 0.035
+
+        # Act
+        stats = session.run(duration=0.1, on_beat=on_beat)
+
+        # Assert
+        assert stats.missed_beats == 3
+        assert stats.beats == 7
+
+    def test_schedule(self):
+        """Test a session with a schedule ends after its last beat."""
+        session, _ = fake_session(bpm=None)
+        beats = []
+
+        stats = session.run(on_beat=beats.append, schedule=[0.0, 0.5, 0.75])
+
+        assert beats == [0, 1, 2]
+        assert stats.elapsed_s == pytest.approx(0.75)
+
+    def test_stop(self):
+        """Test that stop() ends a session without a duration."""
+        # Arrange
+        session, _ = fake_session(bpm=60)
+
+        def on_beat(beat):
+            if beat == 3:
+                session.stop()
+
+        # Act
+        stats = session.run(on_beat=on_beat)
+
+        # Assert
+        assert stats.beats == 3
+
+    def test_stop_from_another_thread(self):
+        """Test that stop() wakes a session waiting on the real clock."""
+        # Arrange
+        session = MetronomeSession(bpm=6)
+        timer = threading.Timer(0.05, session.stop)
+
+        # Act
+        timer.start()
+        stats = session.run()
+
+        # Assert
+        assert stats.beats == 0
+        assert stats.elapsed_s < 5
+
+    def test_stats_format(self):
+        """Test the text report."""
+        # Arrange
+        session, _ = fake_session(bpm=6000)
+
+        # Act
+        report = session.run(duration=0.05).format()
+
+        # Assert
+        assert report.startswith("Beats: 5 (0 missed)")
+        assert "Wake-up jitter: mean" in report
+        assert "ms/min" in report
+
+    def test_invalid_bpm(self):
+        """Test error handling for non-positive BPM."""
+        with pytest.raises(ValueError, match="BPM must be positive"):
+            MetronomeSession(bpm=0)
+
+
+class TestClickPlayer:
+    """Test ClickPlayer class."""
+
+    def test_clicks_sound_on_one_worker(self):
+        """Test queued clicks are played in order on a single thread."""
+        # Arrange
+        played = []
+
+        def beep(frequency):
+            played.append((frequency, threading.get_ident()))
+
+        player = ClickPlayer(beep, {"accent": 880.0, "regular": 440.0})
+
+        # Act
+        player("accent")
+        player.close()
+
+        # Assert
+        assert played == [(880.0, played[0][1])]
+        assert played[0][1] != threading.get_ident()
+
+    def test_stale_clicks_are_dropped(self):
+        """Test a slow beep skips to the newest waiting click."""
+        # Arrange
+        release = threading.Event()
+        played = []
+
+        def beep(frequency):
+            played.append(frequency)
+            release.wait(5)
+
+        player = ClickPlayer(beep, {"accent": 880.0, "regular": 440.0})
+
+        # Act
+        player("accent")
+        while not played:
+            threading.Event().wait(0.001)
+        player("regular")
+        player("regular")
+        player("accent")
+        release.set()
+        player.close()
+
+        # Assert
+        assert played == [880.0, 880.0]
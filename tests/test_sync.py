@@ -0,0 +1,251 @@
+"""Tests for the synchronized multi-client metronome."""
+
+import json
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from guitarra.patterns import standard_pattern
+from guitarra.sync import (
+    SyncClient,
+    SyncServer,
+    check_report,
+    combine_samples,
+    next_cycle_start,
+    parse_address,
+    play_synced,
+)
+
+TIMELINE = {"bpm": 240, "beats": 4, "subdivisions": "quarter", "pattern": None}
+
+# Client process printing the server-clock time of each click as JSON
+CLIENT_SCRIPT = textwrap.dedent(
+    """
+    import json, sys
+    from guitarra.sync import SyncClient, play_synced
+
+    client = SyncClient("127.0.0.1", int(sys.argv[1]))
+    times = []
+    play_synced(client, lambda level: times.append(client.server_time()), 1.5)
+    print(json.dumps(times))
+    """
+)
+
+
+@pytest.fixture
+def server():
+    """Serve a fast metronome timeline on a free localhost port."""
+    sync_server = SyncServer(
+        dict(TIMELINE, start=time.monotonic() + 0.3), "127.0.0.1", 0
+    )
+    sync_server.start()
+    yield sync_server
+    sync_server.close()
+
+
+class TestClockEstimate:
+    """Test offset estimation helpers."""
+
+    def test_fastest_round_trips_win(self):
+        """Test that slow, queued round trips do not skew the offset."""
+        # Arrange
+        samples = [(0.010, 0.001)] * 4 + [(0.050, 0.080)] * 12
+
+        # Act
+        estimate = combine_samples(samples)
+
+        # Assert
+        assert estimate.offset_s == 0.010
+        assert estimate.delay_s == 0.001
+        assert estimate.jitter_s == 0
+        assert estimate.samples == 16
+
+    def test_parse_address(self):
+        """Test host and optional port parsing."""
+        assert parse_address("192.168.1.5:5000") == ("192.168.1.5", 5000)
+        assert parse_address("rehearsal.local", 47801) == ("rehearsal.local", 47801)
+        with pytest.raises(ValueError, match="Invalid address"):
+            parse_address("host:port")
+
+
+class TestSyncClient:
+    """Test SyncClient against a localhost server."""
+
+    def test_offset_of_shifted_server_clock(self):
+        """Test that a server clock 5 s ahead is measured within 1 ms."""
+        # Arrange
+        server = SyncServer(
+            TIMELINE, "127.0.0.1", 0, clock=lambda: time.monotonic() + 5.0
+        )
+        server.start()
+        client = SyncClient(*server.address)
+
+        # Act
+        try:
+            estimate = client.sync()
+        finally:
+            client.close()
+            server.close()
+
+        # Assert
+        assert estimate.offset_s == pytest.approx(5.0, abs=1e-3)
+        assert client.server_time() == pytest.approx(time.monotonic() + 5.0, abs=1e-3)
+
+    def test_join_reports_to_server(self, server):
+        """Test that joining returns the timeline and reports reach the server."""
+        # Arrange
+        reports = []
+        server.on_report = lambda address, report: reports.append(report)
+        client = SyncClient(*server.address)
+
+        # Act
+        client.sync(samples=4)
+        timeline = client.join()
+        client.report()
+        time.sleep(0.1)
+        client.close()
+
+        # Assert
+        assert timeline["bpm"] == 240
+        assert timeline["start"] == server.timeline["start"]
+        assert len(server.clients) == 1
+        assert "offset_ms" in reports[0] and "jitter_ms" in reports[0]
+
+    def test_bad_datagrams_are_dropped(self, server):
+        """Test malformed datagrams and reports never stop the server."""
+        # Arrange
+        reports = []
+        server.on_report = lambda address, report: reports.append(report)
+        datagrams = [
+            b"\xff",
+            b"[1, 2]",
+            b'{"op": "report", "offset_ms": "x"}',
+            b'{"op": "report", "beats": 4.5}',
+            b'{"op": "report", "beats": 8, "extra": [1]}',
+        ]
+
+        # Act
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            for datagram in datagrams:
+                sock.sendto(datagram, server.address)
+        time.sleep(0.1)
+        client = SyncClient(*server.address)
+        estimate = client.sync(samples=2)
+        client.close()
+
+        # Assert
+        assert estimate.samples == 2
+        assert server.dropped == 4
+        assert reports == [{"beats": 8}]
+
+    def test_failing_report_callback_keeps_serving(self, server):
+        """Test an exception in the report callback drops only that report."""
+        server.on_report = lambda address, report: 1 / 0
+        client = SyncClient(*server.address)
+
+        client.report(beats=1)
+        time.sleep(0.1)
+        timeline = client.join()
+        client.close()
+
+        assert timeline["bpm"] == 240
+        assert server.dropped == 1
+
+    def test_client_ignores_malformed_replies(self):
+        """Test stray datagrams are skipped while waiting for a reply."""
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as fake:
+            fake.bind(("127.0.0.1", 0))
+            client = SyncClient(*fake.getsockname(), timeout=2)
+            client._socket.send(b"{}")
+            _, address = fake.recvfrom(2048)
+            for datagram in (b"\xff", b"[]", b'{"op": "timeline", "bpm": 90}'):
+                fake.sendto(datagram, address)
+
+            assert client._request({"op": "join"}, "timeline")["bpm"] == 90
+            client.close()
+
+    def test_check_report(self):
+        """Test report fields are type-checked."""
+        assert check_report({"beats": 3, "offset_ms": 1}) == {
+            "beats": 3,
+            "offset_ms": 1.0,
+        }
+        assert check_report({"offset_ms": float("nan")}) is None
+        assert check_report({"missed_beats": True}) is None
+
+    def test_listens_on_localhost_by_default(self):
+        """Test the server is not reachable from other machines unless asked."""
+        server = SyncServer(TIMELINE, port=0)
+        assert server.address[0] == "127.0.0.1"
+        server.close()
+
+    def test_no_server(self):
+        """Test error when nothing answers."""
+        client = SyncClient("127.0.0.1", 9, timeout=0.1)
+        with pytest.raises(ConnectionError):
+            client.sync()
+        client.close()
+
+    def test_late_joiner_starts_on_next_bar(self):
+        """Test that a client joining mid-timeline waits for the next cycle."""
+        # Arrange
+        timeline = dict(TIMELINE, start=100.0)  # 1 s bars at 240 BPM
+        pattern = standard_pattern(4)
+
+        # Act & Assert
+        assert next_cycle_start(timeline, pattern, 99.0) == 100.0
+        assert next_cycle_start(timeline, pattern, 103.2) == 104.0
+
+
+class TestPlaySynced:
+    """Test clients clicking together."""
+
+    def test_clicks_follow_server_timeline(self, server):
+        """Test that clicks land on the server's beat grid."""
+        # Arrange
+        client = SyncClient(*server.address)
+        times = []
+
+        # Act
+        stats = play_synced(
+            client, lambda level: times.append(client.server_time()), 0.8
+        )
+        client.close()
+
+        # Assert
+        start = server.timeline["start"]
+        assert stats.beats == len(times) >= 3
+        for index, click_time in enumerate(times):
+            assert click_time - (start + index * 0.25) == pytest.approx(0, abs=0.01)
+
+    def test_several_processes_agree(self, server):
+        """Test that separate client processes click at the same moments."""
+        # Arrange
+        port = str(server.address[1])
+
+        # Act
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-c", CLIENT_SCRIPT, port],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            for _ in range(3)
+        ]
+        results = [
+            json.loads(process.communicate(timeout=10)[0]) for process in processes
+        ]
+
+        # Assert
+        start = server.timeline["start"]
+        for times in results:
+            assert len(times) >= 3
+            # Each process joins at the first bar still ahead of it
+            first = round((times[0] - start) / 1.0)
+            for index, click_time in enumerate(times):
+                expected = start + first + index * 0.25
+                assert click_time == pytest.approx(expected, abs=0.01)
@@ -0,0 +1,129 @@
+"""Tests for the voice-leading optimizer."""
+
+import itertools
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra.cli import app
+from guitarra.progressions import get_form
+from guitarra.voiceleading import (
+    lead_voices,
+    movement,
+    voice_progression,
+)
+from guitarra.voicings import Voicing, chord_voicings
+
+
+def _cost(voicings):
+    """Total movement plus playability of one choice of voicings."""
+    return sum(voicing.score for voicing in voicings) + sum(
+        movement(a, b) for a, b in itertools.pairwise(voicings)
+    )
+
+
+class TestMovement:
+    """Test movement function."""
+
+    def test_same_voicing_is_free(self):
+        """Test that staying on a voicing costs nothing."""
+        voicing = Voicing((None, 0, 2, 0, 2, 0), 0)
+        assert movement(voicing, voicing) == 0
+
+    def test_shift_and_finger_changes(self):
+        """Test fret travel, placed fingers and the hand shift."""
+        # Arrange
+        open_a7 = Voicing((None, 0, 2, 0, 2, 0), 0)
+        barre_a7 = Voicing((5, 7, 5, 6, 5, 5), 0)
+
+        # Act & Assert
+        # Low E unmuted, A placed, D 2->5, G placed, B 2->5, high E placed,
+        # plus a shift from fret 2 to fret 5
+        assert movement(open_a7, barre_a7) == 1 + 1 + 3 + 1 + 3 + 1 + 3
+
+
+class TestLeadVoices:
+    """Test lead_voices function."""
+
+    def test_matches_brute_force(self):
+        """Test that the optimum equals exhaustive search on a short form."""
+        # Arrange
+        chords = ["A7", "D7", "A7", "E7", "D7", "A7"]
+        candidates = {chord: chord_voicings(chord)[:6] for chord in set(chords)}
+
+        # Act
+        leading = lead_voices(chords, candidates)
+
+        # Assert
+        best = min(
+            _cost(choice)
+            for choice in itertools.product(*(candidates[c] for c in chords))
+        )
+        assert _cost(leading.voicings) == pytest.approx(best)
+        assert leading.movement == sum(
+            movement(a, b) for a, b in itertools.pairwise(leading.voicings)
+        )
+
+    def test_repeated_chord_keeps_voicing(self):
+        """Test that a chord held over several bars is not re-voiced."""
+        # Arrange
+        chords = ["A7"] * 4 + ["D7"] * 4
+
+        # Act
+        leading = lead_voices(chords, {c: chord_voicings(c)[:10] for c in chords})
+
+        # Assert
+        assert len(set(leading.voicings[:4])) == 1
+        assert len(set(leading.voicings[4:])) == 1
+
+    def test_missing_candidates(self):
+        """Test error when a chord has no voicing to choose from."""
+        with pytest.raises(ValueError, match="No playable voicing for A7"):
+            lead_voices(["A7"], {"A7": []})
+
+    def test_hundreds_of_bars(self):
+        """Test that a long form with many candidates is solved quickly."""
+        # Arrange
+        bars = get_form("jazz").in_key(9) * 40
+
+        # Act
+        start = time.perf_counter()
+        leading = voice_progression(bars, candidates=40)
+        elapsed = time.perf_counter() - start
+
+        # Assert
+        assert len(leading.voicings) == 15 * 40
+        assert elapsed < 2.0
+
+
+class TestVoicingsOption:
+    """Test the blues --voicings option."""
+
+    def test_voiced_chart(self):
+        """Test a voicing under every chord of the chart."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["blues", "A", "--form", "jazz", "--voicings"])
+
+        assert result.exit_code == 0
+        assert "Voicings (finger movement " in result.stdout
+        assert "| Em7 A7 |" in result.stdout
+
+    def test_candidates_must_be_positive(self):
+        """Test --candidates below 1 is rejected rather than slicing from the end."""
+        result = CliRunner().invoke(
+            app, ["blues", "A", "--voicings", "--candidates", "0"]
+        )
+
+        assert result.exit_code != 0
+        assert "Voicings (" not in result.output
+        with pytest.raises(ValueError, match="at least 1"):
+            voice_progression(["A7"], candidates=-1)
+
+    def test_voicings_need_text_format(self):
+        """Test --voicings with a non-text format is an error, not ignored."""
+        result = CliRunner().invoke(app, ["blues", "A", "--voicings", "-o", "json"])
+
+        assert "Error: --voicings is only shown in text formats" in result.output
+        assert "Valid notes" not in result.output
@@ -0,0 +1,165 @@
+"""Tests for the chord-voicing enumerator."""
+
+import pytest
+from typer.testing import CliRunner
+
+from guitarra.cache import render_cache
+from guitarra.cli import app
+from guitarra.diskcache import disk_render_cache
+from guitarra.scales import note_index
+from guitarra.voicings import (
+    Voicing,
+    _fingers,
+    chord_voicings,
+    find_voicings,
+    format_voicings,
+    parse_chord,
+)
+
+STANDARD = ["E", "A", "D", "G", "B", "E"]
+
+
+def _notes(voicing: Voicing) -> list[int]:
+    """Pitch classes of the sounding strings, low to high."""
+    return [
+        (note_index(open_note) + fret) % 12
+        for open_note, fret in zip(STANDARD, voicing.frets)
+        if fret is not None
+    ]
+
+
+class TestParseChord:
+    """Test parse_chord function."""
+
+    @pytest.mark.parametrize(
+        "symbol, expected",
+        [("A7", (9, "7")), ("Bbmaj7", (10, "maj7")), ("F#m7b5", (6, "m7b5"))],
+    )
+    def test_symbols(self, symbol, expected):
+        """Test roots with accidentals and chord qualities."""
+        assert parse_chord(symbol) == expected
+
+    def test_unknown_quality(self):
+        """Test error for an unknown chord quality."""
+        with pytest.raises(ValueError, match="Unknown chord quality"):
+            parse_chord("Cwhatever")
+
+
+class TestFindVoicings:
+    """Test find_voicings function."""
+
+    def test_common_shapes_found(self):
+        """Test that the familiar open and barre shapes are enumerated."""
+        # Arrange & Act
+        shapes = {voicing.format() for voicing in find_voicings(9, "7")}
+
+        # Assert
+        assert {"x02020", "575655", "x02223"} <= shapes
+
+    def test_rules_hold_for_every_voicing(self):
+        """Test root in the bass, every required tone, and the hand span."""
+        # Arrange & Act
+        voicings = find_voicings(7, "7")  # G7: G B D F, fifth optional
+
+        # Assert
+        assert voicings
+        for voicing in voicings:
+            notes = _notes(voicing)
+            assert notes[0] == 7
+            assert {7, 11, 5} <= set(notes) <= {7, 11, 2, 5}
+            fretted = [fret for fret in voicing.frets if fret]
+            assert not fretted or max(fretted) - min(fretted) < 4
+
+    def test_ranked_easiest_first(self):
+        """Test that scores never decrease down the list."""
+        scores = [voicing.score for voicing in find_voicings(0, "")]
+        assert scores == sorted(scores)
+
+    def test_no_open_strings(self):
+        """Test that open strings can be excluded."""
+        voicings = find_voicings(4, "", allow_open=False)
+        assert voicings
+        assert all(0 not in voicing.frets for voicing in voicings)
+
+    def test_barre_cannot_skip_open_string(self):
+        """Test finger counting with a barre at the lowest fret."""
+        # A full barre counts as one finger
+        assert _fingers((5, 7, 5, 6, 5, 5), 5) == 3
+        # An open string between notes at the lowest fret breaks the barre
+        assert _fingers((None, 0, 2, 0, 2, 0), 2) == 2
+
+
+class TestChordVoicings:
+    """Test cached chord_voicings function."""
+
+    def test_persistent_cache(self, tmp_path):
+        """Test that results are written to and read from the disk cache."""
+        # Arrange
+        with disk_render_cache(tmp_path):
+            first = chord_voicings("A7", max_fret=11)
+        render_cache.clear()
+
+        # Act
+        with disk_render_cache(tmp_path):
+            second = chord_voicings("A7", max_fret=11)
+
+        # Assert
+        assert first == second == find_voicings(9, "7", max_fret=11)
+        assert render_cache.stats()["misses"] >= 1
+        assert list(tmp_path.iterdir())
+
+
+class TestChordCommands:
+    """Test the chord and voicings commands."""
+
+    def test_chord_command(self):
+        """Test listing the easiest voicings of a chord."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["chord", "A7", "-n", "3"])
+
+        assert result.exit_code == 0
+        assert result.stdout.startswith("A7 (A C# E G): ")
+        assert len(result.stdout.strip().split("\n")) == 4
+
+    def test_voicings_command(self):
+        """Test voicings for every chord of a progression."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["voicings", "E", "-n", "1"])
+
+        assert result.exit_code == 0
+        assert "12 Bar Blues in E major" in result.stdout
+        for chord in ("E (", "A (", "B ("):
+            assert chord in result.stdout
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["chord", "A7", "--limit", "-3"],
+            ["chord", "A7", "--span", "0"],
+            ["voicings", "E", "-n", "-1"],
+            ["voicings", "E", "--span", "0"],
+        ],
+    )
+    def test_out_of_range_options(self, args):
+        """Test a negative limit or empty span is rejected, not misapplied."""
+        result = CliRunner().invoke(app, args)
+
+        assert result.exit_code != 0
+        assert "voicings" not in result.stdout
+
+    def test_out_of_range_arguments(self):
+        """Test the library rejects the same values as the options."""
+        with pytest.raises(ValueError, match="must not be negative"):
+            format_voicings("A7", [], limit=-1)
+        with pytest.raises(ValueError, match="at least 1 fret"):
+            chord_voicings("A7", max_span=0)
+
+    def test_invalid_chord(self):
+        """Test error message for an invalid chord."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["chord", "H7"])
+
+        assert "Invalid chord: H7" in result.stderr